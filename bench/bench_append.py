@@ -0,0 +1,51 @@
+"""신규 UPC 추가(append_row) 처리량 벤치마크
+
+    python bench/bench_append.py
+
+RowStore 기반 append_row 와 기존 `df.loc[len(df)] = row` 방식을 비교한다.
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import pandas as pd
+from PyQt6.QtCore import QCoreApplication
+
+from model.dataframe_model import DataFrameModel
+from model.store import make_empty_df
+
+SIZES = [1_000, 10_000, 100_000]
+LEGACY_MAX = 10_000   # df.loc 방식은 O(N²)이라 큰 N은 생략
+
+
+def bench_model(n: int) -> float:
+    model = DataFrameModel(make_empty_df())
+    t0 = time.perf_counter()
+    for i in range(n):
+        model.append_row(f"UPC{i:010d}")
+    return time.perf_counter() - t0
+
+
+def bench_legacy(n: int) -> float:
+    df = make_empty_df()
+    now = pd.Timestamp.now()
+    t0 = time.perf_counter()
+    for i in range(n):
+        df.loc[len(df)] = {"UPC": f"UPC{i:010d}", "Qty": 0, "LastScannedAt": now}
+    return time.perf_counter() - t0
+
+
+def main():
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv)  # noqa: F841
+    print(f"{'rows':>8} {'store µs/row':>14} {'df.loc µs/row':>14}")
+    for n in SIZES:
+        store = bench_model(n) / n * 1e6
+        legacy = f"{bench_legacy(n) / n * 1e6:14.1f}" if n <= LEGACY_MAX else f"{'-':>14}"
+        print(f"{n:>8} {store:>14.1f} {legacy}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""자동 저장 체크포인트 비용 벤치마크
+
+    python bench/bench_autosave.py
+
+표 크기(10k ~ 1M행)와 관계없이 바뀐 행 수에만 비례해야 한다.
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import numpy as np
+
+from model import checkpoint
+from model.journal import base_stat
+
+SIZES = [10_000, 100_000, 1_000_000]
+DIRTY = [10, 1_000]
+
+
+def main():
+    print(f"{'rows':>9} {'dirty':>6} {'ms/autosave':>12}")
+    rng = np.random.default_rng(0)
+    for n in SIZES:
+        for k in DIRTY:
+            with tempfile.TemporaryDirectory() as tmp:
+                path = os.path.join(tmp, "bench.autosave.sqlite")
+                stat = base_stat(None)
+                times = []
+                for _ in range(5):
+                    rows = np.sort(rng.choice(n, size=k, replace=False))
+                    upc = [f"UPC{r:010d}" for r in rows]
+                    t0 = time.perf_counter()
+                    checkpoint.write_rows(path, stat, 0, n, rows, upc, rows % 50, rows)
+                    times.append(time.perf_counter() - t0)
+            print(f"{n:>9} {k:>6} {np.median(times) * 1e3:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""스캐너 연사(burst) 입력 측정: 5 ms/글자로 키 이벤트를 넣어 스캔당 CPU와 누락률 비교
+
+    python bench/bench_burst.py [스캔 수] [글자 간격 ms] [미리 채울 행 수]
+                                (기본: 100 5 10000)
+
+다른 스레드가 13자리 UPC + Enter를 QKeyEvent로 postEvent한다 (실제 스캐너처럼
+이벤트 큐에 쌓임). 연사 감지 켬(BURST_GAP_MS)/끔(0) 각각에 대해 GUI 스레드 CPU 시간,
+입력 버퍼 위젯 갱신 횟수, 기대한 스캔과 실제 반영된 토큰의 글자 차이(누락률)를 출력한다.
+"""
+import os
+import sys
+import tempfile
+import threading
+import time
+from itertools import zip_longest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import numpy as np
+from PyQt6.QtCore import QCoreApplication, QEvent, QEventLoop, Qt, QTimer
+from PyQt6.QtGui import QKeyEvent
+from PyQt6.QtWidgets import QApplication
+
+from model.store import RowStore
+from ui_main import MainWindow
+
+
+def key_events(scans: list[str]) -> list[QKeyEvent]:
+    """GUI 스레드에서 미리 만든다 (QKeyEvent가 입력 장치 QObject를 만들 수 있음)"""
+    events = []
+    for upc in scans:
+        for ch in upc:
+            events.append(QKeyEvent(QEvent.Type.KeyPress, Qt.Key.Key_0 + int(ch), Qt.KeyboardModifier.NoModifier, ch))
+        events.append(QKeyEvent(QEvent.Type.KeyPress, Qt.Key.Key_Return, Qt.KeyboardModifier.NoModifier, "\r"))
+    return events
+
+
+def inject(target, events: list[QKeyEvent], gap: float):
+    """gap초 간격으로 키 이벤트를 GUI 스레드 큐에 넣는다"""
+    nxt = time.perf_counter()
+    for ev in events:
+        QCoreApplication.postEvent(target, ev)
+        nxt += gap
+        time.sleep(max(0.0, nxt - time.perf_counter()))
+
+
+def run(app, n_scans: int, gap_ms: float, prefill: int, burst_gap_ms: float, tmp: str) -> dict:
+    w = MainWindow(journal_path=os.path.join(tmp, f"burst_{burst_gap_ms}.journal"))
+    w.buffer.burst_gap = burst_gap_ms / 1000
+    if prefill:
+        upc = np.array([f"P{i:012d}" for i in range(prefill)], dtype=object)
+        w.model.set_store(RowStore.from_columns(upc, np.ones(prefill, dtype=np.int64),
+                                                np.zeros(prefill, dtype=np.int64)))
+    w.show()
+    app.processEvents()
+
+    rng = np.random.default_rng(0)
+    scans = [f"{x:013d}" for x in rng.integers(10**12, 10**13, n_scans)]
+    got: list[str] = []
+    apply_scan = w._apply_scan
+    w._apply_scan = lambda raw: (got.append(raw), apply_scan(raw))
+    updates = [0]
+    w.buffer_display.textChanged.connect(lambda _: updates.__setitem__(0, updates[0] + 1))
+
+    t = threading.Thread(target=inject, args=(w, key_events(scans), gap_ms / 1000))
+    cpu0, wall0 = time.thread_time(), time.perf_counter()
+    t.start()
+    # 주입이 끝나고 모든 스캔이 반영될 때까지 (누락으로 모자라면 1초 더) GUI 스레드에서 기다린다
+    done_at = []
+
+    def poll():
+        if t.is_alive():
+            return
+        done_at.append(time.perf_counter())
+        if len(got) >= n_scans or done_at[-1] - done_at[0] > 1.0:
+            loop.quit()
+
+    timer = QTimer()
+    timer.timeout.connect(poll)
+    timer.start(20)
+    loop = QEventLoop()   # app.quit()는 창을 닫으려 하므로 지역 루프 사용
+    loop.exec()
+    timer.stop()
+    t.join()
+    app.processEvents()
+    cpu = time.thread_time() - cpu0
+    wall = time.perf_counter() - wall0
+
+    chars = sum(len(s) + 1 for s in scans)
+    wrong = sum(a != b for exp, raw in zip_longest(scans, got, fillvalue="")
+                for a, b in zip_longest(exp, raw))
+    result = {
+        "cpu_ms_per_scan": cpu / n_scans * 1000,
+        "wall_s": wall,
+        "display_updates_per_scan": updates[0] / n_scans,
+        "scans_applied": len(got),
+        "missed_key_rate": wrong / chars,
+    }
+    w.is_dirty = False
+    w.close()
+    w.deleteLater()
+    app.processEvents()
+    return result
+
+
+def main(n_scans: int, gap_ms: float, prefill: int):
+    app = QApplication.instance() or QApplication(sys.argv)
+    print(f"scans={n_scans} gap={gap_ms} ms prefill={prefill:,} rows")
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, burst in (("burst on ", MainWindow.BURST_GAP_MS), ("burst off", 0)):
+            r = run(app, n_scans, gap_ms, prefill, burst, tmp)
+            print(f"{label}  CPU {r['cpu_ms_per_scan']:6.3f} ms/scan  "
+                  f"display {r['display_updates_per_scan']:5.2f}/scan  "
+                  f"applied {r['scans_applied']}/{n_scans}  missed {r['missed_key_rate']:.2%}")
+
+
+if __name__ == "__main__":
+    args = [float(a) for a in sys.argv[1:]]
+    defaults = [100, 5, 10_000]
+    n, gap, prefill = args + defaults[len(args):]
+    main(int(n), gap, int(prefill))
@@ -0,0 +1,73 @@
+"""DataFrameModel.data() 벤치마크: 화면 한 장(viewport) 다시 그리기
+
+    python bench/bench_data_paint.py [행수]      (기본: 1000000)
+
+보이는 셀 전체에 대해 Qt가 요청하는 역할(role)들로 data()를 호출해
+초당 호출 수와 viewport 한 번 그리는 시간을 잰다.
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import numpy as np
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QApplication, QTableView
+
+from model.dataframe_model import DataFrameModel
+from model.store import RowStore, make_empty_df
+
+VISIBLE_ROWS = 40
+REPAINTS = 2_000
+# QTableView가 셀 하나를 그릴 때 묻는 역할들
+ROLES = [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.DecorationRole, Qt.ItemDataRole.FontRole,
+         Qt.ItemDataRole.TextAlignmentRole, Qt.ItemDataRole.ForegroundRole,
+         Qt.ItemDataRole.BackgroundRole, Qt.ItemDataRole.CheckStateRole]
+
+
+def make_model(n: int) -> DataFrameModel:
+    model = DataFrameModel(make_empty_df())
+    upc = np.array([f"UPC{i:010d}" for i in range(n)], dtype=object)
+    ts = np.datetime64("2024-01-01", "ns").astype(np.int64) + np.arange(n, dtype=np.int64) * 10**9
+    model.set_store(RowStore.from_columns(upc, np.arange(n, dtype=np.int64) % 50, ts))
+    return model
+
+
+def main(n: int):
+    app = QApplication.instance() or QApplication(sys.argv)
+    model = make_model(n)
+    top = n // 2
+    indexes = [model.index(r, c) for r in range(top, top + VISIBLE_ROWS) for c in range(3)]
+
+    def viewport():
+        for idx in indexes:
+            for role in ROLES:
+                model.data(idx, role)
+
+    t0 = time.perf_counter()
+    for i in range(REPAINTS):
+        if i % 10 == 0:
+            model.add_qty(top + i % VISIBLE_ROWS, 1)   # 스캔으로 한 행씩 무효화
+        viewport()
+    elapsed = time.perf_counter() - t0
+    calls = REPAINTS * len(indexes) * len(ROLES)
+    print(f"data() calls/s        {calls / elapsed:,.0f}")
+    print(f"viewport (model only) {elapsed / REPAINTS * 1e6:,.1f} µs")
+
+    view = QTableView()
+    view.setModel(model)
+    view.resize(900, 40 * 30)
+    view.show()
+    view.scrollTo(model.index(top, 0))
+    app.processEvents()
+    t0 = time.perf_counter()
+    for i in range(200):
+        model.add_qty(top + i % VISIBLE_ROWS, 1)
+        view.viewport().repaint()
+    print(f"viewport repaint      {(time.perf_counter() - t0) / 200 * 1e3:,.2f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
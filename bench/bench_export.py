@@ -0,0 +1,64 @@
+"""Excel export 벤치마크: write_only 스트리밍 export_excel vs 기존 DataFrame.to_excel
+
+    python bench/bench_export.py [행수 ...]      (기본: 10000 100000 1000000)
+
+측정마다 별도 프로세스를 띄워 쓰기 시간과 최대 RSS(ru_maxrss)를 비교한다.
+"""
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+sys.path.insert(0, SRC)
+
+
+def make_store(n: int):
+    import numpy as np
+    from model.store import RowStore
+    upc = np.array([f"UPC{i:010d}" for i in range(n)], dtype=object)
+    qty = np.arange(n, dtype=np.int64) % 50
+    ts = np.datetime64("2024-01-01", "ns").astype(np.int64) + np.arange(n, dtype=np.int64) * 1_000_000_000
+    return RowStore.from_columns(upc, qty, ts)
+
+
+def run_one(mode: str, n: int, path: str):
+    store = make_store(n)
+    base_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    t0 = time.perf_counter()
+    if mode == "stream":
+        from model.io_excel import export_excel
+        export_excel(store, path)
+    else:
+        df = store.to_dataframe().copy()
+        df["UPC"] = df["UPC"].astype("string")
+        df.to_excel(path, index=False, engine="openpyxl")
+    elapsed = time.perf_counter() - t0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({"seconds": elapsed, "peak_mib": peak / 1024, "delta_mib": (peak - base_rss) / 1024}))
+
+
+def measure(mode: str, n: int, path: str) -> dict:
+    out = subprocess.run([sys.executable, __file__, "--one", mode, str(n), path],
+                         check=True, capture_output=True, text=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main(sizes):
+    print(f"{'rows':>8} {'to_excel s':>11} {'+RSS MiB':>9} {'stream s':>9} {'+RSS MiB':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in sizes:
+            old = measure("legacy", n, os.path.join(tmp, "old.xlsx"))
+            new = measure("stream", n, os.path.join(tmp, "new.xlsx"))
+            print(f"{n:>8} {old['seconds']:>11.2f} {old['delta_mib']:>9.1f} "
+                  f"{new['seconds']:>9.2f} {new['delta_mib']:>9.1f}")
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--one"]:
+        run_one(sys.argv[2], int(sys.argv[3]), sys.argv[4])
+    else:
+        main([int(a) for a in sys.argv[1:]] or [10_000, 100_000, 1_000_000])
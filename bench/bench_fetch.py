@@ -0,0 +1,92 @@
+"""큰 세션을 연 뒤 표가 처음 그려질 때까지의 시간 — 점진 노출(fetchMore) vs 예전 방식
+
+    python bench/bench_fetch.py [행 수]   (기본: 2000000)
+
+.upcs 세션 파일을 load_session으로 열고 DataFrameModel.set_store → QTableView 첫 그리기까지를 잰다.
+"eager"는 예전처럼 모든 행을 한 번에 보기에 알리고(FETCH_ROWS > 행 수) UPC 인덱스를
+set_store 안에서 다 만든 경우다. 기본은 앞쪽 행만 노출하고 인덱스는 그린 뒤에 이어서 채운다.
+끝으로 맨 뒤쪽 UPC를 find_row_by_upc + fetch_to로 찾아가는 시간을 출력한다.
+"""
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import numpy as np
+from PyQt6.QtCore import QEvent, QEventLoop, QObject
+from PyQt6.QtWidgets import QApplication, QTableView
+
+import model.dataframe_model as dfm
+from model.dataframe_model import FETCH_ROWS, DataFrameModel
+from model.session import load_session, save_session
+from model.store import RowStore
+
+
+class _Painted(QObject):
+    def __init__(self, widget, loop: QEventLoop):
+        super().__init__(widget)
+        self._loop = loop
+        widget.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Paint:
+            self._loop.quit()
+        return False
+
+
+def make_session(n: int, path: str):
+    upc = np.array([f"UPC{i:010d}" for i in range(n)], dtype=object)
+    ts = np.datetime64("2024-01-01", "ns").astype(np.int64) + np.arange(n, dtype=np.int64) * 10**9
+    save_session(RowStore.from_columns(upc, np.arange(n, dtype=np.int64) % 50, ts), path)
+
+
+def run(label: str, path: str, n: int, eager: bool):
+    dfm.FETCH_ROWS = n + 1 if eager else FETCH_ROWS
+    view = QTableView()
+    model = DataFrameModel()
+    view.setModel(model)
+    view.resize(800, 600)
+    view.show()
+    QApplication.processEvents()
+
+    t0 = time.perf_counter()
+    store = load_session(path)
+    t_load = time.perf_counter()
+    model.set_store(store)
+    if eager:
+        model._ensure_index()
+    t_reset = time.perf_counter()
+    loop = QEventLoop()
+    _Painted(view.viewport(), loop)
+    view.viewport().update()
+    loop.exec()
+    t_paint = time.perf_counter()
+    exposed = model.rowCount()
+
+    t1 = time.perf_counter()
+    row = model.find_row_by_upc(f"UPC{n - 1:010d}")
+    model.fetch_to(row)
+    view.selectRow(row)
+    QApplication.processEvents()
+    t_jump = time.perf_counter() - t1
+    print(f"{label:>6}  load {t_load - t0:6.3f} s  set_store {t_reset - t_load:6.3f} s  "
+          f"painted {t_paint - t0:6.3f} s  rows exposed {exposed:>9,}  jump-to-last {t_jump:6.3f} s")
+    view.close()
+
+
+def main(n: int):
+    app = QApplication.instance() or QApplication(sys.argv)  # noqa: F841
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "big.upcs")
+        make_session(n, path)
+        print(f"{n:,} rows")
+        run("fetch", path, n, False)
+        run("eager", path, n, True)
+    dfm.FETCH_ROWS = FETCH_ROWS
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000)
@@ -0,0 +1,98 @@
+"""Excel import 벤치마크: 스트리밍 import_excel vs 기존 pd.read_excel 방식
+
+    python bench/bench_import.py [행수 ...]      (기본: 100000 500000)
+
+생성한 xlsx 파일을 각각 읽어 소요 시간과 파이썬 힙 최대 사용량(tracemalloc)을 출력한다.
+"""
+import math
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import pandas as pd
+from openpyxl import Workbook
+
+from model.io_excel import import_excel
+from model.store import COLUMNS
+
+
+def legacy_import_excel(path: str) -> pd.DataFrame:
+    """기존 구현 (비교용): 전체 로드 후 셀 단위 .apply 검증"""
+    def _is_valid_qty(x) -> bool:
+        if pd.isna(x): return False
+        if isinstance(x, int): return True
+        if isinstance(x, float): return math.isfinite(x) and float(x).is_integer()
+        return str(x).strip().isdigit()
+
+    def _is_valid_upc(s) -> bool:
+        if pd.isna(s): return False
+        t = str(s).strip()
+        return len(t) >= 4 and t.isalnum()
+
+    df = pd.read_excel(path, dtype={"UPC": str}, engine="openpyxl")
+    for col in COLUMNS:
+        if col not in df.columns:
+            df[col] = pd.NA
+    df = df[COLUMNS].copy()
+    df["UPC"] = df["UPC"].astype("string").str.strip().str.upper()
+    invalid_upc_mask = ~df["UPC"].apply(_is_valid_upc)
+    if invalid_upc_mask.any():
+        raise ValueError(f"잘못된 UPC 행: {(df.index[invalid_upc_mask] + 2).tolist()}")
+    upc_norm = df["UPC"]
+    dup_mask = upc_norm.duplicated(keep=False)
+    if dup_mask.any():
+        first_rows = sorted(int(g.index.min()) + 2 for _, g in df[dup_mask].groupby(upc_norm))
+        raise ValueError(f"중복된 UPC 행: {first_rows}")
+    invalid_qty_mask = ~df["Qty"].apply(_is_valid_qty)
+    if invalid_qty_mask.any():
+        raise ValueError(f"잘못된 Qty 행: {(df.index[invalid_qty_mask] + 2).tolist()}")
+
+    def _to_int(x):
+        if isinstance(x, float): return int(x)
+        return int(str(x).strip())
+
+    df["Qty"] = df["Qty"].apply(_to_int).astype("int64")
+    df["LastScannedAt"] = pd.to_datetime(df["LastScannedAt"], errors="coerce")
+    return df
+
+
+def make_workbook(path: str, n: int):
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet()
+    ws.append(COLUMNS)
+    base = datetime(2024, 1, 1)
+    for i in range(n):
+        ws.append([f"UPC{i:010d}", i % 50, base + timedelta(seconds=i)])
+    wb.save(path)
+
+
+def measure(fn, path):
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    df = fn(path)
+    elapsed = time.perf_counter() - t0
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return df, elapsed, peak / 2**20
+
+
+def main(sizes):
+    print(f"{'rows':>8} {'legacy s':>9} {'legacy MiB':>11} {'stream s':>9} {'stream MiB':>11}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in sizes:
+            path = os.path.join(tmp, f"bench_{n}.xlsx")
+            make_workbook(path, n)
+            old, t_old, m_old = measure(legacy_import_excel, path)
+            new, t_new, m_new = measure(import_excel, path)
+            assert old["UPC"].tolist() == new["UPC"].tolist()
+            assert old["Qty"].tolist() == new["Qty"].tolist()
+            print(f"{n:>8} {t_old:>9.2f} {m_old:>11.1f} {t_new:>9.2f} {m_new:>11.1f}")
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [100_000, 500_000])
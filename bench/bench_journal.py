@@ -0,0 +1,51 @@
+"""스캔 저널 기록/재생 벤치마크
+
+    python bench/bench_journal.py [이벤트수]      (기본: 1000000)
+
+신규 UPC 1%, 수량 증가 99%, 수동 수정 소수로 이루어진 이벤트를 기록한 뒤
+빈 저장소 위에 재생하는 시간을 잰다.
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from model.journal import Journal, replay
+from model.store import RowStore, now_ns
+
+
+def main(n: int):
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "scan.journal")
+        j = Journal(path, interval_ms=50)
+        j.start(None)
+        rows = 0
+        t0 = time.perf_counter()
+        for i in range(n):
+            ts = now_ns()
+            if rows == 0 or i % 100 == 0:
+                j.record_append(rows, f"UPC{rows:010d}", ts)
+                rows += 1
+            elif i % 50_000 == 1:
+                j.record_set(rng.randrange(rows), qty=rng.randrange(100), ts=ts)
+            else:
+                j.record_add(rng.randrange(rows), rng.randint(1, 10), ts)
+        record = time.perf_counter() - t0
+        j.close()
+        size = os.path.getsize(path)
+
+        store = RowStore()
+        t0 = time.perf_counter()
+        applied = replay(path, store)
+        elapsed = time.perf_counter() - t0
+    print(f"events      {applied:,} ({size / 2**20:.1f} MiB, {len(store):,} rows)")
+    print(f"record      {record / n * 1e6:.2f} µs/event")
+    print(f"replay      {elapsed:.3f} s ({applied / elapsed / 1e6:.1f} M events/s)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
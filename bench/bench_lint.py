@@ -0,0 +1,65 @@
+"""검사 전용(model.lint) 벤치마크: 큰 통합문서 검사 시간 — 프로세스 수별, import_store와 비교
+
+    python bench/bench_lint.py [행 수] [--jobs 1 2 4]   (기본: 200000, 1 2 4)
+
+행 수만큼의 통합문서(약 1%는 규칙 위반)를 만들어 lint_workbook을 프로세스 수별로 재고,
+같은 파일을 import_store로 여는 시간(첫 오류에서 멈춤)과 비교한다.
+검사는 시트 XML을 행 구간으로 나눠 프로세스마다 자기 구간만 파싱하므로 코어 수에 비례해 빨라진다.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import numpy as np
+from openpyxl import Workbook
+
+from model.io_excel import import_store
+from model.lint import RULES, lint_workbook
+
+
+def make_workbook(n: int, path: str):
+    rng = np.random.default_rng(0)
+    bad = set(rng.choice(n, n // 100, replace=False).tolist())
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet()
+    ws.append(["UPC", "Qty", "LastScannedAt"])
+    for i in range(n):
+        if i in bad:
+            kind = i % 4
+            ws.append([("AB", f"UPC{i - 1:010d}", f"UPC{i:010d}", f"UPC{i:010d}")[kind],
+                       ("3", 2, "x", 1)[kind], "2024-01-01 10:00" if kind != 3 else "soon"])
+        else:
+            ws.append([f"UPC{i:010d}", int(i % 50), "2024-01-01 10:00"])
+    wb.save(path)
+
+
+def main(n: int, jobs: list[int]):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "incoming.xlsx")
+        t = time.perf_counter()
+        make_workbook(n, path)
+        print(f"{n:,} rows ({os.path.getsize(path) / 2**20:.1f} MiB, written in {time.perf_counter() - t:.1f} s), "
+              f"{os.cpu_count()} CPUs")
+        for j in jobs:
+            t = time.perf_counter()
+            report = lint_workbook(path, workers=j)
+            elapsed = time.perf_counter() - t
+            counts = ", ".join(f"{name} {k}" for name, k in zip(RULES, report.counts().tolist()) if k)
+            print(f"  lint -j {j:<3} {elapsed:7.2f} s ({n / elapsed:>9,.0f} rows/s)  {counts}")
+        t = time.perf_counter()
+        try:
+            import_store(path)
+        except ValueError as e:
+            print(f"  import_store {time.perf_counter() - t:7.2f} s  → {str(e)[:60]}...")
+
+
+if __name__ == "__main__":
+    p = argparse.ArgumentParser()
+    p.add_argument("rows", nargs="?", type=int, default=200_000)
+    p.add_argument("--jobs", nargs="+", type=int, default=[1, 2, 4])
+    args = p.parse_args()
+    main(args.rows, args.jobs)
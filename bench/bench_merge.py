@@ -0,0 +1,54 @@
+"""통합문서 합치기 벤치마크: 프로세스 수에 따른 merge_workbooks 시간
+
+    python bench/bench_merge.py [파일수] [파일당 행수]      (기본: 16 20000)
+
+파일마다 UPC의 절반은 다른 파일과 겹치게 만든다. 읽기/검증이 대부분이라
+코어 수에 거의 비례해 빨라져야 한다.
+"""
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from openpyxl import Workbook
+
+from model.merge import merge_workbooks
+from model.store import COLUMNS
+
+
+def make_station(path: str, station: int, n: int):
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet()
+    ws.append(COLUMNS)
+    base = datetime(2024, 1, 1) + timedelta(hours=station)
+    for i in range(n):
+        # 앞 절반은 공통 UPC, 뒤 절반은 스테이션 전용
+        code = i if i < n // 2 else station * n + i
+        ws.append([f"upc{code:010d}", i % 7 + 1, base + timedelta(seconds=i)])
+    wb.save(path)
+
+
+def main(files: int, rows: int):
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = [os.path.join(tmp, f"station_{k}.xlsx") for k in range(files)]
+        for k, path in enumerate(paths):
+            make_station(path, k, rows)
+        cpus = os.cpu_count() or 1
+        base = None
+        for workers in sorted({1, 2, 4, cpus}):
+            if workers > cpus:
+                continue
+            t0 = time.perf_counter()
+            result = merge_workbooks(paths, workers=workers)
+            elapsed = time.perf_counter() - t0
+            base = base or elapsed
+            print(f"workers={workers:<3} {elapsed:7.2f} s  speedup x{base / elapsed:4.1f}  "
+                  f"UPC {len(result.store):,}  overlaps {len(result.overlaps):,}")
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:]]
+    main(*(args + [16, 20_000][len(args):]))
@@ -0,0 +1,68 @@
+"""스캔 처리량 벤치마크: 스캔마다 handle_input vs ScanQueue 일괄 반영
+
+    python bench/bench_scan_pipeline.py [행수]      (기본: 100000)
+
+오프스크린 MainWindow(QTableView 표시)에 기존 UPC 재스캔 + 수량 입력을
+burst 단위로 흘려 넣고, burst마다 이벤트 루프를 한 번 돌려 초당 처리 건수를 잰다.
+"""
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import numpy as np
+from PyQt6.QtWidgets import QApplication
+
+from controller.input_handler import handle_input
+from model.store import RowStore
+from ui_main import MainWindow
+
+SCANS = 5_000
+BURSTS = [1, 10, 50]
+
+
+def make_window(n: int) -> MainWindow:
+    w = MainWindow()
+    upc = np.array([f"UPC{i:010d}" for i in range(n)], dtype=object)
+    w.model.set_store(RowStore.from_columns(upc, np.zeros(n, dtype=np.int64), np.zeros(n, dtype=np.int64)))
+    w.show()
+    return w
+
+
+def make_tokens(n: int) -> list[str]:
+    rng = random.Random(0)
+    tokens = []
+    while len(tokens) < SCANS:
+        tokens.append(f"UPC{rng.randrange(n):010d}" if rng.random() < 0.9 else f"NEW{len(tokens):010d}")
+        tokens.append(str(rng.randint(1, 10)))
+    return tokens[:SCANS]
+
+
+def run(app, w, tokens, burst: int, batched: bool) -> float:
+    t0 = time.perf_counter()
+    for i in range(0, len(tokens), burst):
+        for tok in tokens[i:i + burst]:
+            if batched:
+                w.scan_queue.push(tok)
+            else:
+                handle_input(w, tok)
+        app.processEvents()
+    return len(tokens) / (time.perf_counter() - t0)
+
+
+def main(n: int):
+    app = QApplication.instance() or QApplication(sys.argv)
+    tokens = make_tokens(n)
+    print(f"rows={n:,} scans={len(tokens):,}")
+    print(f"{'burst':>6} {'per-scan /s':>12} {'batched /s':>11}")
+    for burst in BURSTS:
+        before = run(app, make_window(n), tokens, burst, batched=False)
+        after = run(app, make_window(n), tokens, burst, batched=True)
+        print(f"{burst:>6} {before:>12,.0f} {after:>11,.0f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,102 @@
+"""네트워크 스캔 수신 부하 테스트: localhost에서 가상 스캐너 여러 대
+
+    python bench/bench_scan_server.py [클라이언트수] [클라이언트당 스캔수] [동시 전송 창]
+                                      (기본: 8 5000 32)
+
+ScanServer(TCP)에 클라이언트마다 "UPC, 수량" 쌍을 창 크기만큼 미리 보내며
+ack를 기다린다. 지속 처리량(ack/s)과 전송→ack 지연(p50/p99),
+최종 Qty 합계가 보낸 수량과 같은지 확인한다.
+"""
+import asyncio
+import os
+import sys
+import threading
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import numpy as np
+from PyQt6.QtCore import QTimer
+from PyQt6.QtWidgets import QApplication, QTableView
+
+from controller.scan_server import ScanServer
+from model.dataframe_model import DataFrameModel
+from model.store import make_empty_df
+
+UPCS_PER_CLIENT = 50
+
+
+async def scanner(k: int, address, scans: int, window: int, latencies: list, sent: list):
+    reader, writer = await asyncio.open_connection(*address)
+    pending: asyncio.Queue = asyncio.Queue(window)
+    total = 0
+
+    async def read_acks():
+        for _ in range(scans):
+            line = await reader.readline()
+            t0 = await pending.get()
+            latencies.append(time.perf_counter() - t0)
+            assert line.startswith(b"OK"), line
+
+    acks = asyncio.create_task(read_acks())
+    for i in range(scans):
+        if i % 2 == 0:
+            token = f"C{k:03d}U{(i // 2) % UPCS_PER_CLIENT:06d}"
+        else:
+            token = str(i % 10 + 1)
+            total += i % 10 + 1
+        await pending.put(time.perf_counter())
+        writer.write(token.encode() + b"\n")
+        if pending.full():
+            await writer.drain()
+    await writer.drain()
+    await acks
+    writer.close()
+    sent.append(total)
+
+
+def main(clients: int, scans: int, window: int):
+    app = QApplication.instance() or QApplication(sys.argv)
+    model = DataFrameModel(make_empty_df())
+    view = QTableView()
+    view.setModel(model)
+    view.show()
+    server = ScanServer(model)
+    server.start()
+
+    latencies: list[float] = []
+    sent: list[int] = []
+    elapsed = [0.0]
+
+    def run_clients():
+        async def all_clients():
+            t0 = time.perf_counter()
+            await asyncio.gather(*(scanner(k, server.address, scans, window, latencies, sent)
+                                   for k in range(clients)))
+            elapsed[0] = time.perf_counter() - t0
+        asyncio.run(all_clients())
+
+    t = threading.Thread(target=run_clients)
+    t.start()
+    # 클라이언트가 끝나면 GUI 스레드에서 종료 (다른 스레드에서 app.quit() 호출은 피함)
+    timer = QTimer()
+    timer.timeout.connect(lambda: t.is_alive() or app.quit())
+    timer.start(20)
+    app.exec()
+    t.join()
+    server.stop()
+
+    lat = np.array(latencies) * 1e3
+    total = clients * scans
+    print(f"clients={clients} scans={total:,} window={window}")
+    print(f"throughput   {total / elapsed[0]:,.0f} scans/s")
+    print(f"latency p50  {np.percentile(lat, 50):.2f} ms")
+    print(f"latency p99  {np.percentile(lat, 99):.2f} ms")
+    ok = int(model.store().qty_column().sum()) == sum(sent) and model.rowCount() == clients * min(UPCS_PER_CLIENT, (scans + 1) // 2)
+    print(f"totals match {ok}")
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:]]
+    main(*(args + [8, 5_000, 32][len(args):]))
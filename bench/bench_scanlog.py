@@ -0,0 +1,74 @@
+"""스캔 로그(model.scanlog) 벤치마크: 이벤트당 메모리와 스캔 한 건의 추가 지연
+
+    python bench/bench_scanlog.py [스캔 수]   (기본: 1000000)
+
+1) ScanLog에 스캔 묶음을 계속 덧붙여 이벤트당 바이트(할당 용량 기준)와 activity() 스냅샷 시간을 출력한다.
+2) 10만 행 모델에서 apply_scans([UPC, 수량]) 한 건의 지연(p50/p99)을 로그 기록 on/off로 비교한다.
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import numpy as np
+from PyQt6.QtCore import QCoreApplication
+
+from model.dataframe_model import DataFrameModel
+from model.scanlog import MINUTE_NS, ScanLog
+from model.store import RowStore
+
+ROWS = 100_000
+CALLS = 20_000
+BATCH = 64   # 1)에서 한 번에 덧붙이는 이벤트 수 (네트워크 스캔 묶음 크기 정도)
+
+
+def log_memory(n: int):
+    rng = np.random.default_rng(0)
+    log = ScanLog()
+    stations = [log.station_id(f"10.0.0.{i}") for i in range(8)]
+    t0 = 1_700_000_000 * 10**9
+    t = time.perf_counter()
+    for start in range(0, n, BATCH):
+        k = min(BATCH, n - start)
+        ts = t0 + start * (MINUTE_NS // 600)   # 분당 600건
+        log.extend(ts, rng.integers(0, ROWS, k), rng.integers(1, 5, k), stations[start // BATCH % 8])
+    elapsed = time.perf_counter() - t
+    t = time.perf_counter()
+    act = log.activity()
+    t_act = time.perf_counter() - t
+    print(f"{n:,} events  append {elapsed / n * 1e6:.2f} us/event  "
+          f"{log.nbytes / n:.1f} bytes/event (capacity {log.nbytes / 2**20:.1f} MiB)")
+    print(f"  activity(): {t_act * 1000:.1f} ms — {len(act.minute):,} minute x station cells, "
+          f"{len(act.rows):,} UPCs, {len(act.gap_start):,} idle gaps")
+
+
+def scan_latency(enabled: bool) -> tuple[float, float]:
+    upc = np.array([f"UPC{i:010d}" for i in range(ROWS)], dtype=object)
+    model = DataFrameModel()
+    model.set_store(RowStore.from_columns(upc, np.zeros(ROWS, dtype=np.int64), np.zeros(ROWS, dtype=np.int64)))
+    if not enabled:
+        model.scan_log().extend = lambda *a, **k: None
+    rng = np.random.default_rng(1)
+    picks = upc[rng.integers(0, ROWS, CALLS)].tolist()
+    times = np.empty(CALLS)
+    row = -1
+    for i, code in enumerate(picks):
+        t = time.perf_counter()
+        row, _, _ = model.apply_scans([("upc", code), ("qty", 1)], row)
+        times[i] = time.perf_counter() - t
+    return float(np.percentile(times, 50)) * 1e6, float(np.percentile(times, 99)) * 1e6
+
+
+def main(n: int):
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv)  # noqa: F841
+    log_memory(n)
+    print(f"\napply_scans([UPC, qty]) on {ROWS:,} rows, {CALLS:,} calls (us)")
+    for label, enabled in (("log off", False), ("log on", True)):
+        p50, p99 = scan_latency(enabled)
+        print(f"  {label:<8} p50 {p50:7.1f}  p99 {p99:7.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
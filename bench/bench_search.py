@@ -0,0 +1,77 @@
+"""UPC 찾기(model.upc_search) 벤치마크: 인덱스 생성, 입력 중 후보 조회, 비슷한 UPC 제안
+
+    python bench/bench_search.py [행 수]   (기본: 1000000)
+
+1) 행 수만큼의 UPC로 UpcSearch를 만드는 시간 (찾기 상자를 처음 쓸 때 한 번)
+2) DataFrameModel.search_upc — 한 글자씩 입력할 때마다의 접두어/접미어 조회 (p50/p99)와
+   Enter에서만 쓰는 부분 문자열 스캔(contains=True)
+3) suggest_upc — 한 글자 틀린 코드에 대한 편집 거리 제안
+도중에 새 UPC를 추가해 대기 목록/병합 비용도 포함한다.
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import numpy as np
+from PyQt6.QtCore import QCoreApplication
+
+from model.dataframe_model import DataFrameModel
+from model.store import RowStore
+
+QUERIES = 300
+APPENDS = 5_000
+
+
+def percentiles(times: list[float]) -> str:
+    t = np.array(times) * 1e6
+    return f"p50 {np.percentile(t, 50):8.1f} us  p99 {np.percentile(t, 99):8.1f} us"
+
+
+def main(n: int):
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv)  # noqa: F841
+    rng = np.random.default_rng(0)
+    # 실제 UPC처럼 12자리 공간에 흩어진 코드 (연속 번호면 한 글자 차이 UPC가 너무 많다)
+    codes = np.unique(rng.integers(0, 10**12, n + n // 100))[:n]
+    upc = np.array([f"{c:012d}" for c in rng.permutation(codes)], dtype=object)
+    model = DataFrameModel()
+    model.set_store(RowStore.from_columns(upc, np.zeros(n, dtype=np.int64), np.zeros(n, dtype=np.int64)))
+
+    t = time.perf_counter()
+    model._searcher()
+    print(f"{n:,} rows  build {time.perf_counter() - t:.3f} s")
+
+    for i in range(APPENDS):
+        model.append_row(f"N{i:011d}")
+
+    picks = upc[rng.integers(0, n, QUERIES)].tolist()
+    for label, part in (("prefix", lambda c, k: c[:k]), ("suffix", lambda c, k: c[-k:])):
+        for k in (4, 8):
+            times, hits = [], 0
+            for code in picks:
+                t = time.perf_counter()
+                hits += len(model.search_upc(part(code, k)))
+                times.append(time.perf_counter() - t)
+            print(f"  search {label} {k} chars  {percentiles(times)}  ({hits / QUERIES:.0f} hits)")
+
+    times = []
+    for code in picks[:20]:
+        t = time.perf_counter()
+        model.search_upc("Z" + code[3:9], contains=True)   # 접두어/접미어 실패 → 전체 스캔
+        times.append(time.perf_counter() - t)
+    print(f"  search contains     {percentiles(times)}")
+
+    times, found = [], 0
+    for code in picks:
+        i = int(rng.integers(0, len(code)))
+        typo = code[:i] + str((int(code[i]) + 1) % 10) + code[i + 1:]
+        t = time.perf_counter()
+        found += code in model.suggest_upc(typo, limit=10)
+        times.append(time.perf_counter() - t)
+    print(f"  suggest 1 typo      {percentiles(times)}  (original found {found}/{QUERIES})")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
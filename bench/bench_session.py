@@ -0,0 +1,62 @@
+"""작업 세션 파일(.upcs) 저장/열기 벤치마크 — xlsx와 비교
+
+    python bench/bench_session.py [행 수 ...]   (기본: 100000 1000000)
+
+같은 표를 .upcs와 .xlsx로 저장한 뒤 각각 다시 열어 걸린 시간, 초당 행 수,
+파일 크기를 출력한다. xlsx는 --xlsx-max 행(기본 100000)까지만 잰다.
+열기는 검증 포함(import_store / load_session 기본값)이다.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import numpy as np
+
+from model.io_excel import export_excel, import_store
+from model.session import load_session, save_session
+from model.store import RowStore
+
+
+def make_store(n: int) -> RowStore:
+    upc = np.array([f"UPC{i:010d}" for i in range(n)], dtype=object)
+    ts = np.datetime64("2024-01-01", "ns").astype(np.int64) + np.arange(n, dtype=np.int64) * 10**9
+    return RowStore.from_columns(upc, np.arange(n, dtype=np.int64) % 50, ts)
+
+
+def timed(fn, *args) -> tuple[float, object]:
+    t0 = time.perf_counter()
+    out = fn(*args)
+    return time.perf_counter() - t0, out
+
+
+def run(label: str, save, load, store: RowStore, path: str):
+    n = len(store)
+    t_save, _ = timed(save, store, path)
+    t_load, back = timed(load, path)
+    assert len(back) == n and np.array_equal(back.qty_column(), store.qty_column())
+    size = os.path.getsize(path) / 2**20
+    print(f"  {label:<6} save {t_save:7.3f} s  open {t_load:7.3f} s "
+          f"({n / t_load:>12,.0f} rows/s)  {size:7.1f} MiB")
+    del back
+
+
+def main(sizes: list[int], xlsx_max: int):
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in sizes:
+            store = make_store(n)
+            print(f"{n:,} rows")
+            run(".upcs", save_session, load_session, store, os.path.join(tmp, f"s{n}.upcs"))
+            if n <= xlsx_max:
+                run(".xlsx", export_excel, import_store, store, os.path.join(tmp, f"s{n}.xlsx"))
+
+
+if __name__ == "__main__":
+    p = argparse.ArgumentParser()
+    p.add_argument("sizes", nargs="*", type=int, default=[100_000, 1_000_000])
+    p.add_argument("--xlsx-max", type=int, default=100_000)
+    args = p.parse_args()
+    main(args.sizes, args.xlsx_max)
@@ -0,0 +1,65 @@
+"""DataFrameModel 정렬/필터 벤치마크
+
+    python bench/bench_sort.py [행수]      (기본: 1000000)
+
+열별 sort() (argsort) 시간, UPC 필터 시간, 정렬된 상태에서 스캔 한 건이
+이진 삽입으로 반영되는 시간을 전체 재정렬(argsort)과 비교한다.
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import numpy as np
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QApplication
+
+from model.dataframe_model import DataFrameModel
+from model.store import RowStore, make_empty_df
+
+SCANS = 2_000
+
+
+def make_model(n: int) -> DataFrameModel:
+    rng = np.random.default_rng(0)
+    model = DataFrameModel(make_empty_df())
+    upc = np.array([f"UPC{i:010d}" for i in rng.permutation(n)], dtype=object)
+    ts = np.datetime64("2024-01-01", "ns").astype(np.int64) + rng.integers(0, 10**15, n)
+    model.set_store(RowStore.from_columns(upc, rng.integers(0, 50, n), ts))
+    return model
+
+
+def main(n: int):
+    app = QApplication.instance() or QApplication(sys.argv)
+    model = make_model(n)
+    for col, name in enumerate(("UPC", "Qty", "LastScannedAt")):
+        t0 = time.perf_counter()
+        model.sort(col, Qt.SortOrder.AscendingOrder)
+        print(f"sort {name:<14} {(time.perf_counter() - t0) * 1e3:8.1f} ms")
+
+    t0 = time.perf_counter()
+    model.set_filter("12")
+    print(f"filter '12'         {(time.perf_counter() - t0) * 1e3:8.1f} ms  ({model.rowCount():,} rows)")
+    model.set_filter("")
+
+    rng = np.random.default_rng(1)
+    upcs = model.store().upc_column()[rng.integers(0, n, SCANS)].tolist()
+    for col, name in ((1, "Qty"), (2, "LastScannedAt")):
+        model.sort(col, Qt.SortOrder.DescendingOrder)
+        t0 = time.perf_counter()
+        for upc in upcs:
+            model.apply_scans([("upc", upc), ("qty", 3)], -1)
+        incremental = (time.perf_counter() - t0) / SCANS
+
+        t0 = time.perf_counter()
+        for _ in range(5):
+            model._rebuild_order()
+        full = (time.perf_counter() - t0) / 5
+        print(f"scan sorted by {name:<14} {incremental * 1e6:8.1f} µs/scan  (full re-sort {full * 1e3:.1f} ms)")
+    app.processEvents()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
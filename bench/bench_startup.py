@@ -0,0 +1,102 @@
+"""콜드 스타트 벤치마크: import 시간(-X importtime)과 첫 화면까지 걸리는 시간
+
+    python bench/bench_startup.py [반복 횟수]   (기본: 5)
+
+1) python -X importtime -c "import ui_main" 을 파싱해 누적 시간 상위 모듈과
+   시작 경로에 pandas/openpyxl이 끼어 있는지 출력한다.
+2) 새 프로세스에서 MainWindow가 처음 그려질 때까지의 시간(프로세스 시작 기준)을
+   지금 구조(lazy)와 pandas/openpyxl을 먼저 import하는 예전 구조(eager)로 각각 잰다.
+   첫 값은 디스크 캐시가 차가울 수 있으므로 중앙값을 본다.
+"""
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC = os.path.join(ROOT, "src")
+HEAVY = ("pandas", "openpyxl")
+TOP = 8
+
+
+def child(eager: bool):
+    """측정용 자식 프로세스: 첫 Paint 이벤트에서 시각을 출력하고 바로 종료"""
+    t0 = time.perf_counter()
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    sys.path.insert(0, SRC)
+    if eager:
+        import openpyxl  # noqa: F401
+        import pandas  # noqa: F401
+    from PyQt6.QtCore import QEvent, QObject
+    from PyQt6.QtWidgets import QApplication
+    from ui_main import MainWindow
+    t_import = time.perf_counter()
+
+    app = QApplication(sys.argv)
+    w = MainWindow(journal_path=os.path.join(tempfile.gettempdir(), "bench_startup.journal"))
+
+    class FirstPaint(QObject):
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Type.Paint:
+                heavy = ",".join(m for m in HEAVY if m in sys.modules) or "-"
+                print(f"painted {t_import - t0:.6f} {time.perf_counter() - t0:.6f} {heavy}", flush=True)
+                os._exit(0)   # closeEvent(저장 확인)를 거치지 않고 종료
+            return False
+
+    f = FirstPaint()
+    w.installEventFilter(f)
+    w.show()
+    app.exec()
+
+
+def importtime():
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    res = subprocess.run([sys.executable, "-X", "importtime", "-c", "import ui_main"],
+                         cwd=SRC, env=env, capture_output=True, text=True)
+    rows = []   # (누적 µs, 깊이, 모듈)
+    for line in res.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cum_us, name = line[len("import time:"):].split("|")
+        name = name.rstrip()
+        rows.append((int(cum_us), (len(name) - len(name.lstrip()) - 1) // 2, name.strip()))
+    total = next((cum for cum, _, name in rows if name == "ui_main"), 0)
+    print(f"-X importtime: import ui_main = {total / 1000:.1f} ms")
+    # ui_main이 직접 불러온 모듈(깊이 1)과 최상위 모듈 중 누적 시간 상위
+    for cum, _, name in sorted((r for r in rows if r[1] <= 1 and r[2] != "ui_main"), reverse=True)[:TOP]:
+        print(f"  {cum / 1000:8.1f} ms  {name}")
+    loaded = [m for m in HEAVY if any(name == m for _, _, name in rows)]
+    print(f"  heavy modules on startup path: {', '.join(loaded) or 'none'}")
+
+
+def first_window(runs: int, eager: bool) -> tuple[float, float, float, str]:
+    imports, painted, wall = [], [], []
+    heavy = "-"
+    cmd = [sys.executable, os.path.abspath(__file__), "--child"] + (["--eager"] if eager else [])
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        out = subprocess.run(cmd, capture_output=True, text=True, timeout=60).stdout
+        wall.append(time.perf_counter() - t0)
+        line = next(s for s in out.splitlines() if s.startswith("painted"))
+        _, t_imp, t_paint, heavy = line.split()
+        imports.append(float(t_imp))
+        painted.append(float(t_paint))
+    return statistics.median(imports), statistics.median(painted), statistics.median(wall), heavy
+
+
+def main(runs: int):
+    importtime()
+    print(f"\ntime to first window (median of {runs}, seconds)")
+    print(f"{'':>6} {'imports':>9} {'painted':>9} {'process':>9}  heavy loaded")
+    for label, eager in (("lazy", False), ("eager", True)):
+        imp, paint, wall, heavy = first_window(runs, eager)
+        print(f"{label:>6} {imp:9.3f} {paint:9.3f} {wall:9.3f}  {heavy}")
+
+
+if __name__ == "__main__":
+    if "--child" in sys.argv:
+        child("--eager" in sys.argv)
+    else:
+        main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
@@ -0,0 +1,51 @@
+"""UPC 조회(find_row_by_upc) 지연 시간 마이크로 벤치마크
+
+    python bench/bench_upc_lookup.py
+
+행 수(1k ~ 1M)가 늘어나도 스캔당 조회 시간이 일정해야 한다.
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import pandas as pd
+from PyQt6.QtCore import QCoreApplication
+
+from model.dataframe_model import DataFrameModel
+
+SIZES = [1_000, 10_000, 100_000, 1_000_000]
+LOOKUPS = 20_000
+
+
+def make_df(n: int) -> pd.DataFrame:
+    return pd.DataFrame({
+        "UPC": pd.array([f"UPC{i:010d}" for i in range(n)], dtype="string"),
+        "Qty": pd.Series([1] * n, dtype="int64"),
+        "LastScannedAt": pd.Series([pd.Timestamp("2024-01-01")] * n, dtype="datetime64[ns]"),
+    })
+
+
+def main():
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv)  # noqa: F841
+    print(f"{'rows':>10} {'hit µs':>10} {'miss µs':>10}")
+    for n in SIZES:
+        model = DataFrameModel(make_df(n))
+        keys = [f"UPC{(i * 7919) % n:010d}" for i in range(LOOKUPS)]
+
+        t0 = time.perf_counter()
+        for k in keys:
+            model.find_row_by_upc(k)
+        hit = (time.perf_counter() - t0) / LOOKUPS * 1e6
+
+        t0 = time.perf_counter()
+        for i in range(LOOKUPS):
+            model.find_row_by_upc(f"MISS{i}")
+        miss = (time.perf_counter() - t0) / LOOKUPS * 1e6
+        print(f"{n:>10} {hit:>10.3f} {miss:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
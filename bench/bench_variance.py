@@ -0,0 +1,57 @@
+"""재고 차이 조인(compare_stores) 벤치마크
+
+    python bench/bench_variance.py [예상 재고 행 수]   (기본: 1000000)
+
+센 표는 예상 재고의 90% UPC + 5% 예상 외 UPC, 대소문자/공백이 섞인 키로 만든다.
+조인 시간과 최대 메모리(tracemalloc)를 출력한다 — xlsx 파싱은 bench_import.py 참고.
+"""
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import numpy as np
+
+from model.store import RowStore
+from model.variance import STATUSES, compare_stores
+
+
+def make_stores(n: int) -> tuple[RowStore, RowStore]:
+    rng = np.random.default_rng(0)
+    exp_upc = np.array([f"UPC{i:010d}" for i in range(n)], dtype=object)
+    expected = RowStore.from_columns(exp_upc, rng.integers(0, 20, n), np.zeros(n, dtype=np.int64))
+
+    picked = rng.permutation(n)[:n * 9 // 10]
+    extra = np.array([f"NEW{i:010d}" for i in range(n // 20)], dtype=object)
+    cnt_upc = np.concatenate([
+        np.array([f" upc{i:010d}" if i % 7 == 0 else f"UPC{i:010d}" for i in picked.tolist()], dtype=object),
+        extra,
+    ])
+    m = len(cnt_upc)
+    counted = RowStore.from_columns(cnt_upc, rng.integers(0, 20, m), np.zeros(m, dtype=np.int64))
+    return counted, expected
+
+
+def main(n: int):
+    counted, expected = make_stores(n)
+    print(f"counted {len(counted):,} rows, expected {len(expected):,} rows")
+
+    t0 = time.perf_counter()
+    report = compare_stores(counted, expected)
+    elapsed = time.perf_counter() - t0
+
+    tracemalloc.start()
+    compare_stores(counted, expected)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    print(f"join {elapsed:.2f} s  peak {peak / 2**20:.0f} MiB")
+    for k, name in enumerate(STATUSES):
+        rows = report.rows(k)
+        print(f"  {name:<10} {rows.stop - rows.start:>10,}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,171 @@
+"""벤치마크 모음: 스캔 경로 지연(p50/p99) + import/export 처리량/메모리
+
+    python bench/run_suite.py                                  # 1k~1M 행
+    python bench/run_suite.py --sizes 1000,10000 -o now.json
+    python bench/run_suite.py --baseline base.json --threshold 0.25
+
+DataFrameModel의 append_row / add_qty / find_row_by_upc / data()와
+ScanEngine 스캔 한 건(UPC + 수량)의 호출별 지연, io_excel.import_excel /
+export_excel의 초당 행 수와 최대 메모리(tracemalloc, --mem-max 행까지)를 잰다.
+--baseline이 주어지면 같은 지표끼리 비교해 threshold(비율)보다 나빠진
+항목을 출력하고 종료 코드 1로 끝난다.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import numpy as np
+from PyQt6.QtCore import QCoreApplication, Qt
+
+from controller.table_controller import ScanEngine
+from model.dataframe_model import DataFrameModel
+from model.io_excel import export_excel, import_excel
+from model.store import RowStore, make_empty_df
+
+SIZES = [1_000, 10_000, 100_000, 1_000_000]
+CALLS = 2_000          # 지표마다 잴 호출 수
+
+
+def make_store(n: int) -> RowStore:
+    upc = np.array([f"UPC{i:010d}" for i in range(n)], dtype=object)
+    ts = np.datetime64("2024-01-01", "ns").astype(np.int64) + np.arange(n, dtype=np.int64) * 10**9
+    return RowStore.from_columns(upc, np.arange(n, dtype=np.int64) % 50, ts)
+
+
+def make_model(n: int) -> DataFrameModel:
+    model = DataFrameModel(make_empty_df())
+    model.set_store(make_store(n))
+    return model
+
+
+def timed(fn, args_list) -> np.ndarray:
+    """호출별 소요 시간 (µs)"""
+    out = np.empty(len(args_list))
+    clock = time.perf_counter_ns
+    for i, args in enumerate(args_list):
+        t0 = clock()
+        fn(*args)
+        out[i] = clock() - t0
+    return out / 1000
+
+
+def latency(results: dict, name: str, n: int, samples: np.ndarray):
+    for q in (50, 99):
+        results[f"{name}.p{q}_us@{n}"] = {"value": float(np.percentile(samples, q)), "unit": "us", "better": "lower"}
+
+
+def bench_model(results: dict, n: int):
+    rng = random.Random(n)
+    model = make_model(n)
+    rows = [(rng.randrange(n), 1) for _ in range(CALLS)]
+    latency(results, "add_qty", n, timed(model.add_qty, rows))
+
+    upcs = [(f"UPC{rng.randrange(n):010d}",) for _ in range(CALLS)]
+    latency(results, "find_row_by_upc", n, timed(model.find_row_by_upc, upcs))
+
+    # 화면 한 장 분량을 여러 위치에서 — 캐시 적중/비적중이 섞인다
+    idx = [(model.index(rng.randrange(n), rng.randrange(3)), Qt.ItemDataRole.DisplayRole) for _ in range(CALLS)]
+    latency(results, "data", n, timed(model.data, idx))
+
+    engine = ScanEngine(model)
+    scans = [([f"UPC{rng.randrange(n):010d}", str(rng.randint(1, 10))],) for _ in range(CALLS)]
+    latency(results, "scan", n, timed(lambda toks: list(engine.feed(toks)), scans))
+
+    new = [(f"NEW{i:010d}",) for i in range(CALLS)]
+    latency(results, "append_row", n, timed(model.append_row, new))
+
+
+def peak_mib(fn, *args) -> float:
+    tracemalloc.start()
+    try:
+        fn(*args)
+        return tracemalloc.get_traced_memory()[1] / 2**20
+    finally:
+        tracemalloc.stop()
+
+
+def bench_io(results: dict, n: int, tmp: str, mem_max: int):
+    """처리량은 추적 없이 재고, 메모리는 tracemalloc으로 한 번 더 (느려서 mem_max 행까지만)"""
+    path = os.path.join(tmp, f"suite_{n}.xlsx")
+    store = make_store(n)
+    for name, fn, args in (("export", export_excel, (store, path)), ("import", import_excel, (path,))):
+        t0 = time.perf_counter()
+        fn(*args)
+        results[f"{name}.rows_per_s@{n}"] = {"value": n / (time.perf_counter() - t0), "unit": "rows/s", "better": "higher"}
+        if n <= mem_max:
+            results[f"{name}.peak_mib@{n}"] = {"value": peak_mib(fn, *args), "unit": "MiB", "better": "lower"}
+    os.remove(path)
+
+
+def compare(current: dict, baseline: dict, threshold: float, noise_us: float = 1.0) -> list[str]:
+    """threshold 비율보다 나빠진 지표 목록 (µs 지표는 noise_us 이하 차이는 무시)"""
+    worse = []
+    for name, cur in current.items():
+        base = baseline.get(name)
+        if base is None or not base["value"]:
+            continue
+        if cur["unit"] == "us" and abs(cur["value"] - base["value"]) <= noise_us:
+            continue
+        ratio = cur["value"] / base["value"]
+        if (cur["better"] == "lower" and ratio > 1 + threshold) or \
+           (cur["better"] == "higher" and ratio < 1 - threshold):
+            worse.append(f"{name:<32} {base['value']:>12,.2f} → {cur['value']:>12,.2f} {cur['unit']} ({ratio:.2f}x)")
+    return worse
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default=",".join(map(str, SIZES)), help="행 수 목록 (쉼표 구분)")
+    parser.add_argument("--no-io", action="store_true", help="import/export 생략")
+    parser.add_argument("-o", "--output", default="bench_results.json")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON")
+    parser.add_argument("--threshold", type=float, default=0.25, help="허용 악화 비율 (기본 0.25 = 25%%)")
+    parser.add_argument("--noise-us", type=float, default=1.0, help="무시할 지연 차이 (µs, 기본 1)")
+    parser.add_argument("--mem-max", type=int, default=100_000, help="메모리를 잴 최대 행 수 (tracemalloc은 느림)")
+    args = parser.parse_args(argv)
+    sizes = [int(s) for s in args.sizes.split(",") if s]
+
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv)  # noqa: F841 (모델 시그널용)
+    results: dict = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in sizes:
+            t0 = time.perf_counter()
+            bench_model(results, n)
+            if not args.no_io:
+                bench_io(results, n, tmp, args.mem_max)
+            print(f"{n:>9,} rows  {time.perf_counter() - t0:6.1f} s", file=sys.stderr)
+
+    for name, m in results.items():
+        print(f"{name:<32} {m['value']:>14,.2f} {m['unit']}")
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump({
+            "meta": {"date": datetime.now().isoformat(timespec="seconds"), "python": platform.python_version(),
+                     "platform": platform.platform(), "sizes": sizes},
+            "metrics": results,
+        }, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["metrics"]
+        worse = compare(results, baseline, args.threshold, args.noise_us)
+        if worse:
+            print(f"\n성능 저하 {len(worse)}건 (허용 {args.threshold:.0%}):")
+            for line in worse:
+                print("  " + line)
+            return 1
+        print(f"\n기준 대비 저하 없음 (허용 {args.threshold:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
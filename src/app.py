@@ -1,3 +1,5 @@
+import multiprocessing
+import os
 import sys
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import Qt
@@ -6,19 +8,28 @@ from PyQt6.QtGui import QIcon
 
 # 스크립트 실행과 모듈 실행 둘 다 지원
 if __package__ is None:  # python src/app.py
-    import os
     sys.path.append(os.path.dirname(__file__))
     from ui_main import MainWindow
+    from utils import prewarm
+    from utils.logging_conf import setup_logging
 else:  # python -m src.app
     from .ui_main import MainWindow
+    from .utils import prewarm
+    from .utils.logging_conf import setup_logging
 
 def main():
+    # 로그: UPC_LOG_LEVEL / UPC_LOG_FILE (성능 패널·느린 호출 기록은 upc_counter.perf)
+    setup_logging(os.environ.get("UPC_LOG_LEVEL", "WARNING"), os.environ.get("UPC_LOG_FILE"))
     # Qt6에서는 AA_UseHighDpiPixmaps 사용 금지/불필요 → 삭제
     app = QApplication(sys.argv)
     app.setWindowIcon(QIcon("assets/app.ico"))
     win = MainWindow()
+    # 창은 pandas/openpyxl 없이 뜬다 — 첫 그리기 후 백그라운드에서 미리 import
+    prewarm.start_after_paint(win)
     win.show()
+    win.start_journal()   # 지난 세션이 비정상 종료됐다면 복구 제안
     sys.exit(app.exec())
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()   # 실행 파일에서 Validate 검사 프로세스(spawn) 시작용
     main()
@@ -0,0 +1,174 @@
+"""UPC Counter 일괄 처리 (GUI 없이)
+
+    python src/cli.py counts.xlsx scans.txt            # counts.xlsx를 갱신
+    python src/cli.py counts.xlsx scans.txt -o out.xlsx
+    cat dump.txt | python -m src.cli counts.xlsx -     # 표준 입력
+    python src/cli.py merge total.xlsx a.xlsx b.xlsx ...   # 스테이션별 통합문서 합치기
+    python src/cli.py variance counts.xlsx expected.xlsx -o variance.xlsx   # 예상 재고와 비교
+    python src/cli.py lint supplier.xlsx -o errors.xlsx   # 불러오지 않고 모든 규칙 검사 (.csv도 가능)
+
+스캔 로그는 한 줄에 토큰 하나 (UPC 또는 1~10 수량) — 화면 입력과 같은 규칙.
+통합문서가 없으면 빈 표에서 시작한다.
+"""
+import argparse
+import os
+import sys
+
+# 스크립트 실행과 모듈 실행 둘 다 지원
+if __package__ is None:  # python src/cli.py
+    sys.path.append(os.path.dirname(__file__))
+else:  # python -m src.cli
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from controller.table_controller import ScanEngine, StoreTarget
+from model.io_excel import export_excel, import_store, save_atomic
+from model.session import load_store, save_store
+from model.store import RowStore
+
+MAX_ERRORS_SHOWN = 20
+
+
+def _read_lines(path: str):
+    if path == "-":
+        yield from sys.stdin
+        return
+    with open(path, encoding="utf-8-sig") as f:
+        yield from f
+
+
+def merge_main(argv: list[str]) -> int:
+    from model.merge import merge_workbooks
+
+    parser = argparse.ArgumentParser(prog="upc-counter-cli merge", description="여러 통합문서를 UPC별로 합산")
+    parser.add_argument("output", help="합친 결과 .xlsx")
+    parser.add_argument("inputs", nargs="+", help="합칠 .xlsx 파일들")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--report", help="여러 파일에 나온 UPC의 파일별 수량을 CSV로 저장")
+    args = parser.parse_args(argv)
+
+    result = merge_workbooks(args.inputs, workers=args.jobs)
+    for f in result.files:
+        if f.error:
+            print(f"{f.path}: 제외 — {f.error}", file=sys.stderr)
+        elif f.overlap:
+            print(f"{f.path}: {f.rows}행, 다른 파일과 겹치는 UPC {f.overlap}개")
+    if args.report:
+        result.overlaps.to_csv(args.report, index=False, encoding="utf-8-sig")
+
+    try:
+        save_atomic(export_excel, result.store, args.output)
+    except Exception as e:
+        print(f"저장 실패: {e}", file=sys.stderr)
+        return 2
+    failed = sum(1 for f in result.files if f.error)
+    print(f"{len(args.inputs) - failed}/{len(args.inputs)}개 파일 → UPC {len(result.store)}개 → {args.output}")
+    return 1 if failed else 0
+
+
+def variance_main(argv: list[str]) -> int:
+    from functools import partial
+
+    from model.variance import MATCH, export_variance, variance_from_file
+
+    parser = argparse.ArgumentParser(prog="upc-counter-cli variance", description="센 수량을 예상 재고와 비교")
+    parser.add_argument("counted", help="센 수량 .xlsx")
+    parser.add_argument("expected", help="예상 재고 .xlsx (UPC, Qty)")
+    parser.add_argument("-o", "--output", help="차이 보고서 .xlsx")
+    parser.add_argument("--all", action="store_true", help="보고서에 일치하는 UPC도 포함")
+    args = parser.parse_args(argv)
+
+    try:
+        report = variance_from_file(import_store(args.counted), args.expected)
+    except Exception as e:
+        print(f"불러오기 실패: {e}", file=sys.stderr)
+        return 2
+    print(report.totals().to_string())
+
+    if args.output:
+        try:
+            save_atomic(partial(export_variance, include_match=args.all), report, args.output)
+        except Exception as e:
+            print(f"저장 실패: {e}", file=sys.stderr)
+            return 2
+        print(f"→ {args.output}")
+    return 1 if report.bounds[MATCH] else 0   # 차이 나는 UPC가 있으면 1
+
+
+def lint_main(argv: list[str]) -> int:
+    from model.lint import RULES, export_lint, lint_workbook
+
+    parser = argparse.ArgumentParser(prog="upc-counter-cli lint", description="통합문서를 불러오지 않고 모든 규칙 검사")
+    parser.add_argument("workbook", help="검사할 .xlsx")
+    parser.add_argument("-o", "--output", help="오류 보고서 .xlsx(문제 셀 표시) 또는 .csv")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--upc-min-len", type=int, default=4)
+    args = parser.parse_args(argv)
+
+    try:
+        report = lint_workbook(args.workbook, workers=args.jobs, min_len=args.upc_min_len)
+    except Exception as e:
+        print(f"검사 실패: {e}", file=sys.stderr)
+        return 2
+    for row, rule, msg in list(zip(report.issue_row.tolist(), report.issue_rule.tolist(),
+                                   report.messages))[:MAX_ERRORS_SHOWN]:
+        print(f"{row}행 {RULES[rule]}: {msg}", file=sys.stderr)
+    if len(report) > MAX_ERRORS_SHOWN:
+        print(f"... 외 {len(report) - MAX_ERRORS_SHOWN}건", file=sys.stderr)
+    counts = ", ".join(f"{name} {n}" for name, n in zip(RULES, report.counts().tolist()) if n)
+    print(f"{report.rows}행 검사: {counts or '문제 없음'}")
+
+    if args.output and len(report):
+        try:
+            save_atomic(export_lint, report, args.output)
+        except Exception as e:
+            print(f"저장 실패: {e}", file=sys.stderr)
+            return 2
+        print(f"→ {args.output}")
+    return 0 if report.importable else 1
+
+
+def main(argv: list[str] | None = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == "merge":
+        return merge_main(argv[1:])
+    if argv and argv[0] == "variance":
+        return variance_main(argv[1:])
+    if argv and argv[0] == "lint":
+        return lint_main(argv[1:])
+
+    parser = argparse.ArgumentParser(prog="upc-counter-cli", description="스캔 로그를 통합문서에 일괄 반영")
+    parser.add_argument("workbook", help="기준 .xlsx 또는 세션 .upcs (없으면 새로 만든다)")
+    parser.add_argument("scans", nargs="?", default="-", help="스캔 로그 파일 (기본: 표준 입력 '-')")
+    parser.add_argument("-o", "--output", help="저장할 .xlsx/.upcs (기본: workbook 덮어쓰기)")
+    parser.add_argument("--upc-min-len", type=int, default=4)
+    args = parser.parse_args(argv)
+
+    try:
+        store = load_store(args.workbook) if os.path.exists(args.workbook) else RowStore()
+    except Exception as e:
+        print(f"불러오기 실패: {e}", file=sys.stderr)
+        return 2
+
+    target = StoreTarget(store)
+    engine = ScanEngine(target, args.upc_min_len)
+    report = engine.run(_read_lines(args.scans), start=1)
+
+    for err in report.errors[:MAX_ERRORS_SHOWN]:
+        print(f"{err.line}행 {err.token.strip()!r}: {err.message}", file=sys.stderr)
+    if len(report.errors) > MAX_ERRORS_SHOWN:
+        print(f"... 외 오류 {len(report.errors) - MAX_ERRORS_SHOWN}건", file=sys.stderr)
+
+    out = args.output or args.workbook
+    try:
+        # .upcs에서 연 열은 그 파일을 메모리 매핑으로 빌려 쓰므로, 교체 전에 힙으로 옮긴다 (UI 저장과 같음)
+        target.store.detach()
+        save_atomic(save_store, target.store, out)
+    except Exception as e:
+        print(f"저장 실패: {e}", file=sys.stderr)
+        return 2
+    print(f"{report.lines}줄 처리: 신규 UPC {report.n_new}, 수량 {report.n_qty}, 오류 {len(report.errors)} → {out}")
+    return 1 if report.errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
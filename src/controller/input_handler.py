@@ -1,44 +1,51 @@
-import re
 from PyQt6.QtWidgets import QMessageBox
 
-QTY_PATTERN = re.compile(r"^(?:10|[1-9])$")
-UPC_ALLOWED_PATTERN = re.compile(r"^[A-Za-z0-9]+$")  # 영문 + 숫자만 허용
+from utils import perf
 
-def handle_input(window, raw: str):
-    token = (raw or "").strip()
-    if not token:
-        return
+# 규칙/파싱은 UI 없는 엔진(controller.table_controller)에 있고, 여기서는 결과만 화면에 반영
+from .table_controller import (  # noqa: F401 (기존 import 경로 유지)
+    ERR_INVALID, ERR_NO_ROW, ERR_UPC_CHARS, QTY_PATTERN, UPC_ALLOWED_PATTERN,
+    ScanError, parse_token,
+)
 
-    # 4글자 이상이면 UPC 후보
-    if len(token) >= window.UPC_MIN_LEN:
-        # 영문/숫자 외 문자가 있으면 실패
-        if not UPC_ALLOWED_PATTERN.match(token):
-            QMessageBox.warning(window, "입력 오류", "UPC는 영어와 숫자만 입력 가능합니다.")
-            return
-        handle_upc(window, token)
+def show_step(window, step):
+    """엔진 결과 한 건(ScanBatch | ScanError)을 선택/상태바/경고창으로 표시"""
+    if isinstance(step, ScanError):
+        QMessageBox.warning(window, step.title, step.message)
         return
+    if any(kind == "upc" for kind, _ in step.events):
+        window.select_row(step.row)
 
-    # 1~10 숫자는 수량
-    if QTY_PATTERN.match(token):
-        if window.current_row < 0:
-            QMessageBox.warning(window, "선택 필요", "수량을 더하려면 먼저 행을 선택하거나 UPC를 스캔하세요.")
-            return
-        amount = int(token)
-        window.model.add_qty(window.current_row, amount)
-        window.status_bar.showMessage(f"Qty +{amount}", 2000)
-        return
+    if len(step.events) == 1:
+        kind, value = step.events[0]
+        if kind == "qty":
+            window.status_bar.showMessage(f"Qty +{value}", 2000)
+        elif step.n_new:
+            unknown = " — 카탈로그에 없는 코드" if window.model.is_known(value) is False else ""
+            # 처음 보는 코드 — 한두 글자 잘못 읽힌 기존 UPC일 수 있음
+            similar = window.model.suggest_upc(value)
+            hint = f" — 비슷한 UPC: {', '.join(similar)}" if similar else ""
+            window.status_bar.showMessage(f"신규 UPC 추가: {value}{unknown}{hint}",
+                                          5000 if unknown or hint else 3000)
+        else:
+            # 팝업 없이 조용히 선택만 (상태바 알림이 필요 없으면 이 줄을 제거하세요.)
+            window.status_bar.showMessage(f"UPC 선택됨: {value}", 2000)
+    else:
+        unknown = 0
+        if step.n_new and window.model.catalog() is not None:
+            unknown = len({v for k, v in step.events if k == "upc" and window.model.is_known(v) is False})
+        flag = f", 카탈로그에 없음 {unknown}" if unknown else ""
+        window.status_bar.showMessage(
+            f"스캔 {len(step.events)}건 반영 (신규 UPC {step.n_new}, 수량 {step.n_qty}{flag})", 3000)
+    window.mark_dirty()
 
-    # 그 외는 오류
-    QMessageBox.warning(window, "입력 오류", "유효하지 않은 입력입니다. (UPC ≥ 4글자 또는 1~10 숫자)")
+@perf.timed(slow_ms=50)
+def handle_input(window, raw: str):
+    for step in window.engine.feed([raw], window.current_row):
+        show_step(window, step)
 
+@perf.timed(slow_ms=50)
 def handle_upc(window, upc: str):
-    row = window.model.find_row_by_upc(upc)
-    if row >= 0:
-        # 팝업 없이 조용히 선택만
-        window.select_row(row)
-        # 상태바 알림이 필요 없으면 아래 줄을 제거하세요.
-        window.status_bar.showMessage(f"UPC 선택됨: {upc}", 2000)
-    else:
-        window.model.append_row(upc)
-        window.select_row(len(window.model.dataframe()) - 1)
-        window.status_bar.showMessage(f"신규 UPC 추가: {upc}", 3000)
+    # 정렬/필터 중에도 보기 행 기준으로 선택 (숨겨진 UPC면 필터 해제)
+    window.engine.current_row = window.current_row
+    show_step(window, window.engine.apply([("upc", upc)]))
@@ -0,0 +1,101 @@
+import threading
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+import numpy as np
+
+from model import checkpoint
+from model.journal import base_stat, read_header, replay
+from model.store import RowStore
+
+
+class IoCancelled(Exception):
+    """사용자가 작업을 취소함"""
+
+
+class _Signals(QObject):
+    progress = pyqtSignal(int)        # 처리한 행 수
+    finished = pyqtSignal(object)     # 작업 결과
+    failed = pyqtSignal(str)          # 오류 메세지
+    cancelled = pyqtSignal()
+
+
+class IoWorker(QRunnable):
+    """QThreadPool에서 import/export 실행
+
+    fn(*args, progress=cb) 형태로 호출한다. cb(rows)가 진행 상황을 알리고,
+    취소 요청 시 cb 안에서 IoCancelled를 던져 작업을 중단시킨다.
+    시그널은 GUI 스레드의 수신 객체로 큐잉되어 전달된다.
+    """
+    def __init__(self, fn, *args):
+        super().__init__()
+        self.signals = _Signals()
+        self._fn = fn
+        self._args = args
+        self._cancel = threading.Event()
+
+    def cancel(self):
+        self._cancel.set()
+
+    def is_cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    def _progress(self, rows: int):
+        if self._cancel.is_set():
+            raise IoCancelled()
+        self.signals.progress.emit(int(rows))
+
+    def run(self):
+        try:
+            result = self._fn(*self._args, progress=self._progress)
+        except IoCancelled:
+            self.signals.cancelled.emit()
+            return
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit(result)
+
+
+def load_with_journal(import_store, base: str | None, journal_path: str, progress=None):
+    """마지막 저장 파일(base) + 자동 저장 체크포인트 위에 저널을 재생
+
+    (store, 저널로 바뀐 행 번호 배열)을 돌려준다.
+    """
+    header = read_header(journal_path)[0]
+    store = import_store(base, progress=progress) if base else RowStore()
+
+    start = 0
+    ck = header.get("checkpoint")
+    ck_path = checkpoint.checkpoint_path(base)
+    meta = checkpoint.read_meta(ck_path)
+    if meta is not None and checkpoint.same_base(meta, header):
+        seq = ck["seq"] if ck else 0
+        if meta["seq"] == seq + 1:
+            # 체크포인트 기록 직후 저널 정리 전에 종료됨 → 체크포인트 이후 레코드만 재생
+            start = meta["journal_mark"]
+        elif meta["seq"] != seq:
+            raise ValueError("자동 저장 파일과 저널이 맞지 않습니다.")
+        checkpoint.apply_overlay(ck_path, store)
+    elif ck:
+        raise ValueError(f"자동 저장 파일을 찾을 수 없습니다: {ck_path}")
+
+    touched: list = []
+    replay(journal_path, store, start, touched)
+    if progress:
+        progress(len(store))
+    rows = np.unique(np.concatenate(touched)) if touched else np.empty(0, dtype=np.int64)
+    return store, rows[rows < len(store)]   # 되돌리기로 지운 행 제외
+
+
+def write_autosave(workbook: str | None, snapshot: tuple, n_rows: int, journal=None,
+                   journal_mark: int = 0, generation: int = 0, progress=None) -> int:
+    """바뀐 행만 체크포인트에 기록하고, 저널을 체크포인트 이후 레코드로 정리"""
+    path = checkpoint.checkpoint_path(workbook)
+    stat = base_stat(workbook)
+    rows, upc, qty, ts = snapshot
+    seq = checkpoint.write_rows(path, stat, journal_mark, n_rows, rows, upc, qty, ts)
+    if journal is not None:
+        journal.compact(workbook, journal_mark, {"path": path, "seq": seq}, generation)
+    if progress:
+        progress(len(rows))
+    return seq
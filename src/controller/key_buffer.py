@@ -0,0 +1,36 @@
+class KeyBuffer:
+    """키 입력 버퍼 — 스캐너 연사(burst)를 키 간격으로 감지
+
+    글자는 미리 잡아 둔 리스트에 쌓고(모자라면 두 배로 늘림), push()는 화면을
+    지금 갱신해야 하는지만 알려준다. 직전 키와의 간격이 burst_gap_ms보다 짧으면
+    스캐너 입력으로 보고 False — 창은 Enter나 짧은 유휴 타이머에서 한 번만 그린다.
+    사람이 치는 속도면 매 키 True (기존 동작). burst_gap_ms=0이면 감지 끔.
+    """
+    CAPACITY = 64
+
+    def __init__(self, burst_gap_ms: float = 30):
+        self.burst_gap = burst_gap_ms / 1000
+        self._chars = [""] * self.CAPACITY
+        self._n = 0
+        self._last = float("-inf")    # 직전 키 시각 (초)
+        self.in_burst = False
+
+    def __len__(self) -> int:
+        return self._n
+
+    def push(self, ch: str, now: float) -> bool:
+        """글자 추가 → 화면을 바로 갱신할지"""
+        if self._n == len(self._chars):
+            self._chars.extend([""] * len(self._chars))
+        self._chars[self._n] = ch
+        self._n += 1
+        self.in_burst = now - self._last < self.burst_gap
+        self._last = now
+        return not self.in_burst
+
+    def text(self) -> str:
+        return "".join(self._chars[:self._n])
+
+    def clear(self):
+        self._n = 0
+        self.in_burst = False
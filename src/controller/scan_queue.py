@@ -0,0 +1,38 @@
+from PyQt6.QtCore import QObject, QTimer
+
+from utils import perf
+from .input_handler import show_step
+
+
+class ScanQueue(QObject):
+    """스캔 입력 대기열
+
+    push()로 들어온 입력을 이벤트 루프 한 틱 동안 모았다가 drain()에서
+    window.engine(ScanEngine)으로 한 번에 반영한다. 선택/상태바 갱신도 묶음당 한 번.
+    """
+    def __init__(self, window):
+        super().__init__(window)
+        self._window = window
+        self._pending: list[str] = []
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(lambda: self.drain())   # 계측(utils.perf) 교체가 보이도록
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def push(self, raw: str):
+        self._pending.append(raw)
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def drain(self):
+        w = self._window
+        tokens, self._pending = self._pending, []
+        # 오류 전까지는 반영하고 경고 후 계속 (엔진이 오류에서 묶음을 끊는다)
+        for step in w.engine.feed(tokens, w.current_row):
+            show_step(w, step)
+
+
+perf.register(ScanQueue, "drain", slow_ms=50)
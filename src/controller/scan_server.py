@@ -0,0 +1,332 @@
+import asyncio
+import hmac
+import ipaddress
+import queue
+import threading
+import time
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+from .table_controller import ERR_NO_ROW, parse_token
+
+
+class _Client:
+    """스캐너 한 대의 상태 — 수량은 그 스캐너가 마지막으로 찍은 UPC에 더한다"""
+    def __init__(self, name: str = ""):
+        self.name = name    # 스캔 로그의 스테이션 이름 (보낸 호스트 주소)
+        self.last_upc: str | None = None
+
+    def parse(self, raw: str, upc_min_len: int):
+        """(이벤트 | None, 오류 메세지 | None) — 검증 규칙은 handle_input과 같다"""
+        parsed = parse_token(raw, upc_min_len)
+        if parsed is None:
+            return None, None
+        kind, value = parsed
+        if kind == "error":
+            return None, value[1]
+        if kind == "upc":
+            self.last_upc = value
+            return [("upc", value)], None
+        if self.last_upc is None:
+            return None, ERR_NO_ROW[1]
+        # 다른 스캐너와 섞여도 되도록 항상 UPC를 앞에 붙인다
+        return [("upc", self.last_upc), ("qty", value)], None
+
+
+def _station_name(addr) -> str:
+    """스테이션은 호스트 단위 — 포트는 재접속/UDP 소스 포트마다 바뀌므로 쓰지 않는다"""
+    return str(addr[0]) if addr else "?"
+
+
+def is_loopback(host: str) -> bool:
+    """이 PC에서만 접속할 수 있는 주소인지 ("localhost" 포함)"""
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def _auth_line(raw: str, token: str) -> bool:
+    """첫 줄이 "AUTH <토큰>"인지 (비교는 상수 시간)"""
+    word, _, value = raw.strip().partition(" ")
+    return word.upper() == "AUTH" and hmac.compare_digest(value.strip().encode("utf-8"), token.encode("utf-8"))
+
+
+def _resolve(futures, result: str):
+    for fut in futures:
+        if not fut.done():
+            fut.set_result(result)
+
+
+class ScanServer(QObject):
+    """여러 스캐너에서 네트워크로 들어오는 스캔을 받아 모델에 반영
+
+    TCP: 한 줄에 토큰 하나, 줄마다 순서대로 "OK" / "ERR <메세지>" 응답.
+    UDP: 데이터그램의 줄마다 "OK <토큰>" / "ERR <토큰> <메세지>" / "BUSY <토큰>" 응답.
+    asyncio 루프는 별도 스레드에서 돌고, 검증을 통과한 스캔만 스레드 안전 큐에 넣는다.
+    GUI 스레드는 큐를 한 번에 비워 model.apply_scans로 일괄 반영한 뒤 ack를 보낸다.
+    큐가 차면 TCP는 읽기를 멈추고(back-pressure) UDP는 BUSY로 거절한다.
+
+    접근 제한: allow(IP/네트워크 목록)가 있으면 그 밖의 주소는 받지 않는다 (루프백은 항상 허용).
+    token이 있으면 TCP는 연결 첫 줄, UDP는 데이터그램마다 첫 줄에 "AUTH <토큰>"을 보내야 한다.
+    """
+    MAX_QUEUE = 10_000       # GUI 반영 대기 스캔 상한
+    MAX_IN_FLIGHT = 256      # TCP 연결당 ack 대기 상한
+    MAX_BATCH = 5_000        # GUI 틱당 반영 상한
+    UDP_IDLE_S = 600.0       # 이 시간 동안 조용한 UDP 스캐너 상태는 버림
+    MAX_UDP_CLIENTS = 1_024  # UDP 스캐너 상태 상한 (오래된 것부터 버림)
+
+    applied = pyqtSignal(int)    # 반영한 스캔 수
+    _ready = pyqtSignal()
+
+    def __init__(self, model, host: str = "127.0.0.1", port: int = 0, udp_port: int | None = None,
+                 upc_min_len: int = 4, token: str | None = None, allow=None, parent=None):
+        super().__init__(parent)
+        self._model = model
+        self._host, self._port, self._udp_port = host, port, udp_port
+        self._token = token or None
+        # 잘못된 주소는 ValueError — start() 전에 바로 알린다
+        self._allow = [ipaddress.ip_network(a.strip(), strict=False) for a in allow] if allow else None
+        self._upc_min_len = upc_min_len
+        self._queue: queue.Queue = queue.Queue(self.MAX_QUEUE)
+        self._lock = threading.Lock()
+        self._scheduled = False
+        self._paused = False
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._stopped: asyncio.Event | None = None
+        self._conns: set = set()    # 열린 TCP 연결의 처리 task
+        self.address: tuple[str, int] | None = None       # 실제 TCP 주소 (port=0이면 자동 할당)
+        self.udp_address: tuple[str, int] | None = None
+        self._ready.connect(self._drain)
+
+    # --- 시작/종료 (GUI 스레드) ---
+    def start(self):
+        """리스너 스레드 시작 — 포트를 열 때까지 기다리고 실패하면 예외"""
+        started = threading.Event()
+        failure: list[BaseException] = []
+
+        def run():
+            loop = asyncio.new_event_loop()
+            self._loop = loop
+            try:
+                loop.run_until_complete(self._serve(started))
+            except BaseException as e:   # 바인드 실패 등
+                failure.append(e)
+                started.set()
+            finally:
+                loop.close()
+
+        self._thread = threading.Thread(target=run, name="scan-server", daemon=True)
+        self._thread.start()
+        started.wait()
+        if failure:
+            self._thread.join()
+            self._thread = None
+            raise failure[0]
+
+    def stop(self):
+        if self._thread is None:
+            return
+        try:
+            self._loop.call_soon_threadsafe(self._stopped.set)
+        except RuntimeError:
+            pass
+        self._thread.join()
+        self._thread = None
+        self.address = self.udp_address = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def set_paused(self, on: bool):
+        """파일을 여는 동안은 반영을 멈춘다 (큐가 차면 클라이언트 쪽이 기다림)"""
+        self._paused = bool(on)
+        if not on:
+            self._notify()
+
+    def _allowed(self, addr) -> bool:
+        if self._allow is None:
+            return True
+        if not addr:
+            return False
+        try:
+            ip = ipaddress.ip_address(addr[0].split("%")[0])
+        except ValueError:
+            return False
+        if ip.version == 6 and ip.ipv4_mapped is not None:
+            ip = ip.ipv4_mapped
+        return ip.is_loopback or any(ip in net for net in self._allow)
+
+    # --- 네트워크 스레드 ---
+    async def _serve(self, started: threading.Event):
+        self._stopped = asyncio.Event()
+        tcp = await asyncio.start_server(self._handle_tcp, self._host, self._port)
+        self.address = tcp.sockets[0].getsockname()[:2]
+        udp = None
+        if self._udp_port is not None:
+            udp, _ = await asyncio.get_running_loop().create_datagram_endpoint(
+                lambda: _UdpProtocol(self), local_addr=(self._host, self._udp_port))
+            self.udp_address = udp.get_extra_info("sockname")[:2]
+        started.set()
+        try:
+            await self._stopped.wait()
+        finally:
+            tcp.close()
+            if udp is not None:
+                udp.close()
+            for task in list(self._conns):
+                task.cancel()
+            await asyncio.gather(*self._conns, return_exceptions=True)
+            await tcp.wait_closed()
+
+    def _notify(self):
+        with self._lock:
+            if self._scheduled:
+                return
+            self._scheduled = True
+        self._ready.emit()    # 다른 스레드에서 emit → GUI 스레드로 큐잉
+
+    def _offer(self, events: list, fut, station: str) -> bool:
+        try:
+            self._queue.put_nowait((events, fut, station))
+        except queue.Full:
+            return False
+        self._notify()
+        return True
+
+    async def _submit(self, client: _Client, raw: str):
+        """한 줄 처리 → ack를 받을 future (빈 줄이면 None)"""
+        events, err = client.parse(raw, self._upc_min_len)
+        if events is None and err is None:
+            return None
+        fut = asyncio.get_running_loop().create_future()
+        if err is not None:
+            fut.set_result(f"ERR {err}")
+            return fut
+        while not self._offer(events, fut, client.name):
+            await asyncio.sleep(0.002)   # 큐가 가득 참 → 이 연결의 읽기를 잠시 멈춤
+        return fut
+
+    async def _handle_tcp(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        peer = writer.get_extra_info("peername")
+        if not self._allowed(peer):
+            writer.close()   # 허용 목록 밖 → 응답 없이 끊음
+            return
+        task = asyncio.current_task()
+        self._conns.add(task)
+        client = _Client(_station_name(peer))
+        acks: asyncio.Queue = asyncio.Queue(self.MAX_IN_FLIGHT)
+        sender = None
+        try:
+            if self._token is not None:
+                if not _auth_line((await reader.readline()).decode("utf-8", "replace"), self._token):
+                    writer.write(b"ERR AUTH\n")
+                    await writer.drain()
+                    return
+                writer.write(b"OK\n")
+            sender = asyncio.create_task(self._send_acks(acks, writer))
+            while not sender.done():
+                line = await reader.readline()
+                if not line:
+                    break
+                fut = await self._submit(client, line.decode("utf-8", "replace"))
+                if fut is not None:
+                    await acks.put(fut)   # ack 대기가 가득 차면 읽기를 멈춤
+            # 연결 종료 → 남은 ack를 모두 보낸 뒤 닫는다
+            await acks.put(None)
+            await sender
+        except (ConnectionError, asyncio.CancelledError):
+            pass   # 연결 끊김 / stop()에 의한 종료
+        finally:
+            if sender is not None:
+                sender.cancel()
+            writer.close()
+            self._conns.discard(task)
+
+    async def _send_acks(self, acks: asyncio.Queue, writer: asyncio.StreamWriter):
+        while (fut := await acks.get()) is not None:
+            writer.write((await fut).encode("utf-8") + b"\n")
+            if acks.empty():
+                await writer.drain()
+
+    # --- GUI 스레드 ---
+    def _drain(self):
+        with self._lock:
+            self._scheduled = False
+        if self._paused:
+            return
+        items = []
+        try:
+            while len(items) < self.MAX_BATCH:
+                items.append(self._queue.get_nowait())
+        except queue.Empty:
+            pass
+        if not items:
+            return
+        events = [e for ev, _, _ in items for e in ev]
+        # 스캔 로그에는 이벤트마다 보낸 스캐너(스테이션) 번호를 함께 남긴다
+        log = self._model.scan_log()
+        stations = [log.station_id(name) for ev, _, name in items for _ in ev]
+        # 네트워크 스캔은 화면 선택/필터를 건드리지 않는다
+        self._model.apply_scans(events, -1, reveal=False, stations=stations)
+        try:
+            self._loop.call_soon_threadsafe(_resolve, [fut for _, fut, _ in items], "OK")
+        except RuntimeError:
+            pass   # 서버가 이미 멈춤
+        self.applied.emit(len(items))
+        if not self._queue.empty():
+            QTimer.singleShot(0, self._notify)
+
+
+class _UdpProtocol(asyncio.DatagramProtocol):
+    def __init__(self, server: ScanServer):
+        self._server = server
+        self._clients: dict = {}    # addr -> (_Client, 마지막 수신 시각) — 오래된 것이 앞
+        self.transport = None
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def _client(self, addr) -> _Client:
+        now = time.monotonic()
+        entry = self._clients.pop(addr, None)
+        client = entry[0] if entry is not None else _Client(_station_name(addr))
+        self._clients[addr] = (client, now)   # 맨 뒤로 → 앞쪽이 가장 오래 조용한 스캐너
+        # 오래 조용했거나 상한을 넘은 스캐너 상태를 앞에서부터 버린다 (다시 오면 UPC부터 찍어야 함)
+        cutoff = now - self._server.UDP_IDLE_S
+        while self._clients:
+            old = next(iter(self._clients))
+            if len(self._clients) <= self._server.MAX_UDP_CLIENTS and self._clients[old][1] >= cutoff:
+                break
+            del self._clients[old]
+        return client
+
+    def datagram_received(self, data: bytes, addr):
+        if not self._server._allowed(addr):
+            return
+        lines = data.decode("utf-8", "replace").splitlines()
+        secret = self._server._token
+        if secret is not None:
+            if not lines or not _auth_line(lines[0], secret):
+                self.transport.sendto(b"ERR AUTH", addr)
+                return
+            lines = lines[1:]
+        client = self._client(addr)
+        for raw in lines:
+            events, err = client.parse(raw, self._server._upc_min_len)
+            token = raw.strip()
+            if err is not None:
+                self.transport.sendto(f"ERR {token} {err}".encode("utf-8"), addr)
+                continue
+            if events is None:
+                continue
+            fut = asyncio.get_running_loop().create_future()
+            if not self._server._offer(events, fut, client.name):
+                self.transport.sendto(f"BUSY {token}".encode("utf-8"), addr)
+                continue
+            fut.add_done_callback(
+                lambda f, token=token: self.transport.sendto(f"{f.result()} {token}".encode("utf-8"), addr))
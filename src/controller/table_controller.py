@@ -0,0 +1,168 @@
+import re
+from typing import Iterable, Iterator, NamedTuple
+
+import numpy as np
+
+from model.store import RowStore, now_ns
+
+# ✅ UI 없는 스캔 처리 엔진 — GUI(ScanQueue/handle_input)와 CLI가 같은 규칙을 쓴다
+
+QTY_PATTERN = re.compile(r"^(?:10|[1-9])$")
+UPC_ALLOWED_PATTERN = re.compile(r"^[A-Za-z0-9]+$")  # 영문 + 숫자만 허용
+
+ERR_UPC_CHARS = ("입력 오류", "UPC는 영어와 숫자만 입력 가능합니다.")
+ERR_NO_ROW = ("선택 필요", "수량을 더하려면 먼저 행을 선택하거나 UPC를 스캔하세요.")
+ERR_INVALID = ("입력 오류", "유효하지 않은 입력입니다. (UPC ≥ 4글자 또는 1~10 숫자)")
+
+def parse_token(raw: str, upc_min_len: int = 4):
+    """입력 한 건 해석 → ("upc", 코드) | ("qty", 수량) | ("error", (제목, 메세지)) | None(빈 입력)"""
+    token = (raw or "").strip()
+    if not token:
+        return None
+
+    # 4글자 이상이면 UPC 후보
+    if len(token) >= upc_min_len:
+        # 영문/숫자 외 문자가 있으면 실패
+        if not UPC_ALLOWED_PATTERN.match(token):
+            return "error", ERR_UPC_CHARS
+        return "upc", token
+
+    # 1~10 숫자는 수량
+    if QTY_PATTERN.match(token):
+        return "qty", int(token)
+
+    # 그 외는 오류
+    return "error", ERR_INVALID
+
+
+class ScanBatch(NamedTuple):
+    """오류 없이 이어진 입력 묶음의 반영 결과"""
+    events: list      # [("upc", 코드) | ("qty", 수량)]
+    row: int          # 반영 후 현재 행 (-1: 없음)
+    n_new: int        # 신규 UPC 수
+    n_qty: int        # 수량 이벤트 수
+
+
+class ScanError(NamedTuple):
+    line: int         # 입력 순번 (0부터)
+    token: str
+    title: str
+    message: str
+
+
+class ScanReport(NamedTuple):
+    lines: int
+    n_new: int
+    n_qty: int
+    errors: list      # [ScanError]
+
+
+class StoreTarget:
+    """Qt 없이 RowStore에 직접 반영하는 대상 (CLI/서버용)
+
+    DataFrameModel.apply_scans와 같은 의미 — 신규 UPC는 한 번에 추가,
+    수량은 np.add.at으로 모아서 더한다. 행 번호는 입력 순서 그대로.
+    """
+    def __init__(self, store: RowStore | None = None):
+        self.store = store if store is not None else RowStore()
+        self._upc_index: dict[str, int] = {}
+        for row, upc in enumerate(self.store.upc_column().tolist()):
+            if upc is not None:
+                self._upc_index.setdefault(str(upc), row)
+
+    def find_row_by_upc(self, upc: str) -> int:
+        return self._upc_index.get(str(upc), -1)
+
+    def apply_scans(self, events: list[tuple[str, object]], current_row: int,
+                    reveal: bool = True) -> tuple[int, int, int]:
+        ts = now_ns()
+        new: list[str] = []
+        for kind, value in events:
+            if kind == "upc" and value not in self._upc_index:
+                self._upc_index[value] = len(self.store) + len(new)
+                new.append(value)
+        if new:
+            self.store.extend(new, np.zeros(len(new), dtype=np.int64), np.full(len(new), ts, dtype=np.int64))
+
+        row = current_row
+        rows: list[int] = []
+        amounts: list[int] = []
+        n = len(self.store)
+        for kind, value in events:
+            if kind == "upc":
+                row = self._upc_index[value]
+            elif 0 <= row < n:
+                rows.append(row)
+                amounts.append(value)
+        if rows:
+            np.add.at(self.store.qty_column(), rows, amounts)
+            self.store.ts_column()[rows] = ts
+        return row, len(new), len(rows)
+
+
+class ScanEngine:
+    """토큰을 검증해 target.apply_scans로 반영하고 구조화된 결과를 돌려준다
+
+    target은 apply_scans(events, current_row)를 가진 객체
+    (GUI: DataFrameModel, CLI: StoreTarget). 오류 토큰에서 묶음을 끊어
+    앞부분을 반영한 뒤 ScanError를 내고 계속한다 — 기존 입력 규칙과 같다.
+    """
+    MAX_BATCH = 50_000   # 한 번에 반영할 최대 이벤트 수 (대용량 로그의 메모리 상한)
+
+    def __init__(self, target, upc_min_len: int = 4):
+        self.target = target
+        self.upc_min_len = upc_min_len
+        self.current_row = -1
+        self.lines = 0          # 지금까지 읽은 입력 줄 수
+
+    def apply(self, events: list[tuple[str, object]]) -> ScanBatch:
+        row, n_new, n_qty = self.target.apply_scans(events, self.current_row)
+        self.current_row = row
+        return ScanBatch(events, row, n_new, n_qty)
+
+    def feed(self, tokens: Iterable[str], current_row: int | None = None, start: int = 0) -> Iterator[ScanBatch | ScanError]:
+        """토큰들을 순서대로 처리 — 반복하는 동안 묶음 단위로 반영된다
+
+        current_row가 주어지면 그 행에서 시작 (GUI 선택 행), start는 오류 줄 번호 기준.
+        """
+        if current_row is not None:
+            self.current_row = current_row
+        events: list[tuple[str, object]] = []
+        has_row = self.current_row >= 0
+        for line, raw in enumerate(tokens, start):
+            self.lines += 1
+            parsed = parse_token(raw, self.upc_min_len)
+            if parsed is None:
+                continue
+            kind, value = parsed
+            if kind == "qty" and not has_row:
+                kind, value = "error", ERR_NO_ROW
+            if kind == "error":
+                # 오류 전까지는 반영하고 오류를 알린 뒤 계속
+                if events:
+                    yield self.apply(events)
+                    events = []
+                yield ScanError(line, raw, *value)
+                has_row = self.current_row >= 0
+                continue
+            if kind == "upc":
+                has_row = True
+            events.append((kind, value))
+            if len(events) >= self.MAX_BATCH:
+                yield self.apply(events)
+                events = []
+        if events:
+            yield self.apply(events)
+
+    def run(self, tokens: Iterable[str], start: int = 0) -> ScanReport:
+        """모두 반영하고 합계만 돌려준다 (배치 처리용)"""
+        lines = self.lines
+        n_new = n_qty = 0
+        errors: list[ScanError] = []
+        for step in self.feed(tokens, start=start):
+            if isinstance(step, ScanError):
+                errors.append(step)
+            else:
+                n_new += step.n_new
+                n_qty += step.n_qty
+        return ScanReport(self.lines - lines, n_new, n_qty, errors)
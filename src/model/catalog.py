@@ -0,0 +1,235 @@
+import csv
+import mmap
+import os
+import re
+import struct
+from typing import NamedTuple
+
+import numpy as np
+
+# 제품 카탈로그: UPC → 설명 / 예상 수량 (수백만 건)
+# xlsx/CSV에서 한 번 가져와 정렬된 이진 인덱스로 저장하고, 조회는 메모리 매핑 + 이진 탐색.
+# 시작할 때 RAM에 올리지 않으며 조회는 건당 수 µs (OS 페이지 캐시가 필요한 부분만 읽음).
+#
+# 파일 구조 (리틀 엔디언, 각 구역은 8바이트 정렬):
+#   헤더 64바이트   MAGIC | version u32 | width u32 | count u64 | blob_size u64
+#   keys           count × S{width}    UPC (대문자, 오름차순, NUL 채움)
+#   expected       count × int64       예상 수량 (-1: 없음)
+#   offsets        (count+1) × int64   설명 blob 안의 시작 위치
+#   blob           UTF-8 설명을 이어 붙인 것
+
+MAGIC = b"UPCCAT\x00\x01"
+VERSION = 1
+HEADER_SIZE = 64
+_HEADER = struct.Struct("<8sIIQQ")
+CHUNK_ROWS = 50_000    # 가져오기 진행 알림 단위
+
+# 원본 머리글 (대소문자/공백 무시) — UPC는 필수
+UPC_HEADERS = ("UPC",)
+DESC_HEADERS = ("DESCRIPTION", "DESC", "NAME", "PRODUCT")
+EXPECTED_HEADERS = ("EXPECTEDQTY", "EXPECTED", "QTY")
+
+_re_upc = re.compile(r"^[A-Z0-9]+$")
+
+
+class CatalogEntry(NamedTuple):
+    description: str
+    expected: int      # 예상 수량 (-1: 없음)
+
+
+class CatalogBuild(NamedTuple):
+    path: str
+    count: int         # 인덱스에 들어간 UPC 수
+    invalid: int       # 형식이 틀려 건너뛴 행
+    duplicates: int    # 중복 UPC (마지막 행 사용)
+
+
+def default_catalog_path() -> str:
+    return os.path.join(os.path.expanduser("~"), ".upc_counter", "catalog.upccat")
+
+
+def normalize(upc) -> bytes | None:
+    """조회 키: 공백 제거 + 대문자, ASCII 영문/숫자가 아니면 None"""
+    s = str(upc).strip().upper()
+    return s.encode("ascii") if s and _re_upc.match(s) else None
+
+
+def _align(n: int) -> int:
+    return (n + 7) & ~7
+
+
+def _column(header: list, names: tuple) -> int | None:
+    norm = [str(h or "").replace(" ", "").replace("_", "").upper() for h in header]
+    for name in names:
+        if name in norm:
+            return norm.index(name)
+    return None
+
+
+def _read_rows(path: str):
+    """(머리글, 행 iterator) — CSV는 csv 모듈, xlsx는 openpyxl read-only 스트리밍"""
+    if path.lower().endswith((".csv", ".txt")):
+        f = open(path, newline="", encoding="utf-8-sig")
+        rows = csv.reader(f)
+        return next(rows, []), rows, f
+    from openpyxl import load_workbook
+    wb = load_workbook(path, read_only=True, data_only=True)
+    rows = wb.active.iter_rows(values_only=True)
+    return list(next(rows, ())), rows, wb
+
+
+def _to_expected(v) -> int:
+    if v is None or v == "":
+        return -1
+    try:
+        f = float(v)
+    except (TypeError, ValueError):
+        return -1
+    return int(f) if f.is_integer() and f >= 0 else -1
+
+
+def build_catalog(src: str, dest: str | None = None, min_len: int = 4, progress=None) -> CatalogBuild:
+    """xlsx/CSV → 정렬된 이진 인덱스 (임시 파일에 쓴 뒤 교체)
+
+    UPC는 공백 제거 + 대문자, 영문/숫자 min_len자 이상만. 중복 UPC는 마지막 행이 이긴다.
+    progress(rows)는 CHUNK_ROWS행마다 호출된다 (IoWorker 취소 지점).
+    """
+    dest = dest or default_catalog_path()
+    header, rows, handle = _read_rows(src)
+    c_upc = _column(header, UPC_HEADERS)
+    if c_upc is None:
+        handle.close()
+        raise ValueError("카탈로그에 'UPC' 열이 없습니다.")
+    c_desc = _column(header, DESC_HEADERS)
+    c_exp = _column(header, EXPECTED_HEADERS)
+
+    keys: list[bytes] = []
+    descs: list[bytes] = []
+    expected: list[int] = []
+    invalid = 0
+    try:
+        for n, row in enumerate(rows, 1):
+            key = normalize(row[c_upc]) if c_upc < len(row) and row[c_upc] is not None else None
+            if key is None or len(key) < min_len:
+                invalid += 1
+            else:
+                keys.append(key)
+                desc = row[c_desc] if c_desc is not None and c_desc < len(row) else None
+                descs.append(b"" if desc is None else str(desc).strip().encode("utf-8"))
+                expected.append(_to_expected(row[c_exp]) if c_exp is not None and c_exp < len(row) else -1)
+            if progress and n % CHUNK_ROWS == 0:
+                progress(n)
+    finally:
+        handle.close()
+
+    width = max(map(len, keys), default=1)
+    karr = np.array(keys, dtype=f"S{width}")
+    order = np.argsort(karr, kind="stable")
+    sk = karr[order]
+    # 같은 UPC 묶음의 마지막 행만 남김
+    last = np.append(sk[1:] != sk[:-1], True) if len(sk) else np.zeros(0, dtype=bool)
+    sel = order[last]
+    karr = karr[sel]
+    exp = np.asarray(expected, dtype="<i8")[sel] if len(sel) else np.zeros(0, dtype="<i8")
+    blobs = [descs[i] for i in sel.tolist()]
+    offsets = np.zeros(len(blobs) + 1, dtype="<i8")
+    np.cumsum(np.fromiter(map(len, blobs), dtype=np.int64, count=len(blobs)), out=offsets[1:])
+    blob = b"".join(blobs)
+
+    os.makedirs(os.path.dirname(os.path.abspath(dest)), exist_ok=True)
+    tmp = dest + ".tmp"
+    try:
+        with open(tmp, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, VERSION, width, len(karr), len(blob)).ljust(HEADER_SIZE, b"\0"))
+            for part in (karr.tobytes(), exp.tobytes(), offsets.tobytes()):
+                f.write(part)
+                f.write(b"\0" * (_align(len(part)) - len(part)))
+            f.write(blob)
+        os.replace(tmp, dest)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+    return CatalogBuild(dest, len(karr), invalid, len(keys) - len(karr))
+
+
+class Catalog:
+    """build_catalog로 만든 인덱스를 메모리 매핑으로 조회 (읽기 전용)"""
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:   # 빈 파일
+            self._file.close()
+            raise ValueError(f"카탈로그 파일이 아닙니다: {path}")
+        try:
+            self._map()
+        except ValueError:
+            self.close()
+            raise
+
+    def _map(self):
+        if len(self._mm) < HEADER_SIZE:
+            raise ValueError(f"카탈로그 파일이 아닙니다: {self.path}")
+        magic, version, width, count, blob_size = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"카탈로그 파일이 아닙니다: {self.path}")
+        pos = HEADER_SIZE
+        k_end = pos + _align(count * width)
+        e_end = k_end + _align(count * 8)
+        o_end = e_end + _align((count + 1) * 8)
+        if o_end + blob_size != len(self._mm):
+            raise ValueError(f"카탈로그 파일이 손상되었습니다: {self.path}")
+        self._width = width
+        self._keys = np.frombuffer(self._mm, dtype=f"S{width}", count=count, offset=pos)
+        self._expected = np.frombuffer(self._mm, dtype="<i8", count=count, offset=k_end)
+        self._offsets = np.frombuffer(self._mm, dtype="<i8", count=count + 1, offset=e_end)
+        self._blob = o_end
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, upc) -> bool:
+        return self.index(upc) >= 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        # frombuffer 배열이 mmap을 잡고 있으므로 먼저 놓는다
+        self._keys = self._expected = self._offsets = None
+        if getattr(self, "_mm", None) is not None:
+            self._mm.close()
+            self._mm = None
+        self._file.close()
+
+    def index(self, upc) -> int:
+        """UPC의 인덱스 위치 (-1: 없음) — 이진 탐색, 건드리는 페이지만 읽음"""
+        key = normalize(upc)
+        if key is None or len(key) > self._width:
+            return -1
+        i = int(np.searchsorted(self._keys, key))
+        return i if i < len(self._keys) and self._keys[i] == key else -1
+
+    def index_many(self, upcs) -> np.ndarray:
+        """여러 UPC를 한 번에 (정렬/보고서용) — 없으면 -1"""
+        width = self._width
+        keys = np.array([k if k and len(k) <= width else b"" for k in map(normalize, upcs)], dtype=f"S{width}")
+        if not len(self._keys):
+            return np.full(len(keys), -1, dtype=np.int64)
+        idx = np.minimum(np.searchsorted(self._keys, keys), len(self._keys) - 1)
+        return np.where(self._keys[idx] == keys, idx, -1)
+
+    def description(self, i: int) -> str:
+        a, b = int(self._offsets[i]), int(self._offsets[i + 1])
+        return self._mm[self._blob + a:self._blob + b].decode("utf-8")
+
+    def expected(self, i: int) -> int:
+        return int(self._expected[i])
+
+    def lookup(self, upc) -> CatalogEntry | None:
+        i = self.index(upc)
+        return None if i < 0 else CatalogEntry(self.description(i), self.expected(i))
@@ -0,0 +1,107 @@
+import json
+import os
+import sqlite3
+import numpy as np
+
+from .store import RowStore
+
+# 자동 저장 체크포인트: 기준 workbook 대비 바뀐 행만 담는 SQLite 사이드카
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS rows (row INTEGER PRIMARY KEY, upc TEXT, qty INTEGER, ts INTEGER);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+
+def checkpoint_path(workbook: str | None) -> str:
+    if workbook:
+        return workbook + ".autosave.sqlite"
+    return os.path.join(os.path.expanduser("~"), ".upc_counter", "untitled.autosave.sqlite")
+
+
+def _connect(path: str) -> sqlite3.Connection:
+    con = sqlite3.connect(path)
+    con.execute("PRAGMA journal_mode=WAL")
+    con.execute("PRAGMA synchronous=FULL")
+    con.executescript(_SCHEMA)
+    return con
+
+
+def read_meta(path: str) -> dict | None:
+    if not os.path.exists(path):
+        return None
+    try:
+        con = sqlite3.connect(path)
+        try:
+            row = con.execute("SELECT value FROM meta WHERE key='meta'").fetchone()
+        finally:
+            con.close()
+    except sqlite3.Error:
+        return None
+    return json.loads(row[0]) if row else None
+
+
+def same_base(meta: dict, base_stat: dict) -> bool:
+    return all(meta.get(k) == base_stat.get(k) for k in ("base", "mtime_ns", "size"))
+
+
+def write_rows(path: str, base_stat: dict, journal_mark: int, n_rows: int,
+               rows, upc, qty, ts) -> int:
+    """바뀐 행만 INSERT OR REPLACE — 비용은 바뀐 행 수에 비례. 새 seq를 돌려준다"""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    con = _connect(path)
+    try:
+        with con:
+            row = con.execute("SELECT value FROM meta WHERE key='meta'").fetchone()
+            meta = json.loads(row[0]) if row else None
+            if meta is None or not same_base(meta, base_stat):
+                # 기준 파일이 바뀌었으면 이전 체크포인트는 의미 없음
+                con.execute("DELETE FROM rows")
+                seq = 1
+            else:
+                seq = meta["seq"] + 1
+                # 되돌리기로 지운 끝 행
+                con.execute("DELETE FROM rows WHERE row >= ?", (int(n_rows),))
+            con.executemany(
+                "INSERT OR REPLACE INTO rows (row, upc, qty, ts) VALUES (?, ?, ?, ?)",
+                zip(np.asarray(rows).tolist(), list(upc), np.asarray(qty).tolist(), np.asarray(ts).tolist()),
+            )
+            meta = dict(base_stat, seq=seq, journal_mark=int(journal_mark), n_rows=int(n_rows))
+            con.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('meta', ?)", (json.dumps(meta),))
+    finally:
+        con.close()
+    return seq
+
+
+def apply_overlay(path: str, store: RowStore) -> dict:
+    """체크포인트의 행 값을 store(기준 workbook 내용)에 덮어쓴다"""
+    con = sqlite3.connect(path)
+    try:
+        meta = json.loads(con.execute("SELECT value FROM meta WHERE key='meta'").fetchone()[0])
+        data = con.execute("SELECT row, upc, qty, ts FROM rows ORDER BY row").fetchall()
+    finally:
+        con.close()
+    if not data:
+        return meta
+    rows, upc, qty, ts = zip(*data)
+    rows = np.array(rows, dtype=np.int64)
+    upc = np.array(upc, dtype=object)
+    qty = np.array(qty, dtype=np.int64)
+    ts = np.array(ts, dtype=np.int64)
+
+    base_n = len(store)
+    old = rows < base_n
+    store.upc_column()[rows[old]] = upc[old]
+    store.qty_column()[rows[old]] = qty[old]
+    store.ts_column()[rows[old]] = ts[old]
+    new = ~old
+    if new.any():
+        if not np.array_equal(rows[new], np.arange(base_n, base_n + int(new.sum()))):
+            raise ValueError("자동 저장 파일의 행 번호가 기준 파일과 맞지 않습니다.")
+        store.extend(upc[new], qty[new], ts[new])
+    return meta
+
+
+def remove(path: str):
+    for p in (path, path + "-wal", path + "-shm"):
+        if os.path.exists(p):
+            os.remove(p)
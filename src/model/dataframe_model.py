@@ -1,47 +1,490 @@
-from datetime import datetime
 import re
-import pandas as pd
+from bisect import bisect_left
+from typing import TYPE_CHECKING
+import numpy as np
 from PyQt6.QtCore import (
-    Qt, QAbstractTableModel, QModelIndex, pyqtSignal
+    Qt, QAbstractItemModel, QAbstractTableModel, QModelIndex, QTimer, pyqtSignal
 )
+from PyQt6.QtGui import QColor
+
+from utils import perf
+from .scanlog import LOCAL, ScanLog
+from .store import COLUMNS, RowStore, format_ts, now_ns
+from .undo import OP_APPEND, OP_RENAME, OP_SCAN, UndoHistory
+from .upc_search import UpcSearch
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 # ✅ UPC: 알파벳/숫자, 4자리 이상
 _re_upc = re.compile(r"^[A-Za-z0-9]{4,}$")
 
+_DISPLAY_ROLES = (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole)
+DISPLAY_CACHE_ROWS = 4096   # 표시 문자열 캐시 최대 행 수 (넘치면 비움)
+FETCH_ROWS = 10_000         # 보기에 한 번에 노출하는 행 수 (canFetchMore/fetchMore)
+INDEX_CHUNK_ROWS = 100_000  # 이벤트 루프 한 번에 UPC 인덱스에 넣는 행 수
+_SORT_HINT = QAbstractItemModel.LayoutChangeHint.VerticalSortHint
+DESC_COLUMN = "Description"   # 카탈로그가 연결됐을 때만 보이는 열 (DataFrame/저장소에는 없음)
+_CATALOG_ROLES = (Qt.ItemDataRole.BackgroundRole, Qt.ItemDataRole.ToolTipRole)
+_UNKNOWN_BG = QColor("#ffe4e4")   # 카탈로그에 없는 UPC
+SEARCH_LIMIT = 50           # 찾기 상자 후보 수
+
 class DataFrameModel(QAbstractTableModel):
     changed = pyqtSignal()      # 데이터 변경 신호
     error = pyqtSignal(str)     # 오류 발생 시 메세지 전달용
 
-    def __init__(self, df: pd.DataFrame):
+    def __init__(self, data: "RowStore | pd.DataFrame | None" = None):
         super().__init__()
-        self._df = df
+        # 열 단위 저장소 (DataFrame은 내보낼 때만 생성) — 빈 표로 시작하면 pandas를 건드리지 않음
+        if data is None:
+            data = RowStore()
+        self._store = data if isinstance(data, RowStore) else RowStore.from_dataframe(data)
         self._editable = False   # 더블클릭 편집 허용 여부
+        self._upc_index: dict[str, int] = {}   # UPC → 행 번호 (O(1) 조회/중복 검사)
+        self._indexed: int | None = None       # 인덱스에 넣은 행 수 (None: 전부)
+        self._index_timer = QTimer(self)
+        self._index_timer.setSingleShot(True)
+        self._index_timer.timeout.connect(self._index_step)
+        self._search: UpcSearch | None = None   # 부분 UPC 검색 (처음 찾을 때 생성)
+        self._rebuild_upc_index()
+        self._revision = 0       # 변경 횟수 (저장 시점 비교용)
+        self.changed.connect(self._bump_revision)
+        self._journal = None     # 크래시 복구용 저널 (model.journal.Journal)
+        self._history = UndoHistory()   # 되돌리기/다시 실행 (바뀐 행의 전/후 값만 기록)
+        self._scan_log = ScanLog()      # 수량 스캔 시계열 (처리량/공백 구간 집계)
+        self._display: dict[int, tuple] = {}   # 저장 행 → 표시 문자열 (UPC, Qty, LastScannedAt[, Description, 카탈로그 위치])
+        self._catalog = None     # 제품 카탈로그 (model.catalog.Catalog, 메모리 매핑)
+        # 정렬/필터: 보기 행 → 저장 행 순열 (None이면 입력 순서 그대로)
+        # 항상 (정렬 키, 저장 행) 오름차순으로 두고, 내림차순은 보기에서 뒤집는다
+        self._order: np.ndarray | None = None
+        self._sort_col: int | None = None
+        self._sort_desc = False
+        self._filter = ""          # UPC 필터 (대문자)
+        self._filter_prefix = False
+        # 보기에 노출한 행 수 — 앞쪽 보기 행만 rowCount로 알리고, 스크롤하면 fetchMore로 늘린다.
+        # 저장소/순열/UPC 인덱스는 항상 전체 (찾기·스캔·저장은 노출과 무관)
+        self._fetched = FETCH_ROWS
+        # 마지막 저장/자동 저장 이후 바뀐 행 (저장 행 번호, 자동 저장은 이 행들만 기록)
+        self._dirty_rows: set[int] = set()
+        self._track_dirty = True  # 일괄 처리 중엔 범위 대신 정확한 행만 기록
+        self.dataChanged.connect(self._on_data_changed)
+        self.rowsInserted.connect(self._on_rows_inserted)
+
+    def set_journal(self, journal):
+        self._journal = journal
+
+    # --- 자동 저장용 변경 행 추적 ---
+    def _on_data_changed(self, top_left, bottom_right, roles=()):
+        if not self._track_dirty:
+            return
+        self._dirty_rows.update(self._to_store_rows(top_left.row(), bottom_right.row()))
+
+    def _on_rows_inserted(self, parent, first, last):
+        if not self._track_dirty:
+            return
+        self._dirty_rows.update(self._to_store_rows(first, last))
+
+    def has_dirty_rows(self) -> bool:
+        return bool(self._dirty_rows)
+
+    def mark_rows_dirty(self, rows):
+        n = len(self._store)   # 그사이 되돌리기로 지운 행은 제외
+        self._dirty_rows.update(int(r) for r in rows if r < n)
+
+    def take_dirty_rows(self) -> np.ndarray:
+        """변경 행 번호를 꺼내고 비운다"""
+        rows = np.fromiter(self._dirty_rows, dtype=np.int64, count=len(self._dirty_rows))
+        self._dirty_rows.clear()
+        rows.sort()
+        return rows
+
+    def rows_snapshot(self, rows: np.ndarray) -> tuple:
+        """주어진 행들의 (rows, upc, qty, ts) 복사본 — 백그라운드 기록용"""
+        return (rows, self._store.upc_column()[rows].tolist(),
+                self._store.qty_column()[rows].copy(), self._store.ts_column()[rows].copy())
+
+    def _bump_revision(self):
+        self._revision += 1
+
+    def revision(self) -> int:
+        return self._revision
+
+    def _rebuild_upc_index(self):
+        """UPC 인덱스 재구성 — 표는 바로 그리고, 인덱스는 이벤트 루프가 빌 때 청크 단위로 채운다"""
+        self._upc_index = {}
+        self._indexed = 0
+        self._index_step()
+
+    def _index_rows(self, count: int):
+        """다음 count행을 인덱스에 추가 (중복 시 첫 번째 행 유지)"""
+        a = self._indexed
+        b = min(a + count, len(self._store))
+        index = self._upc_index
+        for row, upc in enumerate(self._store.upc_column()[a:b].tolist(), a):
+            if upc is None:
+                continue
+            index.setdefault(str(upc), row)
+        self._indexed = None if b >= len(self._store) else b
+
+    def _index_step(self):
+        if self._indexed is not None:
+            self._index_rows(INDEX_CHUNK_ROWS)
+        if self._indexed is not None:
+            self._index_timer.start(0)
+
+    def _ensure_index(self):
+        """남은 행까지 인덱스 완성 — UPC로 찾거나 행을 바꾸기 전에 (그 전까지 저장소는 그대로)"""
+        if self._indexed is not None:
+            self._index_timer.stop()
+            self._index_rows(len(self._store))
+
+    def _is_duplicate_upc(self, upc: str, row: int) -> bool:
+        found = self._upc_index.get(upc, -1)
+        return found >= 0 and found != row
+
+    def _reindex_upc(self, row: int, old_upc, new_upc: str):
+        old = str(old_upc) if old_upc is not None else None
+        if old is not None and self._upc_index.get(old) == row:
+            del self._upc_index[old]
+        if new_upc is not None:
+            self._upc_index[new_upc] = row
+            if self._search is not None:
+                self._search.add(new_upc, row)
+
+    # --- 정렬/필터: 보기 행 ↔ 저장 행 ---
+    def _to_store(self, row: int) -> int:
+        if self._order is None:
+            return row
+        return int(self._order[len(self._order) - 1 - row if self._sort_desc else row])
+
+    def _to_store_rows(self, first: int, last: int):
+        if self._order is None:
+            return range(first, last + 1)
+        if self._sort_desc:
+            n = len(self._order)
+            first, last = n - 1 - last, n - 1 - first
+        return self._order[first:last + 1].tolist()
+
+    def _to_view(self, pos: int) -> int:
+        """order 위치 → 보기 행 (내림차순이면 뒤집음)"""
+        return len(self._order) - 1 - pos if self._sort_desc else pos
+
+    def _sort_key(self):
+        """저장 행 → 정렬 키 (동순위는 저장 행 순서). 정렬이 없으면 None(저장 행 자체)"""
+        if self._sort_col is None:
+            return None
+        if self._sort_col == 0:
+            col = self._store.upc_column()
+            return lambda s: (str(col[s]), s)
+        if self._sort_col == len(COLUMNS):
+            return lambda s: (self._description(s), s)
+        col = self._store.qty_column() if self._sort_col == 1 else self._store.ts_column()
+        return lambda s: (int(col[s]), s)
+
+    def _bisect(self, srow: int, lo: int, hi: int) -> int:
+        key = self._sort_key()
+        if key is None:
+            return lo + int(np.searchsorted(self._order[lo:hi], srow))
+        return bisect_left(self._order, key(srow), lo, hi, key=key)
+
+    def _find(self, srow: int) -> int:
+        """저장 행의 order 위치 (필터로 숨겨졌으면 -1) — O(log n)"""
+        if self._order is None:
+            return srow
+        p = self._bisect(srow, 0, len(self._order))
+        return p if p < len(self._order) and self._order[p] == srow else -1
+
+    def _matches(self, srow: int) -> bool:
+        if not self._filter:
+            return True
+        upc = self.upc_at_store(srow).upper()
+        return upc.startswith(self._filter) if self._filter_prefix else self._filter in upc
+
+    def _filter_mask(self) -> np.ndarray:
+        upc = np.strings.upper(self._store.upc_column().astype(str))
+        if self._filter_prefix:
+            return np.strings.startswith(upc, self._filter)
+        return np.strings.find(upc, self._filter) >= 0
+
+    def _rebuild_order(self):
+        """정렬/필터 순열 전체 재계산 (argsort) — 정렬·필터 조건이 바뀔 때만"""
+        if self._sort_col is None and not self._filter:
+            self._order = None
+            return
+        rows = np.arange(len(self._store), dtype=np.int64)
+        if self._filter:
+            rows = rows[self._filter_mask()]
+        if self._sort_col == len(COLUMNS):
+            idx = self._catalog.index_many(self._store.upc_column()[rows])
+            keys = np.array([self._catalog.description(i) if i >= 0 else "" for i in idx.tolist()], dtype=str)
+            rows = rows[np.argsort(keys, kind="stable")]
+        elif self._sort_col is not None:
+            col = (self._store.upc_column(), self._store.qty_column(), self._store.ts_column())[self._sort_col]
+            keys = col[rows].astype(str) if self._sort_col == 0 else col[rows]
+            rows = rows[np.argsort(keys, kind="stable")]
+        self._order = rows
+
+    def _insert_sorted(self, srow: int):
+        """새로 보이게 된 저장 행을 이진 탐색 위치에 끼워 넣는다"""
+        p = self._bisect(srow, 0, len(self._order))
+        v = len(self._order) - p if self._sort_desc else p
+        shown = self.rowCount()
+        visible = self._shows_insert(v, shown)
+        if visible:
+            self.beginInsertRows(QModelIndex(), v, v)
+        self._order = np.insert(self._order, p, srow)
+        if visible:
+            self._grow(shown, 1)
+            self.endInsertRows()
+
+    def _place(self, srow: int, old: int):
+        """srow 값이 바뀐 뒤 정렬 위치/필터 반영 — old는 바뀌기 전 order 위치(-1: 숨김)
+
+        전체 재정렬 대신 이웃과 비교해 이진 탐색으로 새 위치를 찾고 그 사이만 민다.
+        """
+        if self._order is None:
+            return
+        show = self._matches(srow)
+        if old >= 0 and not show:
+            v, shown = self._to_view(old), self.rowCount()
+            if v < shown:
+                self.beginRemoveRows(QModelIndex(), v, v)
+            self._order = np.delete(self._order, old)
+            if v < shown:
+                self._shrink(shown)
+                self.endRemoveRows()
+            return
+        if old < 0:
+            if show:
+                self._insert_sorted(srow)
+            return
+        key = self._sort_key()
+        if key is None:
+            return
+        order, n, k = self._order, len(self._order), key(srow)
+        if old > 0 and key(order[old - 1]) > k:
+            new = bisect_left(order, k, 0, old, key=key)
+        elif old < n - 1 and key(order[old + 1]) < k:
+            new = bisect_left(order, k, old + 1, n, key=key) - 1
+        else:
+            return
+        src, dst = self._to_view(old), self._to_view(new)
+        shown = self.rowCount()
+        # 노출 범위 밖으로 나가거나 들어오는 이동은 행 제거/삽입으로 알린다
+        if src < shown and dst < shown:
+            self.beginMoveRows(QModelIndex(), src, src, QModelIndex(), dst if dst < src else dst + 1)
+        elif src < shown:
+            self.beginRemoveRows(QModelIndex(), src, src)
+        elif dst < shown:
+            self.beginInsertRows(QModelIndex(), dst, dst)
+        if new < old:
+            order[new + 1:old + 1] = order[new:old].copy()
+        else:
+            order[old:new] = order[old + 1:new + 1].copy()
+        order[new] = srow
+        if src < shown and dst < shown:
+            self.endMoveRows()
+        elif src < shown:
+            self._shrink(shown)
+            self.endRemoveRows()
+        elif dst < shown:
+            self._grow(shown, 1)
+            self.endInsertRows()
+
+    def _relayout(self):
+        """정렬/필터 조건 변경 — 선택(persistent index)은 저장 행 기준으로 따라간다"""
+        self.layoutAboutToBeChanged.emit([], _SORT_HINT)
+        persistent = self.persistentIndexList()
+        srows = [self._to_store(i.row()) for i in persistent]
+        self._rebuild_order()
+        views = [self.view_row(s) for s in srows]
+        if views:   # 선택한 행이 아직 노출되지 않은 위치로 가면 거기까지 노출
+            self._fetched = max(self._fetched, max(views) + 1)
+        self.changePersistentIndexList(
+            persistent, [self.index(self.view_row(s), i.column()) for s, i in zip(srows, persistent)])
+        self.layoutChanged.emit([], _SORT_HINT)
+
+    def sort(self, column: int, order=Qt.SortOrder.AscendingOrder):
+        """헤더 클릭 정렬 (UPC/Qty/LastScannedAt/Description) — column < 0이면 입력 순서"""
+        self._sort_col = column if 0 <= column < self.columnCount() else None
+        self._sort_desc = self._sort_col is not None and order == Qt.SortOrder.DescendingOrder
+        self._relayout()
+
+    def set_filter(self, text: str, prefix: bool = False):
+        """UPC 부분 문자열(prefix=True면 접두어) 필터 — 대소문자 무시, 빈 문자열이면 해제"""
+        text = (text or "").strip().upper()
+        if text == self._filter and bool(prefix) == self._filter_prefix:
+            return
+        self._filter, self._filter_prefix = text, bool(prefix)
+        self._relayout()
+
+    def filter_text(self) -> str:
+        return self._filter
+
+    def view_row(self, srow: int) -> int:
+        """저장 행 → 보기 행 (-1: 필터로 숨김)"""
+        if srow < 0:
+            return -1
+        p = self._find(srow)
+        return -1 if p < 0 else self._to_view(p)
+
+    def store_row(self, row: int) -> int:
+        """보기 행 → 저장 행 (-1: 범위 밖)"""
+        return self._to_store(row) if 0 <= row < self.rowCount() else -1
+
+    def _emit_row_changed(self, srow: int):
+        self._display.pop(srow, None)
+        if self._track_dirty:
+            self._dirty_rows.add(srow)   # 숨김/미노출 행이면 dataChanged가 없으므로 직접 기록
+        row = self.view_row(srow)
+        if row < 0 or row >= self.rowCount():
+            return
+        top_left = self.index(row, 0)
+        bottom_right = self.index(row, self.columnCount() - 1)
+        self.dataChanged.emit(top_left, bottom_right,
+                              [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole])
 
     def set_editable(self, on: bool):
         """편집 가능 모드 전환"""
         self._editable = bool(on)
         self.layoutChanged.emit()
 
+    def _total(self) -> int:
+        """노출 여부와 상관없는 보기 행 수 (필터 적용)"""
+        return len(self._store) if self._order is None else len(self._order)
+
     def rowCount(self, parent=QModelIndex()):
-        return 0 if parent.isValid() else len(self._df)
+        if parent.isValid():
+            return 0
+        return min(self._fetched, self._total())
+
+    def total_rows(self) -> int:
+        return self._total()
+
+    def _shows_insert(self, v: int, shown: int) -> bool:
+        """보기 행 v에 끼울 행이 노출 범위 안인지 (전부 노출된 상태면 끝에 붙여도 보임)"""
+        return v < shown or shown == self._total()
+
+    def _grow(self, shown: int, count: int):
+        """노출 범위 안에 count행이 들어옴 (shown: 들어오기 전 rowCount)"""
+        self._fetched = max(self._fetched, shown + count)
+
+    def _shrink(self, shown: int):
+        """노출 범위 안의 행 하나가 빠짐 — 전부 노출된 상태면 그대로 둔다"""
+        if self._fetched <= shown:
+            self._fetched = shown - 1
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._fetched < self._total()
+
+    def fetchMore(self, parent=QModelIndex()):
+        if not parent.isValid():
+            self.fetch_to(self.rowCount() + FETCH_ROWS - 1)
+
+    def fetch_to(self, row: int):
+        """보기 행 row까지 노출 — 아직 가져오지 않은 행으로 이동/선택하기 전에"""
+        shown = self.rowCount()
+        last = min(row, self._total() - 1)
+        if last < shown:
+            return
+        self._track_dirty = False   # 노출만 늘어남 — 자동 저장 대상 아님
+        try:
+            self.beginInsertRows(QModelIndex(), shown, last)
+            self._fetched = last + 1
+            self.endInsertRows()
+        finally:
+            self._track_dirty = True
 
     def columnCount(self, parent=QModelIndex()):
-        return 0 if parent.isValid() else len(self._df.columns)
+        if parent.isValid():
+            return 0
+        return len(COLUMNS) + (self._catalog is not None)
+
+    def _format_row(self, row: int) -> tuple:
+        upc = self._store.upc(row)
+        upc = "" if upc is None else str(upc)
+        cells = (upc, str(self._store.qty(row)), format_ts(self._store.ts(row)))
+        if self._catalog is None:
+            return cells
+        i = self._catalog.index(upc)
+        return cells + (self._catalog.description(i) if i >= 0 else "", i)
+
+    def _row_cells(self, r: int) -> tuple:
+        cached = self._display.get(r)
+        if cached is None:
+            # 화면에 보이는 행만 한 번 포맷해 두고, 값이 바뀔 때만 무효화
+            if len(self._display) >= DISPLAY_CACHE_ROWS:
+                self._display.clear()
+            cached = self._display[r] = self._format_row(r)
+        return cached
 
     def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role not in _DISPLAY_ROLES:
+            if self._catalog is not None and role in _CATALOG_ROLES and index.isValid():
+                return self._catalog_data(index, role)
+            return None
         if not index.isValid():
             return None
-        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
-            value = self._df.iat[index.row(), index.column()]
-            if isinstance(value, pd.Timestamp):
-                return "" if pd.isna(value) else value.strftime("%Y-%m-%d %H:%M:%S")
-            return "" if (value is None or (isinstance(value, float) and pd.isna(value))) else str(value)
+        r = index.row() if self._order is None else self._to_store(index.row())
+        return self._row_cells(r)[index.column()]
+
+    def _catalog_data(self, index, role):
+        """카탈로그에 없는 UPC는 배경색/툴팁으로 표시, Qty 툴팁은 예상 수량"""
+        i = self._row_cells(self._to_store(index.row()))[4]
+        col = index.column()
+        if i < 0 and col == 0:
+            return _UNKNOWN_BG if role == Qt.ItemDataRole.BackgroundRole else "카탈로그에 없는 UPC"
+        if i >= 0 and col == 1 and role == Qt.ItemDataRole.ToolTipRole:
+            expected = self._catalog.expected(i)
+            return f"예상 수량 {expected}" if expected >= 0 else None
         return None
 
     def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
         if role != Qt.ItemDataRole.DisplayRole:
             return None
-        return self._df.columns[section] if orientation == Qt.Orientation.Horizontal else section + 1
+        if orientation != Qt.Orientation.Horizontal:
+            return section + 1
+        return COLUMNS[section] if section < len(COLUMNS) else DESC_COLUMN
+
+    # --- 제품 카탈로그 ---
+    def set_catalog(self, catalog):
+        """카탈로그 연결/해제 — Description 열을 끼우거나 빼고, 없는 UPC 표시를 갱신"""
+        n = len(COLUMNS)
+        if self._catalog is not None and catalog is None:
+            self.beginRemoveColumns(QModelIndex(), n, n)
+            self._catalog = None
+            self._display.clear()
+            self.endRemoveColumns()
+            if self._sort_col == n:
+                self.sort(-1)
+            return
+        if self._catalog is None and catalog is not None:
+            self.beginInsertColumns(QModelIndex(), n, n)
+            self._catalog = catalog
+            self._display.clear()
+            self.endInsertColumns()
+            return
+        self._catalog = catalog
+        self._display.clear()
+        if self._sort_col == n:
+            self._relayout()
+        if self.rowCount():
+            self._track_dirty = False   # 표시만 바뀜 — 자동 저장 대상 아님
+            try:
+                self.dataChanged.emit(self.index(0, 0), self.index(self.rowCount() - 1, n))
+            finally:
+                self._track_dirty = True
+
+    def catalog(self):
+        return self._catalog
+
+    def _description(self, srow: int) -> str:
+        i = self._catalog.index(self.upc_at_store(srow))
+        return self._catalog.description(i) if i >= 0 else ""
+
+    def is_known(self, upc: str) -> bool | None:
+        """카탈로그에 있는 UPC인지 (카탈로그가 없으면 None)"""
+        return None if self._catalog is None else upc in self._catalog
 
     def flags(self, index):
         if not index.isValid():
@@ -52,41 +495,248 @@ class DataFrameModel(QAbstractTableModel):
             return base | Qt.ItemFlag.ItemIsEditable
         return base
 
-    def set_dataframe(self, df: pd.DataFrame):
+    def set_dataframe(self, df: "pd.DataFrame"):
+        self.set_store(RowStore.from_dataframe(df))
+
+    def set_store(self, store: RowStore):
+        """저장소 통째 교체 (백그라운드 import 결과를 한 번에 반영)"""
         self.beginResetModel()
-        self._df = df
+        self._store = store
+        self._display.clear()
+        self._dirty_rows.clear()
+        self._history.clear()
+        self._scan_log.clear()   # 행 번호가 새 저장소 기준으로 바뀜
+        self._search = None
+        self._fetched = FETCH_ROWS   # 앞쪽 행만 보이고 나머지는 스크롤할 때 가져온다
+        self._rebuild_upc_index()
+        self._rebuild_order()   # 정렬/필터 조건은 유지
         self.endResetModel()
 
-    def dataframe(self) -> pd.DataFrame:
-        return self._df
+    def dataframe(self) -> "pd.DataFrame":
+        """현재 내용을 DataFrame으로 생성 (저장/내보내기 시점 전용)"""
+        return self._store.to_dataframe()
+
+    def store(self) -> RowStore:
+        return self._store
+
+    def scan_log(self) -> ScanLog:
+        return self._scan_log
+
+    def upc_at(self, row: int) -> str:
+        return self.upc_at_store(self._to_store(row))
+
+    def upc_at_store(self, srow: int) -> str:
+        upc = self._store.upc(srow)
+        return "" if upc is None else str(upc)
+
+    def qty_at(self, row: int) -> int:
+        return self._store.qty(self._to_store(row))
+
+    def _append(self, upc: str, ts: int) -> int:
+        pos = len(self._store)
+        visible = self._order is None and self._shows_insert(pos, self.rowCount())
+        if visible:
+            self.beginInsertRows(QModelIndex(), pos, pos)
+        self._store.append(upc, 0, ts)
+        self._display.pop(pos, None)
+        self._upc_index.setdefault(upc, pos)
+        if self._search is not None:
+            self._search.add(upc, pos)
+        self._dirty_rows.add(pos)
+        if visible:
+            self._grow(pos, 1)
+            self.endInsertRows()
+        elif self._order is not None and self._matches(pos):
+            self._insert_sorted(pos)
+        if self._journal:
+            self._journal.record_append(pos, upc, ts)
+        return pos
 
     def append_row(self, upc: str):
-        now = pd.Timestamp(datetime.now())
-        row = {"UPC": str(upc), "Qty": int(0), "LastScannedAt": now}
-        self.beginInsertRows(QModelIndex(), len(self._df), len(self._df))
-        self._df.loc[len(self._df)] = row
-        self.endInsertRows()
+        self._ensure_index()
+        ts = now_ns()
+        pos = self._append(str(upc), ts)
+        self._history.begin()
+        self._history.record_append(pos, str(upc), ts)
         self.changed.emit()
 
+    def apply_scans(self, events: list[tuple[str, object]], current_row: int,
+                    reveal: bool = True, stations=None) -> tuple[int, int, int]:
+        """스캔 이벤트 일괄 반영 — ("upc", 코드) 선택/추가, ("qty", 수량) 현재 행에 더하기
+
+        입력 순서 보기에서는 신규 UPC는 rowsInserted 한 번, 수량 변경은 dataChanged 한 범위로 알린다.
+        정렬/필터 보기에서는 바뀐 행만 이진 탐색으로 제자리에 옮긴다.
+        current_row와 돌려주는 행은 보기 행 — reveal이면 마지막 UPC가 필터에 가려질 때 필터를 해제한다.
+        stations는 이벤트마다의 스캔 로그 스테이션 번호 (None이면 모두 로컬).
+        (마지막 행, 신규 UPC 수, 수량 이벤트 수)를 돌려준다.
+        """
+        # 스캔 로그에 못 넣을 값이면 아무것도 바꾸기 전에 거절 (저장소/저널/로그가 어긋나지 않게)
+        if stations is not None:
+            stations = self._scan_log.check_stations(stations, len(events))
+        self._ensure_index()
+        ts = now_ns()
+        ordered = self._order is not None
+
+        # 1) 신규 UPC를 먼저 한 번에 추가
+        new: list[str] = []
+        seen = set()
+        for kind, value in events:
+            if kind == "upc" and value not in self._upc_index and value not in seen:
+                seen.add(value)
+                new.append(value)
+        row = self.store_row(current_row)
+        first = len(self._store)
+        if new:
+            visible = not ordered and self._shows_insert(first, self.rowCount())
+            if visible:
+                self.beginInsertRows(QModelIndex(), first, first + len(new) - 1)
+            self._store.extend(new, np.zeros(len(new), dtype=np.int64), np.full(len(new), ts, dtype=np.int64))
+            for i, upc in enumerate(new):
+                self._upc_index.setdefault(upc, first + i)
+                self._display.pop(first + i, None)
+                if self._search is not None:
+                    self._search.add(upc, first + i)
+            self._dirty_rows.update(range(first, first + len(new)))
+            if visible:
+                self._grow(first, len(new))
+                self.endInsertRows()
+            elif ordered:
+                for srow in range(first, first + len(new)):
+                    if self._matches(srow):
+                        self._insert_sorted(srow)
+            if self._journal:
+                for i, upc in enumerate(new):
+                    self._journal.record_append(first + i, upc, ts)
+
+        # 2) 순서대로 현재 행을 따라가며 수량 반영 (저장 행 기준)
+        #    되돌리기 기록은 스캔한 UPC마다 한 스텝 (신규 행 추가 + 이어지는 수량)
+        hist = self._history
+        hist.begin()
+        unrecorded = set(new)
+        changed: set[int] = set()
+        n_qty = 0
+        log_rows: list[int] = []
+        log_deltas: list[int] = []
+        log_stations: list[int] = []
+        for i, (kind, value) in enumerate(events):
+            if kind == "upc":
+                row = self._upc_index[value]
+                hist.begin()
+                if value in unrecorded:
+                    unrecorded.discard(value)
+                    hist.record_append(row, value, ts)
+            elif 0 <= row < len(self._store):
+                old = self._find(row) if ordered else row
+                qty0, ts0 = self._store.qty(row), self._store.ts(row)
+                station = LOCAL if stations is None else stations[i]
+                self._store.add_qty(row, int(value), ts)
+                hist.record_scan(row, qty0, qty0 + int(value), ts0, ts, station)
+                if self._journal:
+                    self._journal.record_add(row, int(value), ts)
+                if ordered:
+                    self._place(row, old)
+                changed.add(row)
+                n_qty += 1
+                log_rows.append(row)
+                log_deltas.append(int(value))
+                log_stations.append(station)
+        if log_rows:
+            self._scan_log.extend(ts, log_rows, log_deltas, log_stations)
+
+        if changed:
+            for r in changed:
+                self._display.pop(r, None)
+            self._dirty_rows.update(changed)
+            self._track_dirty = False
+            try:
+                if ordered:
+                    for r in changed:
+                        self._emit_row_changed(r)
+                elif min(changed) < self.rowCount():
+                    self.dataChanged.emit(self.index(min(changed), 0),
+                                          self.index(min(max(changed), self.rowCount() - 1), self.columnCount() - 1),
+                                          [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole])
+            finally:
+                self._track_dirty = True
+        if new or changed:
+            self.changed.emit()
+
+        view = self.view_row(row)
+        if reveal and row >= 0 and view < 0:
+            # 방금 스캔한 행이 필터에 가려져 있으면 필터 해제
+            self.set_filter("")
+            view = self.view_row(row)
+        return view, len(new), n_qty
+
     def find_row_by_upc(self, upc: str) -> int:
-        matches = self._df.index[self._df["UPC"] == str(upc)].tolist()
-        return matches[0] if matches else -1
+        """UPC의 보기 행 (-1: 없음 또는 필터로 숨김) — 아직 노출하지 않은 행일 수 있음 (fetch_to)"""
+        self._ensure_index()
+        return self.view_row(self._upc_index.get(str(upc), -1))
+
+    def has_upc(self, upc: str) -> bool:
+        self._ensure_index()
+        return str(upc) in self._upc_index
+
+    def _searcher(self) -> UpcSearch:
+        if self._search is None:
+            self._search = UpcSearch(self._store.upc_column())
+        return self._search
+
+    def _live(self, hits, out: dict[str, int], limit: int):
+        """검색 후보 중 지금도 그 행에 있는 UPC만 (이름이 바뀌었거나 지워진 옛 항목 제외)"""
+        store = self._store
+        for upc, srow in hits:
+            if len(out) >= limit:
+                break
+            if upc not in out and srow < len(store) and store.upc(srow) == upc:
+                out[upc] = srow
+
+    def search_upc(self, text: str, limit: int = SEARCH_LIMIT, contains: bool = False) -> list[str]:
+        """일부만 아는 UPC 찾기 — text로 시작하는 UPC, 이어서 text로 끝나는 UPC
+
+        contains면 그래도 limit에 못 미칠 때 중간에 text가 들어 있는 UPC까지 (전체 스캔).
+        """
+        text = str(text).strip().upper()
+        if not text:
+            return []
+        search = self._searcher()
+        out: dict[str, int] = {}
+        self._live(search.prefix(text, limit), out, limit)
+        self._live(search.suffix(text, limit), out, limit)
+        if contains and len(out) < limit:
+            self._live(search.contains(text, limit), out, limit)
+        return list(out)
+
+    def suggest_upc(self, code: str, limit: int = 3, max_dist: int = 2) -> list[str]:
+        """code와 편집 거리 max_dist 이하인 기존 UPC (가까운 순, code 자신 제외) — 오타 스캔 안내용"""
+        code = str(code)
+        out: dict[str, int] = {}
+        hits = [(upc, srow) for _, upc, srow in self._searcher().similar(code, max_dist) if upc != code]
+        self._live(hits, out, limit)
+        return list(out)
 
     def add_qty(self, row_idx: int, amount: int):
-        if 0 <= row_idx < len(self._df):
-            self._df.at[row_idx, "Qty"] = int(self._df.at[row_idx, "Qty"] or 0) + int(amount)
-            self._df.at[row_idx, "LastScannedAt"] = pd.Timestamp(datetime.now())
-            top_left = self.index(row_idx, 0)
-            bottom_right = self.index(row_idx, self.columnCount() - 1)
-            self.dataChanged.emit(top_left, bottom_right,
-                                  [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole])
+        srow = self.store_row(row_idx)
+        if srow >= 0:
+            ts = now_ns()
+            old = self._find(srow)
+            qty0, ts0 = self._store.qty(srow), self._store.ts(srow)
+            self._store.add_qty(srow, int(amount), ts)
+            self._history.begin()
+            self._history.record_scan(srow, qty0, qty0 + int(amount), ts0, ts, LOCAL)
+            if self._journal:
+                self._journal.record_add(srow, int(amount), ts)
+            self._scan_log.append(ts, srow, int(amount))   # 수량 열 범위 밖은 잘라 기록 (예외 없음)
+            self._place(srow, old)
+            self._emit_row_changed(srow)
             self.changed.emit()
 
     def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
         """셀 편집 시 유효성 검사"""
         if role != Qt.ItemDataRole.EditRole or not index.isValid():
             return False
-        r, c = index.row(), index.column()
+        self._ensure_index()
+        r, c = self._to_store(index.row()), index.column()
 
         if c == 0:  # UPC
             new = str(value).strip().upper()
@@ -94,45 +744,57 @@ class DataFrameModel(QAbstractTableModel):
                 self.error.emit("UPC는 알파벳/숫자만 가능하며 4자리 이상이어야 합니다.")
                 return False
             # 중복 검사 (자기 자신 제외)
-            dup = self._df.index[(self._df["UPC"] == new) & (self._df.index != r)]
-            if len(dup) > 0:
+            if self._is_duplicate_upc(new, r):
                 self.error.emit("중복된 UPC입니다.")
                 return False
-            self._df.at[r, "UPC"] = new
+            old = self._find(r)
+            upc0, qty0, ts0 = self._store.upc(r), self._store.qty(r), self._store.ts(r)
+            self._reindex_upc(r, upc0, new)
+            self._store.set_upc(r, new)
+            self._history.begin()
+            self._history.record_change(r, qty0, qty0, ts0, ts0, upc0, new)
+            if self._journal:
+                self._journal.record_set(r, upc=new)
 
         elif c == 1:  # Qty
             s = str(value).strip()
             if not s.isdigit():
                 self.error.emit("Qty는 정수만 입력할 수 있습니다.")
                 return False
-            self._df.at[r, "Qty"] = int(s)
-            self._df.at[r, "LastScannedAt"] = pd.Timestamp(datetime.now())
+            ts = now_ns()
+            old = self._find(r)
+            qty0, ts0 = self._store.qty(r), self._store.ts(r)
+            self._store.set_qty(r, int(s))
+            self._store.set_ts(r, ts)
+            self._history.begin()
+            self._history.record_change(r, qty0, int(s), ts0, ts)
+            if self._journal:
+                self._journal.record_set(r, qty=int(s), ts=ts)
 
         else:
             return False
 
-        top_left = self.index(r, 0)
-        bottom_right = self.index(r, self.columnCount() - 1)
-        self.dataChanged.emit(top_left, bottom_right,
-                              [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole])
+        self._place(r, old)
+        self._emit_row_changed(r)
         self.changed.emit()
         return True
 
     # ✅ 팝업창 확인 시만 반영, LastScannedAt은 그대로 유지
     def update_row_values_without_touch(self, row: int, new_upc: str | None, new_qty: int | None) -> None:
-        if row < 0 or row >= len(self._df):
+        srow = self.store_row(row)
+        if srow < 0:
             return
+        self._ensure_index()
 
-        cur_upc = str(self._df.at[row, "UPC"] or "").strip().upper()
-        cur_qty = int(self._df.at[row, "Qty"] or 0)
+        cur_upc = self.upc_at_store(srow).strip().upper()
+        cur_qty = self._store.qty(srow)
 
         if new_upc is not None:
             upc = str(new_upc).strip().upper()
             if not _re_upc.match(upc):
                 self.error.emit("UPC는 알파벳/숫자만 가능하며 4자리 이상이어야 합니다.")
                 return
-            dup = self._df.index[(self._df["UPC"] == upc) & (self._df.index != row)]
-            if len(dup) > 0:
+            if self._is_duplicate_upc(upc, srow):
                 self.error.emit("중복된 UPC입니다.")
                 return
         else:
@@ -148,11 +810,114 @@ class DataFrameModel(QAbstractTableModel):
             qty = cur_qty
 
         # LastScannedAt은 그대로 둠
-        self._df.at[row, "UPC"] = upc
-        self._df.at[row, "Qty"] = qty
+        old = self._find(srow)
+        upc0, ts0 = self._store.upc(srow), self._store.ts(srow)
+        self._reindex_upc(srow, upc0, upc)
+        self._store.set_upc(srow, upc)
+        self._store.set_qty(srow, qty)
+        self._history.begin()
+        self._history.record_change(srow, cur_qty, qty, ts0, ts0, upc0, upc)
+        if self._journal:
+            self._journal.record_set(srow, upc=upc, qty=qty)
 
-        top_left = self.index(row, 0)
-        bottom_right = self.index(row, self.columnCount() - 1)
-        self.dataChanged.emit(top_left, bottom_right,
-                              [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole])
+        self._place(srow, old)
+        self._emit_row_changed(srow)
+        self.changed.emit()
+
+    # --- 되돌리기 / 다시 실행 (model.undo) ---
+    def set_undo_limit(self, limit: int):
+        """보관할 행 변경 레코드 수 (바꾸면 기존 기록은 비움)"""
+        self._history.set_limit(limit)
+
+    def can_undo(self) -> bool:
+        return self._history.can_undo()
+
+    def can_redo(self) -> bool:
+        return self._history.can_redo()
+
+    def _set_row(self, srow: int, rename: bool, upc, qty: int, ts: int):
+        """기록된 값으로 행을 덮어쓴다 (rename이 아니면 UPC 유지)"""
+        old = self._find(srow)
+        if rename:
+            self._reindex_upc(srow, self._store.upc(srow), upc)
+            self._store.set_upc(srow, upc)
+        self._store.set_qty(srow, qty)
+        self._store.set_ts(srow, ts)
+        if self._journal:
+            self._journal.record_set(srow, upc=upc if rename else None, qty=qty, ts=ts, exact_ts=True)
+        self._dirty_rows.add(srow)   # 필터로 숨은 행도 자동 저장 대상
+        self._place(srow, old)
+        self._emit_row_changed(srow)
+
+    def _pop_row(self, srow: int):
+        """마지막 저장 행 제거 (행 추가 되돌리기)"""
+        p = self._find(srow)
+        v = -1 if p < 0 else self._to_view(p) if self._order is not None else srow
+        shown = self.rowCount()
+        visible = 0 <= v < shown
+        if visible:
+            self.beginRemoveRows(QModelIndex(), v, v)
+        if self._order is not None and p >= 0:
+            self._order = np.delete(self._order, p)
+        upc = self._store.upc(srow)
+        self._store.pop()
+        if visible:
+            self._shrink(shown)
+            self.endRemoveRows()
+        if upc is not None and self._upc_index.get(str(upc)) == srow:
+            del self._upc_index[str(upc)]
+        self._display.pop(srow, None)
+        self._dirty_rows.discard(srow)
+        self._scan_log.forget_row(srow)   # 그 행의 스캔은 이미 보정됨 — 같은 번호로 올 새 UPC를 위해 비움
+        if self._journal:
+            self._journal.record_pop(srow)
+
+    def undo(self) -> int:
+        """마지막 스텝 되돌리기 — 바뀐 행의 보기 행 (-1: 없음/지움/숨김)"""
+        self._ensure_index()
+        steps = self._history.undo_step()
+        if not steps:
+            return -1
+        srow = -1
+        for d in steps:
+            if d.op == OP_APPEND:
+                if d.row != len(self._store) - 1:   # 기록 밖에서 행이 바뀜 — 기록을 믿을 수 없음
+                    self._history.clear()
+                    break
+                self._pop_row(d.row)
+                srow = -1
+            else:
+                self._set_row(d.row, d.op == OP_RENAME, d.upc0, d.qty0, d.ts0)
+                if d.op == OP_SCAN:   # 스캔 로그는 지우지 않고 보정 이벤트 (model.scanlog)
+                    self._scan_log.amend(now_ns(), d.row, d.qty0 - d.qty1, -1, d.upc0)
+                srow = d.row
         self.changed.emit()
+        return self.view_row(srow)
+
+    def redo(self) -> int:
+        """되돌린 스텝 다시 실행 — 바뀐 행의 보기 행 (-1: 없음/숨김)"""
+        self._ensure_index()
+        steps = self._history.redo_step()
+        if not steps:
+            return -1
+        srow = -1
+        for d in steps:
+            if d.op == OP_APPEND:
+                if d.row != len(self._store):
+                    self._history.clear()
+                    break
+                self._append(d.upc1, d.ts1)
+            else:
+                self._set_row(d.row, d.op == OP_RENAME, d.upc1, d.qty1, d.ts1)
+                if d.op == OP_SCAN:
+                    self._scan_log.amend(now_ns(), d.row, d.qty1 - d.qty0, 1, d.upc0)
+            srow = d.row
+        self.changed.emit()
+        return self.view_row(srow)
+
+
+# 계측 대상 (utils.perf.enable() 때만 교체)
+perf.register(DataFrameModel, "append_row", "add_qty", "apply_scans", "setData",
+              "update_row_values_without_touch", "set_store", "sort", "set_filter", "undo", "redo",
+              slow_ms=50)
+perf.register(DataFrameModel, "data", slow_ms=5)
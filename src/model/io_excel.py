@@ -1,65 +1,216 @@
-import math
+import os
+import numpy as np
 import pandas as pd
-from .store import COLUMNS
-
-def _is_valid_qty(x) -> bool:
-    if pd.isna(x): return False
-    if isinstance(x, int): return True
-    if isinstance(x, float): return math.isfinite(x) and float(x).is_integer()
-    s = str(x).strip()
-    return s.isdigit()
-
-def _is_valid_upc(s: object, min_len: int = 4) -> bool:
-    if pd.isna(s): return False
-    t = str(s).strip()
-    # ✅ 알파벳/숫자만 허용 + 길이 검사
-    return len(t) >= min_len and t.isalnum()
-
-def import_excel(path: str) -> pd.DataFrame:
-    df = pd.read_excel(path, dtype={"UPC": str}, engine="openpyxl")
-
-    # 스키마 정렬
-    for col in COLUMNS:
-        if col not in df.columns:
-            df[col] = pd.NA
-    df = df[COLUMNS].copy()
+from openpyxl import Workbook, load_workbook
+from utils import perf
+from .scanlog import ScanActivity, write_activity_sheets
+from .store import COLUMNS, NAT, RowStore
 
+# 스트리밍 import 시 한 번에 검증하는 행 수
+CHUNK_ROWS = 50_000
+_INT64_MAX = str(np.iinfo(np.int64).max)   # Qty 상한 (int64 열에 넘치지 않게)
+
+
+def check_columns(upcs: list, qtys: list, tss: list, min_len: int = 4):
+    """한 청크의 UPC/Qty/LastScannedAt 정규화 + 행별 유효 여부 (import와 검사 전용 lint가 같이 사용)
+
+    (대문자 UPC Series, UPC 유효, Qty int64, Qty 유효, LastScannedAt ns int64 — 못 읽으면 NAT)
+    """
     # ✅ 문자열/트림/대문자 정규화 (대소문자 섞여 있어도 동일 취급)
-    df["UPC"] = df["UPC"].astype("string").str.strip().str.upper()
-
-    # 1) 잘못된 UPC (빈값/비알파넘/길이<4)
-    invalid_upc_mask = ~df["UPC"].apply(_is_valid_upc)
-    if invalid_upc_mask.any():
-        rows = (df.index[invalid_upc_mask] + 2).tolist()
-        raise ValueError(f"잘못된 UPC 행: {rows}")
-
-    # 2) 중복 UPC (그룹별 첫 번째만 표시) — 대문자 기준
-    upc_norm = df["UPC"]  # 이미 대문자/트림됨
-    dup_mask = upc_norm.duplicated(keep=False)
-    if dup_mask.any():
-        first_rows = []
-        for _, group in df[dup_mask].groupby(upc_norm):
-            first_idx = group.index.min()
-            first_rows.append(int(first_idx) + 2)
-        first_rows.sort()
-        raise ValueError(f"중복된 UPC 행: {first_rows}")
-
-    # 3) Qty 유효성 (그대로)
-    invalid_qty_mask = ~df["Qty"].apply(_is_valid_qty)
-    if invalid_qty_mask.any():
-        rows = (df.index[invalid_qty_mask] + 2).tolist()
-        raise ValueError(f"잘못된 Qty 행: {rows}")
-
-    # 타입 정리 (그대로)
-    def _to_int(x):
-        if isinstance(x, float): return int(x)
-        return int(str(x).strip())
-
-    df["Qty"] = df["Qty"].apply(_to_int).astype("int64")
-    df["LastScannedAt"] = pd.to_datetime(df["LastScannedAt"], errors="coerce")
-    return df
-
-def export_excel(df: pd.DataFrame, path: str):
-    df = df.copy()
-    df["UPC"] = df["UPC"].astype("string")
-    df.to_excel(path, index=False, engine="openpyxl")
+    upc = pd.Series(pd.array(upcs, dtype="string")).str.strip().str.upper()
+    upc_ok = (upc.str.len() >= min_len) & upc.str.isalnum()
+    upc_ok = upc_ok.fillna(False).to_numpy(dtype=bool)
+
+    # Qty: 정수, 정수값 실수, 정수값 숫자 문자열 ("-3", "+4", "1.0", "1e3" — 예전 pd.read_excel 변환과 같음)
+    #      bool 셀(TRUE/FALSE)은 숫자로 보지 않는다. |Qty| ≤ int64 최댓값만 허용.
+    q = pd.Series(qtys, dtype=object)
+    kind = q.map(type)
+    is_str = kind.eq(str).to_numpy(dtype=bool)
+    is_bool = kind.isin((bool, np.bool_)).to_numpy(dtype=bool)
+    qty = np.zeros(len(q), dtype=np.int64)
+    qty_ok = np.zeros(len(q), dtype=bool)
+    num = np.full(len(q), np.nan)   # 실수로 판정할 값 (정수 문자열이 아닌 문자열 포함)
+    if is_str.any():
+        s = q[is_str].astype("string").str.strip()
+        m = s.str.fullmatch(r"[+-]?[0-9]+").fillna(False).to_numpy(dtype=bool)
+        # 정수 문자열: 자릿수가 같으면 문자열 비교 = 크기 비교 (부호와 앞의 0은 떼고) → 실수 정밀도 손실 없음
+        digits = s[m].str.lstrip("+-").str.lstrip("0")
+        n = digits.str.len()
+        ok = ((n < len(_INT64_MAX)) | ((n == len(_INT64_MAX)) & (digits <= _INT64_MAX))).to_numpy(dtype=bool)
+        idx = np.flatnonzero(is_str)
+        qty_ok[idx[m]] = ok
+        vals = np.zeros(int(m.sum()), dtype=np.int64)
+        vals[ok] = pd.to_numeric(s[m][ok]).to_numpy(dtype=np.int64)
+        qty[idx[m]] = vals
+        num[idx[~m]] = pd.to_numeric(s[~m], errors="coerce").to_numpy(dtype=np.float64)
+    other = ~is_str & ~is_bool
+    if other.any():
+        num[other] = pd.to_numeric(q[other], errors="coerce").to_numpy(dtype=np.float64)
+    rest = np.flatnonzero(~qty_ok & ~is_bool & ~np.isnan(num))
+    if len(rest):
+        v = num[rest]
+        ok = np.isfinite(v) & (v == np.floor(v)) & (np.abs(v) < 2.0 ** 63)
+        qty_ok[rest] = ok
+        qty[rest] = np.where(ok, v, 0).astype(np.int64)
+
+    ts = pd.to_datetime(pd.Series(tss, dtype=object), errors="coerce")
+    return upc, upc_ok, qty, qty_ok, ts.to_numpy(dtype="datetime64[ns]").view(np.int64)
+
+
+class _Columns:
+    """청크별 검증 결과 누적 (정규화된 UPC/Qty/LastScannedAt + 오류 행 번호)"""
+    def __init__(self):
+        self.upc: list[np.ndarray] = []
+        self.qty: list[np.ndarray] = []
+        self.ts: list[np.ndarray] = []
+        self.bad_upc: list[np.ndarray] = []
+        self.bad_qty: list[np.ndarray] = []
+        self.n = 0
+
+    def add_chunk(self, upcs: list, qtys: list, tss: list, min_len: int = 4):
+        rows = np.arange(self.n, self.n + len(upcs)) + 2   # 엑셀 행 번호 (헤더=1)
+        upc, upc_ok, qty, qty_ok, ts = check_columns(upcs, qtys, tss, min_len)
+        self.bad_upc.append(rows[~upc_ok])
+        self.bad_qty.append(rows[~qty_ok])
+        self.upc.append(upc.astype(object).where(upc.notna(), None).to_numpy())
+        self.qty.append(qty)
+        self.ts.append(ts)
+        self.n += len(upcs)
+
+    def finish(self) -> RowStore:
+        if not self.n:
+            return RowStore()
+        upc = np.concatenate(self.upc)
+
+        # 1) 잘못된 UPC (빈값/비알파넘/길이<4)
+        bad = np.concatenate(self.bad_upc)
+        if len(bad):
+            raise ValueError(f"잘못된 UPC 행: {bad.tolist()}")
+
+        # 2) 중복 UPC (그룹별 첫 번째만 표시) — 대문자 기준
+        s = pd.Series(upc)
+        dup_mask = s.duplicated(keep=False).to_numpy()
+        if dup_mask.any():
+            first = pd.Series(np.flatnonzero(dup_mask)).groupby(s[dup_mask].to_numpy()).min()
+            raise ValueError(f"중복된 UPC 행: {sorted((first + 2).tolist())}")
+
+        # 3) Qty 유효성
+        bad = np.concatenate(self.bad_qty)
+        if len(bad):
+            raise ValueError(f"잘못된 Qty 행: {bad.tolist()}")
+
+        return RowStore.from_columns(upc, np.concatenate(self.qty), np.concatenate(self.ts))
+
+
+@perf.timed
+def import_store(path: str, chunk_rows: int = CHUNK_ROWS, progress=None) -> RowStore:
+    """openpyxl read_only 모드로 행을 흘려 읽으며 청크 단위로 검증
+
+    progress(rows)는 청크마다 호출된다 (예외를 던지면 import 중단).
+    """
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = wb.worksheets[0].iter_rows(values_only=True)
+
+        # 헤더: 첫 번째 비어있지 않은 행
+        header = None
+        for r in rows:
+            if r.count(None) != len(r):
+                header = r
+                break
+        if header is None:
+            return RowStore()
+        width = len(header)
+        pos = {}
+        for i, h in enumerate(header):
+            if h is not None:
+                pos.setdefault(str(h), i)
+        iu, iq, it = (pos.get(c) for c in COLUMNS)
+
+        cols = _Columns()
+        upcs, qtys, tss = [], [], []
+        pending_blank = 0   # 끝부분 빈 행은 버리고, 중간 빈 행은 유지 (pd.read_excel과 동일)
+        for r in rows:
+            n = len(r)
+            if r.count(None) == n:
+                pending_blank += 1
+                continue
+            if pending_blank:
+                upcs += [None] * pending_blank
+                qtys += [None] * pending_blank
+                tss += [None] * pending_blank
+                pending_blank = 0
+            if n < width:
+                r = r + (None,) * (width - n)
+            u = r[iu] if iu is not None else None
+            if type(u) is float and u.is_integer():
+                u = int(u)   # 숫자 셀 1234.0 → "1234"
+            upcs.append(u)
+            qtys.append(r[iq] if iq is not None else None)
+            tss.append(r[it] if it is not None else None)
+            if len(upcs) >= chunk_rows:
+                cols.add_chunk(upcs, qtys, tss)
+                upcs, qtys, tss = [], [], []
+                if progress:
+                    progress(cols.n)
+        if upcs:
+            cols.add_chunk(upcs, qtys, tss)
+            if progress:
+                progress(cols.n)
+    finally:
+        wb.close()
+    return cols.finish()
+
+def import_excel(path: str, progress=None) -> pd.DataFrame:
+    return import_store(path, progress=progress).to_dataframe()
+
+@perf.timed
+def export_excel(data: pd.DataFrame | RowStore, path: str, progress=None, chunk_rows: int = CHUNK_ROWS,
+                 activity: ScanActivity | None = None):
+    """openpyxl write_only 모드로 행을 흘려 쓰기 (전체 프레임 복사 없음)
+
+    LastScannedAt은 엑셀 날짜/시간 셀로 기록되어 import_excel로 그대로 다시 읽힌다.
+    activity(스캔 로그 집계)가 있으면 첫 시트 뒤에 처리량/UPC별 스캔/공백 시트를 덧붙인다.
+    """
+    if isinstance(data, RowStore):
+        upc, qty, ts = data.upc_column(), data.qty_column(), data.ts_column()
+    else:
+        upc = data["UPC"].astype(object).where(data["UPC"].notna(), None).to_numpy()
+        qty = data["Qty"].to_numpy()
+        ts = pd.to_datetime(data["LastScannedAt"], errors="coerce").to_numpy(dtype="datetime64[ns]").view(np.int64)
+    n = len(upc)
+    if progress:
+        progress(0)
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet()
+    ws.append(COLUMNS)
+    for start in range(0, n, chunk_rows):
+        stop = min(start + chunk_rows, n)
+        # 청크 단위로 파이썬 객체 변환 (NaT → None, ns → µs datetime)
+        ts_chunk = ts[start:stop]
+        dts = ts_chunk.view("datetime64[ns]").astype("datetime64[us]").astype(object)
+        dts[ts_chunk == NAT] = None
+        for row in zip(upc[start:stop].tolist(), qty[start:stop].tolist(), dts.tolist()):
+            ws.append(row)
+        if progress:
+            progress(stop)
+    if activity is not None and len(activity):
+        write_activity_sheets(wb, activity, upc)
+    wb.save(path)
+
+@perf.timed
+def save_atomic(export, data, path: str, progress=None) -> str:
+    """임시 파일에 쓴 뒤 교체 — 취소/실패 시 기존 파일은 그대로 남는다"""
+    root, ext = os.path.splitext(path)
+    tmp = f"{root}.saving{ext}"
+    try:
+        export(data, tmp, progress=progress)
+        if progress:
+            progress(len(data))   # 교체 직전 마지막 취소 확인
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+    return path
+
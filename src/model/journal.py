@@ -0,0 +1,301 @@
+import json
+import os
+import struct
+import threading
+import numpy as np
+
+from .store import NAT, RowStore
+
+# 파일 구조: MAGIC + 헤더 길이(u4) + 헤더 JSON + 64바이트 고정 레코드들
+MAGIC = b"UPCJ1\n"
+OP_APPEND = 1   # 신규 UPC (row, ts, upc)
+OP_ADD = 2      # 수량 증가 (row, value=증가량, ts)
+OP_SET = 3      # 값 수정 (row, value=qty, ts=NAT면 유지, upc_len=0이면 UPC 유지)
+OP_CONT = 4     # 40바이트를 넘는 UPC의 이어지는 부분
+OP_POP = 5      # 마지막 행 제거 (row) — 추가 되돌리기
+
+UPC_FIELD = 40
+_REC = struct.Struct("<BBHiqq40s")
+REC_DTYPE = np.dtype([("op", "u1"), ("flags", "u1"), ("upc_len", "<u2"), ("row", "<i4"),
+                      ("value", "<i8"), ("ts", "<i8"), ("upc", f"S{UPC_FIELD}")])
+KEEP_QTY = 1    # OP_SET flags: Qty 유지
+EXACT_TS = 2    # OP_SET flags: ts가 NAT여도 그대로 기록 (되돌리기로 빈 시각 복원)
+
+
+def default_journal_path() -> str:
+    return os.path.join(os.path.expanduser("~"), ".upc_counter", "scan.journal")
+
+
+def base_stat(base: str | None) -> dict:
+    if not base or not os.path.exists(base):
+        return {"base": base, "mtime_ns": None, "size": None}
+    st = os.stat(base)
+    return {"base": base, "mtime_ns": st.st_mtime_ns, "size": st.st_size}
+
+
+def _encode(op: int, row: int, value: int = 0, ts: int = NAT, upc: str | None = None, flags: int = 0) -> bytes:
+    raw = upc.encode("utf-8") if upc else b""
+    out = _REC.pack(op, flags, len(raw), row, value, ts, raw[:UPC_FIELD])
+    for i in range(UPC_FIELD, len(raw), UPC_FIELD):
+        out += _REC.pack(OP_CONT, 0, 0, row, 0, NAT, raw[i:i + UPC_FIELD])
+    return out
+
+
+def read_header(path: str) -> tuple[dict, int] | None:
+    """(헤더, 레코드 시작 위치) — 저널이 없거나 손상됐으면 None"""
+    try:
+        with open(path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                return None
+            size = struct.unpack("<I", f.read(4))[0]
+            header = json.loads(f.read(size).decode("utf-8"))
+    except (OSError, ValueError, struct.error):
+        return None
+    return header, len(MAGIC) + 4 + size
+
+
+def pending_records(path: str) -> int:
+    """복구할 레코드 수 (0이면 복구할 것 없음)"""
+    info = read_header(path)
+    if info is None:
+        return 0
+    return max(os.path.getsize(path) - info[1], 0) // REC_DTYPE.itemsize
+
+
+def base_matches(header: dict) -> bool:
+    """기준 workbook이 저널 작성 당시와 같은지 (저장 직후 크래시 시 이중 반영 방지)"""
+    cur = base_stat(header.get("base"))
+    return cur["mtime_ns"] == header.get("mtime_ns") and cur["size"] == header.get("size")
+
+
+def _decode_upcs(recs: np.ndarray, idx: np.ndarray) -> list:
+    upcs = np.char.decode(recs["upc"][idx], "utf-8").astype(object)
+    long = np.flatnonzero(recs["upc_len"][idx] > UPC_FIELD)
+    for k in long:   # 드묾: 이어지는 OP_CONT 레코드를 붙인다
+        i = idx[k]
+        n = -(-int(recs["upc_len"][i]) // UPC_FIELD)
+        upcs[k] = b"".join(recs["upc"][i:i + n]).decode("utf-8")
+    return upcs
+
+
+def replay(path: str, store: RowStore, start: int = 0, touched: list | None = None) -> int:
+    """저널 레코드를 store에 반영하고 반영한 이벤트 수를 돌려준다
+
+    OP_SET/OP_POP 사이 구간마다 append는 일괄 추가, 수량은 np.add.at,
+    LastScannedAt은 행별 마지막 이벤트 값으로 한 번에 적용한다.
+    start 번째 레코드부터 재생하며, touched가 주어지면 바뀐 행 번호 배열을 담는다.
+    """
+    info = read_header(path)
+    if info is None:
+        return 0
+    with open(path, "rb") as f:
+        f.seek(info[1] + start * REC_DTYPE.itemsize)
+        data = f.read()
+    recs = np.frombuffer(data, dtype=REC_DTYPE, count=len(data) // REC_DTYPE.itemsize)  # 잘린 꼬리는 무시
+    ops = recs["op"]
+    sets = np.flatnonzero((ops == OP_SET) | (ops == OP_POP))
+    bounds = np.concatenate([[-1], sets, [len(recs)]])
+    applied = 0
+    for a, b in zip(bounds[:-1], bounds[1:]):
+        seg = slice(a + 1, b)
+        seg_ops = ops[seg]
+        rows = recs["row"][seg].astype(np.int64)
+        app_idx = np.flatnonzero(seg_ops == OP_APPEND)
+        add_idx = np.flatnonzero(seg_ops == OP_ADD)
+
+        if len(app_idx):
+            expect = np.arange(len(store), len(store) + len(app_idx))
+            if not np.array_equal(rows[app_idx], expect):
+                raise ValueError("저널 행 번호가 기준 파일과 맞지 않습니다.")
+            upcs = _decode_upcs(recs, app_idx + a + 1)
+            store.extend(upcs, np.zeros(len(app_idx), dtype=np.int64), recs["ts"][seg][app_idx])
+        if len(add_idx):
+            add_rows = rows[add_idx]
+            if add_rows.min() < 0 or add_rows.max() >= len(store):
+                raise ValueError("저널 행 번호가 기준 파일과 맞지 않습니다.")
+            np.add.at(store.qty_column(), add_rows, recs["value"][seg][add_idx])
+            # 행별 마지막 이벤트의 시각
+            events = np.sort(np.concatenate([app_idx, add_idx]))
+            uniq, first = np.unique(rows[events][::-1], return_index=True)
+            store.ts_column()[uniq] = recs["ts"][seg][events][::-1][first]
+        applied += len(app_idx) + len(add_idx)
+        if touched is not None:
+            touched.append(rows[app_idx])
+            touched.append(rows[add_idx])
+
+        if b < len(recs):
+            rec = recs[b]
+            row = int(rec["row"])
+            if not 0 <= row < len(store):
+                raise ValueError("저널 행 번호가 기준 파일과 맞지 않습니다.")
+            if rec["op"] == OP_POP:
+                if row != len(store) - 1:
+                    raise ValueError("저널 행 번호가 기준 파일과 맞지 않습니다.")
+                store.pop()
+                applied += 1
+                continue
+            if rec["upc_len"]:
+                store.set_upc(row, _decode_upcs(recs, np.array([b]))[0])
+            if not rec["flags"] & KEEP_QTY:
+                store.set_qty(row, int(rec["value"]))
+            if rec["ts"] != NAT or rec["flags"] & EXACT_TS:
+                store.set_ts(row, int(rec["ts"]))
+            if touched is not None:
+                touched.append(np.array([row], dtype=np.int64))
+            applied += 1
+    return applied
+
+
+class Journal:
+    """스캔 변경 내역을 추가 기록하는 저널 (그룹 커밋)
+
+    record_*는 메모리 버퍼에만 쌓고, 백그라운드 스레드가 interval_ms마다
+    한 번에 write + fsync 한다. export_excel 성공 후 compact()로 비운다.
+
+    잠금은 둘: _lock은 버퍼/레코드 수/fd 교체만 잠깐 잡고, 파일 쓰기(write/fsync, compact의
+    다시 쓰기)는 _io_lock 아래에서 _lock 없이 한다 — GUI 스레드의 record_*가 디스크를 기다리지 않게.
+    두 잠금을 같이 잡을 때는 항상 _io_lock → _lock 순서.
+    """
+    def __init__(self, path: str, interval_ms: int = 200):
+        self.path = path
+        self.interval = interval_ms / 1000
+        self._lock = threading.Lock()      # _buf, _count, _fd
+        self._io_lock = threading.Lock()   # 파일 쓰기 (flush / compact / start / close)
+        self._buf = bytearray()
+        self._fd: int | None = None
+        self._count = 0          # 파일 + 버퍼의 레코드 수
+        self._written = 0        # 파일에 쓴 레코드 수 (_io_lock 아래에서만 바뀜)
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.generation = 0      # start()마다 증가 — 오래된 compact 요청 무시용
+
+    @property
+    def active(self) -> bool:
+        return self._fd is not None
+
+    # --- 시작/종료 ---
+    def _write_new(self, path: str, base: str | None, body: bytes = b"", checkpoint: dict | None = None):
+        header = dict(base_stat(base))
+        if checkpoint:
+            header["checkpoint"] = checkpoint
+        header = json.dumps(header).encode("utf-8")
+        with open(path, "wb") as f:
+            f.write(MAGIC + struct.pack("<I", len(header)) + header + body)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _open_fd(self):
+        self._fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | getattr(os, "O_BINARY", 0))
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="journal-flush", daemon=True)
+            self._thread.start()
+
+    def start(self, base: str | None):
+        """기준 파일(base)로 새 저널 시작 — 기존 내용은 버림"""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with self._io_lock, self._lock:
+            self._close_fd()
+            self._buf.clear()
+            self._write_new(self.path, base)
+            self._count = self._written = 0
+            self.generation += 1
+            self._open_fd()
+
+    def resume(self):
+        """복구한 저널에 이어서 기록"""
+        with self._io_lock, self._lock:
+            self._close_fd()
+            self._count = self._written = pending_records(self.path)
+            # 크래시로 잘린 마지막 레코드는 잘라내고 이어 쓴다
+            os.truncate(self.path, read_header(self.path)[1] + self._count * REC_DTYPE.itemsize)
+            self._open_fd()
+
+    def close(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        with self._io_lock:
+            self._flush_io()
+            with self._lock:
+                self._close_fd()
+
+    def _close_fd(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    # --- 그룹 커밋 ---
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.flush()
+
+    def _flush_io(self):
+        """(_io_lock을 잡은 채로) 버퍼를 떼어 내고 write + fsync는 _lock 없이"""
+        with self._lock:
+            if self._fd is None or not self._buf:
+                return
+            data, self._buf = bytes(self._buf), bytearray()
+            fd, n = self._fd, self._count
+        os.write(fd, data)
+        os.fsync(fd)
+        self._written = n
+
+    def flush(self):
+        with self._io_lock:
+            self._flush_io()
+
+    # --- 기록 ---
+    def _put(self, rec: bytes):
+        with self._lock:
+            if self._fd is None:
+                return
+            self._buf += rec
+            self._count += len(rec) // REC_DTYPE.itemsize
+
+    def record_append(self, row: int, upc: str, ts: int):
+        self._put(_encode(OP_APPEND, row, 0, ts, upc))
+
+    def record_add(self, row: int, amount: int, ts: int):
+        self._put(_encode(OP_ADD, row, amount, ts))
+
+    def record_set(self, row: int, upc: str | None = None, qty: int | None = None, ts: int = NAT,
+                   exact_ts: bool = False):
+        flags = (KEEP_QTY if qty is None else 0) | (EXACT_TS if exact_ts else 0)
+        self._put(_encode(OP_SET, row, qty or 0, ts, upc, flags))
+
+    def record_pop(self, row: int):
+        self._put(_encode(OP_POP, row))
+
+    def position(self) -> int:
+        """현재까지 기록된 레코드 수 (compact의 keep_from으로 사용)"""
+        with self._lock:
+            return self._count
+
+    def compact(self, base: str | None, keep_from: int, checkpoint: dict | None = None,
+                generation: int | None = None) -> bool:
+        """저장 완료 후 저널 정리: 새 기준 파일 + 저장 이후(keep_from~) 레코드만 남김
+
+        checkpoint({"path", "seq"})가 주어지면 기준은 workbook + 자동 저장 체크포인트.
+        다시 쓰는 동안 들어온 레코드는 버퍼에 남아 있다가 새 파일로 이어 쓴다 (record_*는 막지 않음).
+        """
+        with self._io_lock:
+            if self._fd is None or (generation is not None and generation != self.generation):
+                return False
+            self._flush_io()
+            written = self._written
+            info = read_header(self.path)
+            with open(self.path, "rb") as f:
+                f.seek(info[1] + keep_from * REC_DTYPE.itemsize)
+                tail = f.read(max(written - keep_from, 0) * REC_DTYPE.itemsize)
+            tmp = self.path + ".tmp"
+            self._write_new(tmp, base, tail, checkpoint)
+            kept = len(tail) // REC_DTYPE.itemsize
+            with self._lock:   # 파일 바꿔 끼우기만 (버퍼는 그대로 → 다음 flush에서 새 파일로)
+                self._close_fd()
+                os.replace(tmp, self.path)
+                self._count = kept + (self._count - written)
+                self._written = kept
+                self._open_fd()
+        return True
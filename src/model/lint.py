@@ -0,0 +1,422 @@
+import io
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from .io_excel import CHUNK_ROWS, check_columns
+from .store import COLUMNS, NAT
+
+# 검사 전용 모드: 통합문서를 불러오지 않고 모든 규칙을 한 번에 검사해 오류 보고서를 만든다
+# import_store는 첫 번째로 걸린 분류(UPC → 중복 → Qty)에서 멈추지만, 여기서는 전부 모은다.
+# openpyxl read_only는 앞 행을 건너뛰어도 XML을 처음부터 다 파싱하므로 행 번호(min_row)로는
+# 나눌 수 없다. 시트 XML을 <row> 경계의 바이트 구간으로 잘라, 프로세스마다 자기 구간만 파싱한다.
+# 셀 값 변환은 openpyxl의 WorkSheetParser를 그대로 써서 import와 같은 값을 본다.
+#
+# ⚠️ 나눠 읽기는 openpyxl 내부 API에 기댄다: ExcelReader의 읽기 단계, worksheet._reader의
+# WorkSheetParser/ROW_TAG, wb._date_formats/_timedelta_formats. 확인한 버전(requirements.txt의
+# openpyxl 3.1.x)에서만 쓰고, 다른 버전이거나 내부 API가 없으면 공개 API(read_only iter_rows)로
+# 현재 프로세스에서 한 번에 읽는다 (결과는 같고 나눠 읽지 못할 뿐).
+
+RULES = ("UPC", "Duplicate", "Qty", "LastScannedAt", "Blank")
+BAD_UPC, DUPLICATE, BAD_QTY, BAD_TS, BLANK = range(len(RULES))
+WARNING_RULES = (BAD_TS,)     # 불러오기는 되는 규칙 (읽지 못한 시각은 빈 값이 됨)
+PIECE_BYTES = 4 << 20         # 작업 하나가 맡는 시트 XML 크기 (풀어 놓은 기준, 대략 3만 행)
+
+_SPLIT_OPENPYXL = ("3.1.",)   # 나눠 읽기를 확인한 openpyxl 버전
+
+_RULE_COLUMN = ("UPC", "UPC", "Qty", "LastScannedAt", "")
+_ROW_TAG = re.compile(rb"<(?:[\w.-]+:)?row[\s>/]")
+_ROOT_TAG = re.compile(rb"<((?:[\w.-]+:)?worksheet)[\s>]")
+_SHEET_DATA = re.compile(rb"<(?:[\w.-]+:)?sheetData\s*(/?)>")
+_SHEET_DATA_END = re.compile(rb"</(?:[\w.-]+:)?sheetData>")
+
+
+class LintReport:
+    """규칙 위반 목록 — (행, 규칙) 순. values는 위반이 있는 행의 원래 셀 값 (UPC, Qty, LastScannedAt)"""
+    def __init__(self, path: str, rows: int, issue_row: np.ndarray, issue_rule: np.ndarray,
+                 messages: list, values: dict):
+        order = np.lexsort((issue_rule, issue_row))
+        self.path = path
+        self.rows = rows                       # 검사한 데이터 행 수 (헤더 제외, 끝부분 빈 행 제외)
+        self.issue_row = issue_row[order]      # 엑셀 행 번호
+        self.issue_rule = issue_rule[order]
+        self.messages = [messages[i] for i in order.tolist()]
+        self.values = values
+
+    def __len__(self) -> int:
+        return len(self.issue_row)
+
+    def counts(self) -> np.ndarray:
+        """규칙별 위반 수"""
+        return np.bincount(self.issue_rule, minlength=len(RULES))
+
+    @property
+    def importable(self) -> bool:
+        """오류 없이 불러올 수 있는지 (경고만 있으면 True)"""
+        return not np.isin(self.issue_rule, WARNING_RULES, invert=True).any()
+
+    def to_dataframe(self) -> pd.DataFrame:
+        col = {c: i for i, c in enumerate(COLUMNS)}
+        cells = []
+        for row, rule in zip(self.issue_row.tolist(), self.issue_rule.tolist()):
+            name = _RULE_COLUMN[rule]
+            cells.append(self.values[row][col[name]] if name else None)
+        return pd.DataFrame({
+            "Row": self.issue_row,
+            "Column": np.array(_RULE_COLUMN, dtype=object)[self.issue_rule],
+            "Rule": pd.Categorical.from_codes(self.issue_rule, RULES),
+            "Value": pd.Series(cells, dtype=object),
+            "Message": self.messages,
+        })
+
+
+# --- 통합문서 부품 읽기 / 시트 XML 구간 나누기 ---
+def _split_supported() -> bool:
+    """설치된 openpyxl에서 시트 XML 나눠 읽기(내부 API)를 쓸 수 있는지"""
+    import openpyxl
+    if not openpyxl.__version__.startswith(_SPLIT_OPENPYXL):
+        return False
+    try:
+        from openpyxl.reader.excel import ExcelReader
+        from openpyxl.worksheet._reader import ROW_TAG, WorkSheetParser  # noqa: F401
+    except ImportError:
+        return False
+    return all(hasattr(ExcelReader, step) for step in ("read_manifest", "read_strings", "read_workbook"))
+
+
+def _book(path: str):
+    """(첫 시트 XML 경로, 공유 문자열, epoch, 날짜 서식, 시간 간격 서식)
+
+    load_workbook(read_only)은 시트 크기를 알려고 <dimension>이 없는 파일을 끝까지 한 번 파싱하므로,
+    같은 순서로 부품만 읽고 시트는 건드리지 않는다.
+    """
+    from openpyxl.reader.excel import ExcelReader
+    from openpyxl.styles.stylesheet import apply_stylesheet
+    reader = ExcelReader(path, read_only=True, data_only=True)
+    try:
+        reader.read_manifest()
+        reader.read_strings()
+        reader.read_workbook()
+        apply_stylesheet(reader.archive, reader.wb)
+        member = None
+        for _, rel in reader.parser.find_sheets():
+            if rel.target in reader.valid_files and "chartsheet" not in rel.Type:
+                member = rel.target
+                break
+    finally:
+        reader.archive.close()
+    wb = reader.wb
+    return member, reader.shared_strings, wb.epoch, wb._date_formats, wb._timedelta_formats
+
+
+def _parser(book) -> "WorkSheetParser":
+    from openpyxl.worksheet._reader import WorkSheetParser
+    _, shared, epoch, dates, timedeltas = book
+    return WorkSheetParser(None, shared, data_only=True, epoch=epoch,
+                           date_formats=dates, timedelta_formats=timedeltas)
+
+
+def _rows(xml: bytes, wrap: tuple[bytes, bytes], parser):
+    """<row> 요소들만 든 바이트 → (엑셀 행 번호, {열 번호: 값}) — 빈 셀 제외"""
+    from openpyxl.worksheet._reader import ROW_TAG
+    from openpyxl.xml.functions import iterparse
+    for _, el in iterparse(io.BytesIO(wrap[0] + xml + wrap[1])):
+        if el.tag != ROW_TAG:
+            continue
+        idx, cells = parser.parse_row(el)
+        el.clear()
+        yield idx, {c["column"] - 1: c["value"] for c in cells if c["value"] is not None}
+
+
+class _Sheet:
+    """첫 번째 시트의 헤더와 XML 구간 (작업 프로세스에 넘기는 값만)"""
+    def __init__(self, path: str):
+        import zipfile
+        self.book = book = _book(path)
+        self.member = book[0]
+        self.header_row, self.header = 0, {}
+        self.bounds = []   # [(시작, 끝)] 바이트 구간 — 각각 <row> 요소만 온전히 포함
+        if self.member is None:
+            return
+        with zipfile.ZipFile(path) as z:
+            xml = z.read(self.member)
+        root = _ROOT_TAG.search(xml)
+        start = _SHEET_DATA.search(xml)
+        self.root = xml[root.start():xml.index(b">", root.end() - 1) + 1] if root else b""
+        self.close = b"</" + root.group(1) + b">" if root else b""
+        if not root or not start or start.group(1):
+            return
+        body = start.end()
+        end = _SHEET_DATA_END.search(xml, body).start()
+        first = _ROW_TAG.search(xml, body, end)
+        if first is None:
+            return
+        # 헤더: 첫 번째 비어있지 않은 행 (import_store와 동일)
+        for idx, cells in _rows(xml[body:end], (self.root, self.close), _parser(book)):
+            if cells:
+                self.header_row, self.header = idx, cells
+                break
+        if not self.header:
+            return
+        # 행 번호(r 속성)가 없는 파일은 앞에서부터 세어야 하므로 나누지 않는다
+        numbered = re.match(rb"<[^>]*\sr=", xml[first.start():xml.index(b">", first.start()) + 1])
+        pieces = max(1, (end - body) // PIECE_BYTES) if numbered else 1
+        cuts = [first.start()]
+        for k in range(1, pieces):
+            m = _ROW_TAG.search(xml, body + (end - body) * k // pieces, end)
+            if m is None:
+                break
+            if m.start() > cuts[-1]:
+                cuts.append(m.start())
+        cuts.append(end)
+        self.bounds = list(zip(cuts[:-1], cuts[1:]))
+
+
+_worker_cache: dict = {}   # 작업 프로세스별 (경로, 수정 시각) → _book() — 같은 파일의 다음 구간에 재사용
+
+
+def _cached_book(path: str):
+    key = (path, os.path.getmtime(path))
+    book = _worker_cache.get(key)
+    if book is None:
+        _worker_cache.clear()
+        book = _worker_cache[key] = _book(path)
+    return book
+
+
+def _lint_range(path: str, member: str, start: int, end: int, wrap: tuple[bytes, bytes],
+                header_row: int, cols: tuple, min_len: int):
+    """프로세스 풀 작업: [start, end) 바이트의 행을 읽어 규칙 검사
+
+    (행 번호, 원래 UPC/Qty/LastScannedAt, 정규화 UPC, 위반 비트) — 빈 행은 빼고 돌려준다.
+    """
+    import zipfile
+    with zipfile.ZipFile(path) as z, z.open(member) as f:
+        f.seek(start)   # 앞부분은 압축만 풀고 버린다 (파싱하지 않음)
+        chunk = f.read(end - start)
+    iu, iq, it = cols
+    rows, upcs, qtys, tss = [], [], [], []
+    for idx, cells in _rows(chunk, wrap, _parser(_cached_book(path))):
+        if idx <= header_row or not cells:
+            continue
+        u = cells.get(iu)
+        if type(u) is float and u.is_integer():
+            u = int(u)   # 숫자 셀 1234.0 → "1234" (import_store와 동일)
+        rows.append(idx)
+        upcs.append(u)
+        qtys.append(cells.get(iq))
+        tss.append(cells.get(it))
+    return _check(rows, upcs, qtys, tss, min_len)
+
+
+def _lint_plain(path: str, min_len: int, progress=None):
+    """내부 API 없이 공개 API(read_only iter_rows)로 첫 시트 전체 검사 → (헤더 행 번호, [구간 결과])"""
+    from openpyxl import load_workbook
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        header_row, cols = 0, None
+        rows, upcs, qtys, tss = [], [], [], []
+        for idx, r in enumerate(wb.worksheets[0].iter_rows(values_only=True), start=1):
+            if r.count(None) == len(r):
+                continue
+            if cols is None:   # 헤더: 첫 번째 비어있지 않은 행 (import_store와 동일)
+                pos = {}
+                for i, h in enumerate(r):
+                    if h is not None:
+                        pos.setdefault(str(h), i)
+                header_row, cols = idx, tuple(pos.get(c) for c in COLUMNS)
+                continue
+            u, q, t = (r[i] if i is not None and i < len(r) else None for i in cols)
+            if type(u) is float and u.is_integer():
+                u = int(u)
+            rows.append(idx)
+            upcs.append(u)
+            qtys.append(q)
+            tss.append(t)
+            if progress and len(rows) % CHUNK_ROWS == 0:
+                progress(len(rows))
+    finally:
+        wb.close()
+    if cols is None:
+        return 0, []
+    if progress:
+        progress(len(rows))
+    return header_row, [_check(rows, upcs, qtys, tss, min_len)]
+
+
+def _check(rows: list, upcs: list, qtys: list, tss: list, min_len: int):
+    """(행 번호, 원래 UPC/Qty/LastScannedAt, 정규화 UPC, 위반 비트)"""
+    upc, upc_ok, _, qty_ok, ts = check_columns(upcs, qtys, tss, min_len)
+    raw_ts = pd.Series(tss, dtype=object)
+    given = raw_ts.notna() & raw_ts.map(lambda v: not (isinstance(v, str) and not v.strip()))
+    ts_bad = (ts == NAT) & given.to_numpy(dtype=bool)
+    flags = (~upc_ok).astype(np.int8) << BAD_UPC | (~qty_ok).astype(np.int8) << BAD_QTY | ts_bad.astype(np.int8) << BAD_TS
+    return (np.array(rows, dtype=np.int64), np.array(upcs, dtype=object), np.array(qtys, dtype=object),
+            np.array(tss, dtype=object), upc.astype(object).where(upc.notna(), None).to_numpy(), flags)
+
+
+def _upc_reason(norm, min_len: int) -> str:
+    if not norm:
+        return "UPC가 비어 있음"
+    if not norm.isalnum():
+        return "알파벳/숫자 외 문자"
+    return f"{min_len}자 미만"
+
+
+def _qty_reason(raw) -> str:
+    if raw is None or (isinstance(raw, str) and not raw.strip()):
+        return "Qty가 비어 있음"
+    if isinstance(raw, (bool, np.bool_)):
+        return "정수가 아님"
+    try:
+        integral = float(raw.strip() if isinstance(raw, str) else raw).is_integer()
+    except (TypeError, ValueError, OverflowError):
+        integral = False
+    return "정수 범위(int64)를 벗어남" if integral else "정수가 아님"
+
+
+def lint_workbook(path: str, workers: int | None = None, progress=None, min_len: int = 4,
+                  mp_context=None) -> LintReport:
+    """첫 번째 시트 전체를 import 규칙으로 검사 (불러오지는 않음)
+
+    workers: 프로세스 수 (기본: CPU 수, 1이면 현재 프로세스에서 순서대로).
+    progress(rows)는 구간 하나를 검사할 때마다 호출된다 (예외를 던지면 중단).
+    mp_context: 프로세스 시작 방식 (GUI 스레드에서 부를 때는 "spawn" 컨텍스트).
+    """
+    if not _split_supported():
+        header_row, parts = _lint_plain(path, min_len, progress)
+        if not parts:
+            return LintReport(path, 0, np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int8), [], {})
+        return _collect(path, header_row, parts, min_len)
+    sheet = _Sheet(path)
+    if not sheet.bounds:
+        return LintReport(path, 0, np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int8), [], {})
+    pos = {}
+    for i, h in sorted(sheet.header.items()):
+        pos.setdefault(str(h), i)
+    cols = tuple(pos.get(c) for c in COLUMNS)
+    args = [(path, sheet.member, a, b, (sheet.root, sheet.close), sheet.header_row, cols, min_len)
+            for a, b in sheet.bounds]
+    workers = min(workers or os.cpu_count() or 1, len(args)) or 1
+
+    parts, done = [], 0
+    if workers > 1:
+        pool = ProcessPoolExecutor(max_workers=workers, mp_context=mp_context)
+        try:
+            for part in pool.map(_lint_range, *zip(*args)):
+                parts.append(part)
+                done += len(part[0])
+                if progress:
+                    progress(done)
+        finally:
+            pool.shutdown(cancel_futures=True)
+    else:
+        _worker_cache[(path, os.path.getmtime(path))] = sheet.book
+        try:
+            for a in args:
+                parts.append(_lint_range(*a))
+                done += len(parts[-1][0])
+                if progress:
+                    progress(done)
+        finally:
+            _worker_cache.clear()
+    return _collect(path, sheet.header_row, parts, min_len)
+
+
+def _collect(path: str, header_row: int, parts: list, min_len: int) -> LintReport:
+    """구간별 결과 합치기 + 구간을 넘나드는 규칙(중복, 중간 빈 행)"""
+    rows = np.concatenate([p[0] for p in parts])
+    upc, qty, ts, norm = (np.concatenate([p[k] for p in parts]) for k in range(1, 5))
+    flags = np.concatenate([p[5] for p in parts])
+    order = np.argsort(rows, kind="stable")
+    rows, upc, qty, ts, norm, flags = rows[order], upc[order], qty[order], ts[order], norm[order], flags[order]
+
+    out_rows, out_rules, messages = [], [], []
+
+    def add(idx: np.ndarray, rule: int, msgs: list):
+        out_rows.append(rows[idx] if rule != BLANK else idx)
+        out_rules.append(np.full(len(idx), rule, dtype=np.int8))
+        messages.extend(msgs)
+
+    bad = np.flatnonzero(flags & (1 << BAD_UPC))
+    add(bad, BAD_UPC, [_upc_reason(norm[i], min_len) for i in bad.tolist()])
+
+    # 중복: 올바른 UPC만, 대문자/공백 제거 후 — 처음 나온 행은 두고 나머지를 표시
+    ok = np.flatnonzero(~flags & (1 << BAD_UPC))
+    codes, _ = pd.factorize(norm[ok])
+    first = np.full(codes.max() + 1 if len(codes) else 0, len(rows), dtype=np.int64)
+    np.minimum.at(first, codes, ok)
+    dup = ok[first[codes] != ok]
+    add(dup, DUPLICATE, [f"{rows[first[c]]}행과 중복" for c in codes[first[codes] != ok].tolist()])
+
+    bad = np.flatnonzero(flags & (1 << BAD_QTY))
+    add(bad, BAD_QTY, [_qty_reason(qty[i]) for i in bad.tolist()])
+    bad = np.flatnonzero(flags & (1 << BAD_TS))
+    add(bad, BAD_TS, ["날짜/시간으로 읽을 수 없음 (빈 값으로 불러옴)"] * len(bad))
+
+    # 중간 빈 행 (import_store는 UPC/Qty 오류로 처리, 끝부분 빈 행은 무시)
+    last = int(rows[-1]) if len(rows) else header_row
+    blank = np.setdiff1d(np.arange(header_row + 1, last + 1), rows)
+    add(blank, BLANK, ["빈 행"] * len(blank))
+
+    issue_row = np.concatenate(out_rows)
+    at = np.searchsorted(rows, issue_row)
+    values = {}
+    for r, i in zip(issue_row.tolist(), at.tolist()):
+        if i < len(rows) and rows[i] == r:
+            values[r] = (upc[i], qty[i], ts[i])
+        else:
+            values[r] = (None, None, None)
+    return LintReport(path, last - header_row, issue_row, np.concatenate(out_rules), messages, values)
+
+
+def export_lint(report: LintReport, path: str, progress=None, chunk_rows: int = CHUNK_ROWS):
+    """.csv면 위반 목록, 아니면 xlsx — 위반 행의 원래 값에 문제 셀을 칠한 Rows 시트 + Summary 시트"""
+    if path.lower().endswith(".csv"):
+        report.to_dataframe().to_csv(path, index=False, encoding="utf-8-sig")
+        if progress:
+            progress(len(report))
+        return
+
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import PatternFill
+    fills = {rule: PatternFill("solid", fgColor="FFC7CE") for rule in range(len(RULES))}
+    fills[BAD_TS] = PatternFill("solid", fgColor="FFEB9C")   # 경고
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Rows")
+    ws.append(["Row"] + COLUMNS + ["Problems"])
+    col = {c: i for i, c in enumerate(COLUMNS)}
+    if progress:
+        progress(0)
+
+    # 행마다 한 줄 — 같은 행의 위반은 (행, 규칙) 순으로 붙어 있다
+    rows, rules, msgs = report.issue_row.tolist(), report.issue_rule.tolist(), report.messages
+    i, written = 0, 0
+    while i < len(rows):
+        j = i
+        while j < len(rows) and rows[j] == rows[i]:
+            j += 1
+        cells = [WriteOnlyCell(ws, v) for v in report.values[rows[i]]]
+        for k in range(i, j):
+            targets = cells[:2] if rules[k] == BLANK else [cells[col[_RULE_COLUMN[rules[k]]]]]
+            for cell in targets:
+                cell.fill = fills[rules[k]]
+        problems = "; ".join(f"{RULES[rules[k]]}: {msgs[k]}" for k in range(i, j))
+        ws.append([rows[i]] + cells + [problems])
+        written += 1
+        if progress and written % chunk_rows == 0:
+            progress(j)
+        i = j
+
+    summary = wb.create_sheet("Summary")
+    summary.append(["Rule", "Rows"])
+    for name, n in zip(RULES, report.counts().tolist()):
+        summary.append([name, n])
+    summary.append(["Checked rows", report.rows])
+    wb.save(path)
+    if progress:
+        progress(len(report))
@@ -0,0 +1,84 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from .io_excel import import_store
+from .store import RowStore
+
+# 여러 카운팅 스테이션의 통합문서를 하나로 합치기
+# 파일 읽기/검증은 프로세스 풀에서 병렬로, 합산은 concat + groupby 한 번으로 처리
+
+
+class FileReport(NamedTuple):
+    path: str
+    rows: int            # 읽은 행 수 (오류면 0)
+    error: str | None    # 검증 실패 메세지 — 이 파일은 합치지 않음
+    overlap: int         # 다른 파일에도 있는 UPC 수 (합산됨, 이중 카운트 확인용)
+
+
+class MergeResult(NamedTuple):
+    store: RowStore
+    files: list          # [FileReport] — 입력 순서
+    overlaps: pd.DataFrame   # 여러 파일에 나온 UPC의 파일별 수량 (UPC, File, Qty)
+
+
+def _load(path: str):
+    """프로세스 풀 작업: import_excel과 같은 규칙으로 검증 후 열 배열만 돌려준다"""
+    try:
+        store = import_store(path)
+    except Exception as e:
+        return path, None, str(e)
+    return path, (store.upc_column(), store.qty_column(), store.ts_column()), None
+
+
+def merge_workbooks(paths: list[str], workers: int | None = None, progress=None) -> MergeResult:
+    """UPC별 Qty 합계, LastScannedAt 최댓값으로 합친다 (행 순서는 처음 나온 순서)
+
+    workers: 프로세스 수 (기본: CPU 수, 1이면 현재 프로세스에서 순서대로).
+    progress(done)는 파일 하나를 읽을 때마다 호출된다.
+    """
+    workers = min(workers or os.cpu_count() or 1, len(paths)) or 1
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            loaded = []
+            for item in pool.map(_load, paths):
+                loaded.append(item)
+                if progress:
+                    progress(len(loaded))
+    else:
+        loaded = []
+        for path in paths:
+            loaded.append(_load(path))
+            if progress:
+                progress(len(loaded))
+
+    ok = [(i, cols) for i, (_, cols, err) in enumerate(loaded) if err is None]
+    if ok:
+        upc = np.concatenate([c[0] for _, c in ok])
+        qty = np.concatenate([c[1] for _, c in ok])
+        ts = np.concatenate([c[2] for _, c in ok])
+        file_id = np.concatenate([np.full(len(c[0]), i, dtype=np.int64) for i, c in ok])
+    else:
+        upc, qty, ts, file_id = (np.empty(0, dtype=object), np.empty(0, dtype=np.int64),
+                                 np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64))
+
+    # ✅ 합산: UPC는 import 시 이미 대문자/공백 제거로 정규화됨. NaT(int64 최솟값)는 max에서 자연히 밀림
+    df = pd.DataFrame({"UPC": upc, "Qty": qty, "ts": ts, "file": file_id})
+    merged = df.groupby("UPC", sort=False).agg(Qty=("Qty", "sum"), ts=("ts", "max"), files=("file", "nunique"))
+    store = RowStore.from_columns(merged.index.to_numpy(dtype=object), merged["Qty"].to_numpy(np.int64),
+                                  merged["ts"].to_numpy(np.int64))
+
+    # 여러 파일에 나온 UPC → 파일별 겹침 수 + 상세 표
+    shared = df["UPC"].map(merged["files"]).to_numpy() > 1 if len(df) else np.zeros(0, dtype=bool)
+    counts = np.bincount(file_id[shared], minlength=len(paths))
+    rows = np.bincount(file_id, minlength=len(paths))
+    files = [FileReport(path, int(rows[i]), err, int(counts[i])) for i, (path, _, err) in enumerate(loaded)]
+    overlaps = pd.DataFrame({
+        "UPC": upc[shared],
+        "File": np.array([os.path.basename(p) for p in paths], dtype=object)[file_id[shared]],
+        "Qty": qty[shared],
+    }).sort_values(["UPC", "File"], kind="stable", ignore_index=True)
+    return MergeResult(store, files, overlaps)
@@ -0,0 +1,289 @@
+import numpy as np
+
+from .store import NAT
+
+# 스캔 이벤트 기록 (시계열)
+# LastScannedAt은 행마다 마지막 시각만 남기므로, 수량이 더해질 때마다 (시각, 행, 수량, 스테이션)을
+# 고정 폭 배열에 덧붙여 "스테이션별 분당 스캔 수", "멈춘 구간"을 계산할 수 있게 한다.
+# 집계(분당 처리량, UPC별 스캔 수, 공백 구간)는 이벤트가 들어올 때 묶음 단위로 갱신한다.
+#
+# 되돌리기/다시 실행 규칙: 기록은 지우지 않고 보정 이벤트를 덧붙인다 (amend).
+# 수량 스캔을 되돌리면 그 시각에 (-수량, 스캔 -1), 다시 실행하면 (+수량, 스캔 +1)을 같은 스테이션으로 남긴다.
+# 그래서 UPC별 Qty 합계는 언제나 "스캔으로 더해진 순 수량"이고, 세션 중 스캔으로만 바뀐 행이면
+# 표의 Qty 변화량과 같다 (직접 편집한 Qty는 기록하지 않음). 보정은 마지막 스캔 시각/공백 구간에는 넣지 않는다.
+
+MINUTE_NS = 60 * 10**9
+IDLE_GAP_NS = 5 * MINUTE_NS   # 이보다 긴 스캔 공백은 정지 구간으로 기록
+LOCAL = 0                     # 키보드/USB 스캐너 스테이션 번호
+LOCAL_NAME = "local"
+OTHER = 1                     # 스테이션 상한을 넘은 나머지 스캐너를 모으는 번호
+OTHER_NAME = "other"
+MAX_STATIONS = 1024           # 스테이션 번호 상한 (int16 열, 시트 행 수) — 넘치면 OTHER로 합침
+_STATION_SPAN = 1 << 16       # 분 × 스테이션 집계 키
+_DELTA_MIN, _DELTA_MAX = int(np.iinfo(np.int32).min), int(np.iinfo(np.int32).max)   # 이벤트 수량 열 범위 (넘으면 잘라 기록)
+_SMALL_BATCH = 8              # 이보다 작은 묶음은 스칼라 경로 (numpy 호출 비용이 더 큼)
+
+
+def _datetimes(ns: np.ndarray) -> list:
+    """epoch ns → 엑셀 셀용 datetime (NAT → None)"""
+    out = ns.view("datetime64[ns]").astype("datetime64[us]").astype(object)
+    out[ns == NAT] = None
+    return out.tolist()
+
+
+class ScanActivity:
+    """집계 스냅샷 — 백그라운드 저장에 넘기는 복사본"""
+    def __init__(self, minute, station, minute_scans, minute_qty,
+                 rows, row_scans, row_qty, row_last, gap_start, gap_end, stations):
+        self.minute, self.station = minute, station             # 분 시작 시각(ns), 스테이션 번호
+        self.minute_scans, self.minute_qty = minute_scans, minute_qty
+        self.rows, self.row_scans, self.row_qty, self.row_last = rows, row_scans, row_qty, row_last
+        self.gap_start, self.gap_end = gap_start, gap_end
+        self.stations = stations                                # 번호 → 이름
+
+    def __len__(self) -> int:
+        return int(self.minute_scans.sum())
+
+
+class ScanLog:
+    """append-only 스캔 이벤트 기록 + 증분 집계
+
+    이벤트 한 건 = ts int64 + row int32 + delta int32 + station int16 (18바이트).
+    RowStore처럼 미리 할당한 배열을 2배씩 늘린다. 행 번호는 저장 행(RowStore) 기준.
+    """
+    MIN_CAPACITY = 1024
+
+    def __init__(self, idle_gap_ns: int = IDLE_GAP_NS):
+        self.idle_gap_ns = int(idle_gap_ns)
+        self._names = [LOCAL_NAME, OTHER_NAME]
+        self._ids = {LOCAL_NAME: LOCAL, OTHER_NAME: OTHER}
+        self.clear()
+
+    def clear(self):
+        """기록/집계 비우기 (스테이션 번호는 유지)"""
+        cap = self.MIN_CAPACITY
+        self._ts = np.empty(cap, dtype=np.int64)
+        self._row = np.empty(cap, dtype=np.int32)
+        self._delta = np.empty(cap, dtype=np.int32)
+        self._station = np.empty(cap, dtype=np.int16)
+        self._n = 0
+        self._minutes: dict[int, list[int]] = {}   # 분 × 스테이션 키 → [스캔 수, 수량 합]
+        self._row_scans = np.zeros(0, dtype=np.int64)
+        self._row_qty = np.zeros(0, dtype=np.int64)
+        self._row_last = np.zeros(0, dtype=np.int64)
+        self._gaps: list[tuple[int, int]] = []   # (공백 시작, 끝) — 앞 이벤트와 idle_gap_ns 넘게 떨어진 곳
+        self._prev_ts = NAT
+
+    def __len__(self) -> int:
+        return self._n
+
+    @property
+    def nbytes(self) -> int:
+        """이벤트 배열이 차지하는 메모리 (할당된 용량 기준)"""
+        return self._ts.nbytes + self._row.nbytes + self._delta.nbytes + self._station.nbytes
+
+    def station_id(self, name: str) -> int:
+        """스테이션 이름 → 번호 (처음 보면 새로 부여, MAX_STATIONS개를 넘으면 OTHER)"""
+        sid = self._ids.get(name)
+        if sid is None:
+            if len(self._names) >= MAX_STATIONS:
+                return OTHER
+            sid = self._ids[name] = len(self._names)
+            self._names.append(name)
+        return sid
+
+    def check_stations(self, stations, n: int) -> list[int]:
+        """이벤트 n건의 스테이션 번호 검증 → int 리스트 (모델을 바꾸기 전에 부른다, 잘못되면 ValueError)"""
+        out = [int(x) for x in stations]
+        if len(out) != n:
+            raise ValueError(f"스테이션 번호 수({len(out)})가 이벤트 수({n})와 다릅니다.")
+        if out and not (0 <= min(out) and max(out) < len(self._names)):
+            raise ValueError("등록되지 않은 스테이션 번호입니다.")
+        return out
+
+    def stations(self) -> list[str]:
+        return list(self._names)
+
+    def _reserve(self, need: int):
+        cap = len(self._ts)
+        if need <= cap:
+            return
+        while cap < need:
+            cap *= 2
+        for name in ("_ts", "_row", "_delta", "_station"):
+            old = getattr(self, name)
+            new = np.empty(cap, dtype=old.dtype)
+            new[:self._n] = old[:self._n]
+            setattr(self, name, new)
+
+    def _reserve_rows(self, need: int):
+        size = len(self._row_scans)
+        if need <= size:
+            return
+        size = max(size * 2, need, self.MIN_CAPACITY)
+        for name, fill in (("_row_scans", 0), ("_row_qty", 0), ("_row_last", NAT)):
+            old = getattr(self, name)
+            new = np.full(size, fill, dtype=np.int64)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    # --- 기록 ---
+    def append(self, ts: int, row: int, delta: int, station: int = LOCAL):
+        """이벤트 한 건 — 키보드 스캔 경로라 numpy 벡터 연산 없이 스칼라로만 갱신"""
+        delta = min(max(delta, _DELTA_MIN), _DELTA_MAX)
+        n = self._n
+        if n == len(self._ts):
+            self._reserve(n + 1)
+        self._ts[n] = ts
+        self._row[n] = row
+        self._delta[n] = delta
+        self._station[n] = station
+        self._n = n + 1
+        key = (ts // MINUTE_NS) * _STATION_SPAN + station
+        cell = self._minutes.get(key)
+        if cell is None:
+            self._minutes[key] = [1, delta]
+        else:
+            cell[0] += 1
+            cell[1] += delta
+        if row >= len(self._row_scans):
+            self._reserve_rows(row + 1)
+        self._row_scans[row] += 1
+        self._row_qty[row] += delta
+        if ts > self._row_last[row]:
+            self._row_last[row] = ts
+        prev = self._prev_ts
+        if prev != NAT and ts - prev > self.idle_gap_ns:
+            self._gaps.append((prev, ts))
+        self._prev_ts = ts
+
+    def extend(self, ts, rows, deltas, stations=LOCAL):
+        """이벤트 묶음 추가 — ts/stations는 스칼라(묶음 공통) 또는 rows와 같은 길이"""
+        k = len(rows)
+        if not k:
+            return
+        if k <= _SMALL_BATCH and isinstance(ts, int):
+            for i in range(k):
+                self.append(ts, int(rows[i]), int(deltas[i]),
+                            stations if isinstance(stations, int) else int(stations[i]))
+            return
+        rows = np.asarray(rows, dtype=np.int64)
+        deltas = np.clip(np.asarray(deltas, dtype=np.int64), _DELTA_MIN, _DELTA_MAX)
+        start = self._n
+        self._reserve(start + k)
+        self._ts[start:start + k] = ts
+        self._row[start:start + k] = rows
+        self._delta[start:start + k] = deltas
+        self._station[start:start + k] = stations
+        self._n = start + k
+        self._rollup(start, start + k)
+
+    def _rollup(self, a: int, b: int):
+        """[a, b) 이벤트를 집계에 더한다"""
+        ts, rows, deltas = self._ts[a:b], self._row[a:b], self._delta[a:b].astype(np.int64)
+        st = self._station[a:b]
+
+        # 분 × 스테이션 처리량 (스캔 묶음은 보통 한 시각·한 스테이션이라 한 칸)
+        keys = (ts // MINUTE_NS) * _STATION_SPAN + st
+        if (keys == keys[0]).all():
+            uniq, scans, qty = keys[:1], [b - a], [int(deltas.sum())]
+        else:
+            uniq, inv = np.unique(keys, return_inverse=True)
+            scans = np.bincount(inv, minlength=len(uniq))
+            qty = np.zeros(len(uniq), dtype=np.int64)
+            np.add.at(qty, inv, deltas)
+        for key, s, q in zip(uniq.tolist(), list(scans), list(qty)):
+            cell = self._minutes.get(key)
+            if cell is None:
+                self._minutes[key] = [int(s), int(q)]
+            else:
+                cell[0] += int(s)
+                cell[1] += int(q)
+
+        # UPC(저장 행)별 스캔 수 / 수량 / 마지막 스캔
+        self._reserve_rows(int(rows.max()) + 1)
+        np.add.at(self._row_scans, rows, 1)
+        np.add.at(self._row_qty, rows, deltas)
+        np.maximum.at(self._row_last, rows, ts)
+
+        # 공백 구간: 바로 앞 이벤트와 idle_gap_ns 넘게 떨어진 곳
+        t = ts if self._prev_ts == NAT else np.concatenate(([self._prev_ts], ts))
+        if len(t) > 1:
+            idx = np.flatnonzero(np.diff(t) > self.idle_gap_ns)
+            self._gaps.extend(zip(t[idx].tolist(), t[idx + 1].tolist()))
+        self._prev_ts = int(ts[-1])
+
+    def amend(self, ts: int, row: int, delta: int, scans: int, station: int = LOCAL):
+        """되돌리기(scans=-1) / 다시 실행(scans=+1) 보정 — 이벤트로 남기되 마지막 스캔/공백 구간은 그대로"""
+        delta = min(max(delta, _DELTA_MIN), _DELTA_MAX)
+        n = self._n
+        if n == len(self._ts):
+            self._reserve(n + 1)
+        self._ts[n] = ts
+        self._row[n] = row
+        self._delta[n] = delta
+        self._station[n] = station
+        self._n = n + 1
+        key = (ts // MINUTE_NS) * _STATION_SPAN + station
+        cell = self._minutes.setdefault(key, [0, 0])
+        cell[0] += scans
+        cell[1] += delta
+        if row >= len(self._row_scans):
+            self._reserve_rows(row + 1)
+        self._row_scans[row] += scans
+        self._row_qty[row] += delta
+
+    def forget_row(self, row: int):
+        """저장 행이 지워짐(행 추가 되돌리기) — 같은 번호로 새 UPC가 들어오므로 행별 집계만 비운다"""
+        if row < len(self._row_scans):
+            self._row_scans[row] = self._row_qty[row] = 0
+            self._row_last[row] = NAT
+
+    # --- 조회 ---
+    def events(self) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """(ts, row, delta, station) — 복사 없는 view"""
+        n = self._n
+        return self._ts[:n], self._row[:n], self._delta[:n], self._station[:n]
+
+    def activity(self) -> ScanActivity:
+        # 되돌리기로 0이 된 분 칸은 빼고 내보낸다
+        minutes = {k: c for k, c in self._minutes.items() if c[0] or c[1]}
+        keys = np.fromiter(minutes, dtype=np.int64, count=len(minutes))
+        cells = np.array(list(minutes.values()), dtype=np.int64).reshape(-1, 2)
+        order = np.argsort(keys, kind="stable")
+        keys, cells = keys[order], cells[order]
+        rows = np.flatnonzero(self._row_scans)
+        gaps = np.array(self._gaps, dtype=np.int64).reshape(-1, 2)
+        return ScanActivity(
+            (keys // _STATION_SPAN) * MINUTE_NS, keys % _STATION_SPAN, cells[:, 0], cells[:, 1],
+            rows, self._row_scans[rows], self._row_qty[rows], self._row_last[rows],
+            gaps[:, 0], gaps[:, 1], self.stations())
+
+
+ACTIVITY_SHEETS = ("Throughput", "UPC Scans", "Idle")
+
+
+def write_activity_sheets(wb, activity: ScanActivity, upc: np.ndarray):
+    """export_excel용 추가 시트 — upc는 저장 스냅샷의 UPC 열 (행 번호 → UPC)"""
+    names = np.array(activity.stations, dtype=object)
+
+    ws = wb.create_sheet(ACTIVITY_SHEETS[0])
+    ws.append(["Minute", "Station", "Scans", "Qty"])
+    for row in zip(_datetimes(activity.minute), names[activity.station].tolist(),
+                   activity.minute_scans.tolist(), activity.minute_qty.tolist()):
+        ws.append(row)
+
+    ws = wb.create_sheet(ACTIVITY_SHEETS[1])
+    ws.append(["UPC", "Scans", "Qty", "LastScan"])
+    keep = activity.rows < len(upc)
+    order = np.argsort(-activity.row_scans[keep], kind="stable")   # 많이 스캔한 UPC부터
+    rows = activity.rows[keep][order]
+    for row in zip(upc[rows].tolist(), activity.row_scans[keep][order].tolist(),
+                   activity.row_qty[keep][order].tolist(), _datetimes(activity.row_last[keep][order])):
+        ws.append(row)
+
+    ws = wb.create_sheet(ACTIVITY_SHEETS[2])
+    ws.append(["From", "To", "Minutes"])
+    minutes = ((activity.gap_end - activity.gap_start) / MINUTE_NS).round(1)
+    for row in zip(_datetimes(activity.gap_start), _datetimes(activity.gap_end), minutes.tolist()):
+        ws.append(row)
@@ -0,0 +1,163 @@
+import json
+import mmap
+import struct
+import zlib
+
+import numpy as np
+
+from .store import COLUMNS, RowStore
+
+# 작업 세션 파일 (.upcs): 이 앱이 쓴 표를 XML 파싱/형 변환/재검증 없이 다시 연다
+# xlsx는 내보내기/가져오기 형식으로 남고, Open/Save As에서 둘 다 고를 수 있다.
+#
+# 파일 구조 (리틀 엔디언, 각 구역은 8바이트 정렬):
+#   헤더 64바이트   MAGIC | version u32 | flags u32 | count u64 | upc_size u64 | crc32 u64 | meta_size u32
+#   meta           JSON (schema, columns, validated ...)
+#   qty            count × int64
+#   ts             count × int64   LastScannedAt (epoch ns, NAT = 빈값)
+#   upc            UPC를 "\n"으로 이은 UTF-8 (빈 문자열 = 없음)
+#
+# 열기는 메모리 매핑(copy-on-write) — qty/ts는 복사 없이 모델의 열이 되고 UPC만 문자열로 만든다.
+# crc32가 맞고 저장할 때 검증을 통과했으면(validated) 다시 검증하지 않는다.
+
+MAGIC = b"UPCSES\x00\x01"
+VERSION = 1
+SCHEMA = 1
+HEADER_SIZE = 64
+_HEADER = struct.Struct("<8sIIQQQI")
+SESSION_EXT = ".upcs"
+
+
+def is_session(path: str) -> bool:
+    return path.lower().endswith(SESSION_EXT)
+
+
+def _align(n: int) -> int:
+    return (n + 7) & ~7
+
+
+def _pad(n: int) -> bytes:
+    return b"\0" * (_align(n) - n)
+
+
+def _check(upc: list, min_len: int = 4) -> str | None:
+    """import_store와 같은 UPC 규칙 — 문제 없으면 None, 있으면 오류 메세지"""
+    bad = [i for i, u in enumerate(upc) if len(u) < min_len or not u.isalnum()]
+    if bad:
+        return f"잘못된 UPC 행: {[i + 1 for i in bad[:20]]}"
+    if len(set(upc)) != len(upc):
+        seen: set = set()
+        dup = [i + 1 for i, u in enumerate(upc) if u in seen or seen.add(u)]
+        return f"중복된 UPC 행: {dup[:20]}"
+    return None
+
+
+def save_session(store: RowStore, path: str, progress=None):
+    """세션 파일 쓰기 — save_atomic과 함께 사용"""
+    n = len(store)
+    if progress:
+        progress(0)
+    upc = ["" if u is None else str(u) for u in store.upc_column().tolist()]
+    blob = "\n".join(upc).encode("utf-8")
+    if blob.count(b"\n") != max(n - 1, 0):
+        raise ValueError("UPC에 줄바꿈이 들어 있어 세션 파일로 저장할 수 없습니다.")
+    meta = json.dumps({
+        "schema": SCHEMA,
+        "columns": COLUMNS,
+        "rows": n,
+        "validated": _check(upc) is None,
+    }).encode("utf-8")
+    qty = np.ascontiguousarray(store.qty_column(), dtype="<i8").tobytes()
+    ts = np.ascontiguousarray(store.ts_column(), dtype="<i8").tobytes()
+
+    crc = 0
+    for part in (meta, qty, ts, blob):
+        crc = zlib.crc32(part, crc)
+    if progress:
+        progress(n)   # 쓰기 직전 취소 확인
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, 0, n, len(blob), crc, len(meta)).ljust(HEADER_SIZE, b"\0"))
+        for part in (meta, qty, ts):
+            f.write(part)
+            f.write(_pad(len(part)))
+        f.write(blob)
+
+
+def load_session(path: str, progress=None, verify: bool = True) -> RowStore:
+    """세션 파일 열기 — qty/ts는 메모리 매핑 그대로 (쓰기는 프로세스 안에서만 보임)"""
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        except ValueError:   # 빈 파일
+            raise ValueError(f"세션 파일이 아닙니다: {path}")
+    try:
+        upc, n, q_pos, t_pos = _read(mm, path, verify)
+    except Exception:
+        mm.close()
+        raise
+    if progress:
+        progress(0)
+    if not n:
+        mm.close()
+        return RowStore()
+
+    upc_col = np.empty(n, dtype=object)
+    upc_col[:] = upc
+    qty = np.frombuffer(mm, dtype="<i8", count=n, offset=q_pos)
+    ts = np.frombuffer(mm, dtype="<i8", count=n, offset=t_pos)
+    if progress:
+        progress(n)
+    return RowStore.wrap(upc_col, qty, ts)
+
+
+def _read(mm: mmap.mmap, path: str, verify: bool) -> tuple[list, int, int, int]:
+    """헤더/체크섬/UPC 확인 → (UPC 목록, 행 수, qty 위치, ts 위치)"""
+    if len(mm) < HEADER_SIZE:
+        raise ValueError(f"세션 파일이 아닙니다: {path}")
+    magic, version, _flags, n, upc_size, crc, meta_size = _HEADER.unpack_from(mm, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"세션 파일이 아닙니다: {path}")
+    q_pos = HEADER_SIZE + _align(meta_size)
+    t_pos = q_pos + _align(n * 8)
+    u_pos = t_pos + _align(n * 8)
+    if u_pos + upc_size != len(mm):
+        raise ValueError(f"세션 파일이 손상되었습니다: {path}")
+    meta = json.loads(mm[HEADER_SIZE:HEADER_SIZE + meta_size].decode("utf-8"))
+    if meta.get("schema") != SCHEMA or meta.get("columns") != COLUMNS:
+        raise ValueError(f"지원하지 않는 세션 형식입니다: {path}")
+
+    with memoryview(mm) as view:
+        if verify:
+            got = zlib.crc32(view[HEADER_SIZE:HEADER_SIZE + meta_size])
+            for a, size in ((q_pos, n * 8), (t_pos, n * 8), (u_pos, upc_size)):
+                got = zlib.crc32(view[a:a + size], got)
+            if got != crc:
+                raise ValueError(f"세션 파일이 손상되었습니다 (checksum): {path}")
+        upc = bytes(view[u_pos:u_pos + upc_size]).decode("utf-8").split("\n") if n else []
+    if len(upc) != n:
+        raise ValueError(f"세션 파일이 손상되었습니다: {path}")
+    if not (verify and meta.get("validated")):
+        # 체크섬을 건너뛰었거나 저장 당시 검증을 통과하지 못한 표 — xlsx 가져오기와 같은 규칙
+        err = _check(upc)
+        if err:
+            raise ValueError(err)
+    return upc, n, q_pos, t_pos
+
+
+def load_store(path: str, progress=None) -> RowStore:
+    """확장자에 따라 세션 파일 또는 xlsx (import_store 검증)"""
+    if is_session(path):
+        return load_session(path, progress=progress)
+    from .io_excel import import_store
+    return import_store(path, progress=progress)
+
+
+def save_store(store: RowStore, path: str, progress=None, activity=None):
+    """확장자에 따라 세션 파일 또는 xlsx — save_atomic과 함께 사용
+
+    activity(스캔 로그 집계)는 xlsx에만 추가 시트로 기록한다.
+    """
+    if is_session(path):
+        return save_session(store, path, progress=progress)
+    from .io_excel import export_excel
+    return export_excel(store, path, progress=progress, activity=activity)
@@ -1,10 +1,175 @@
-import pandas as pd
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+import numpy as np
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# pandas는 DataFrame이 실제로 필요할 때(불러오기/저장)만 import — 시작 경로에서 제외
 
 COLUMNS = ["UPC", "Qty", "LastScannedAt"]
 
-def make_empty_df() -> pd.DataFrame:
+# LastScannedAt 빈값(NaT)의 int64 표현
+NAT = np.iinfo(np.int64).min
+_EPOCH = datetime(1970, 1, 1)
+
+def make_empty_df() -> "pd.DataFrame":
+    import pandas as pd
     df = pd.DataFrame(columns=COLUMNS)
     df["UPC"] = df["UPC"].astype("string")
     df["Qty"] = pd.Series(dtype="int64")
     df["LastScannedAt"] = pd.Series(dtype="datetime64[ns]")
     return df
+
+def now_ns() -> int:
+    """현재 로컬 시각 (naive, epoch ns) — pd.Timestamp(datetime.now()).value 와 동일"""
+    d = datetime.now() - _EPOCH
+    return (d.days * 86400 + d.seconds) * 1_000_000_000 + d.microseconds * 1000
+
+def format_ts(ns: int) -> str:
+    if ns == NAT:
+        return ""
+    return (_EPOCH + timedelta(microseconds=int(ns) // 1000)).strftime("%Y-%m-%d %H:%M:%S")
+
+
+class RowStore:
+    """UPC / Qty / LastScannedAt 열 단위 저장소
+
+    미리 할당한 배열을 2배씩 늘려 append는 분할상환 O(1),
+    수량 증가는 제자리 갱신. DataFrame은 내보낼 때만 만든다.
+    """
+    MIN_CAPACITY = 1024
+
+    def __init__(self, capacity: int = MIN_CAPACITY):
+        capacity = max(int(capacity), self.MIN_CAPACITY)
+        self._upc = np.empty(capacity, dtype=object)
+        self._qty = np.zeros(capacity, dtype=np.int64)
+        self._ts = np.full(capacity, NAT, dtype=np.int64)
+        self._n = 0
+
+    def __len__(self) -> int:
+        return self._n
+
+    @property
+    def capacity(self) -> int:
+        return len(self._qty)
+
+    def _reserve(self, need: int):
+        cap = self.capacity
+        if need <= cap:
+            return
+        cap = max(cap, self.MIN_CAPACITY)
+        while cap < need:
+            cap *= 2
+        upc = np.empty(cap, dtype=object)
+        qty = np.zeros(cap, dtype=np.int64)
+        ts = np.full(cap, NAT, dtype=np.int64)
+        upc[:self._n] = self._upc[:self._n]
+        qty[:self._n] = self._qty[:self._n]
+        ts[:self._n] = self._ts[:self._n]
+        self._upc, self._qty, self._ts = upc, qty, ts
+
+    # --- 행 단위 접근 ---
+    def append(self, upc: str, qty: int = 0, ts: int = NAT) -> int:
+        row = self._n
+        self._reserve(row + 1)
+        self._upc[row] = upc
+        self._qty[row] = qty
+        self._ts[row] = ts
+        self._n = row + 1
+        return row
+
+    def extend(self, upc, qty, ts):
+        """여러 행을 한 번에 추가"""
+        start = self._n
+        n = len(upc)
+        self._reserve(start + n)
+        self._upc[start:start + n] = upc
+        self._qty[start:start + n] = qty
+        self._ts[start:start + n] = ts
+        self._n = start + n
+
+    def add_qty(self, row: int, amount: int, ts: int):
+        self._qty[row] += amount
+        self._ts[row] = ts
+
+    def upc(self, row: int):
+        return self._upc[row]
+
+    def qty(self, row: int) -> int:
+        return int(self._qty[row])
+
+    def ts(self, row: int) -> int:
+        return int(self._ts[row])
+
+    def set_upc(self, row: int, upc: str):
+        self._upc[row] = upc
+
+    def set_qty(self, row: int, qty: int):
+        self._qty[row] = qty
+
+    def set_ts(self, row: int, ts: int):
+        self._ts[row] = ts
+
+    def pop(self):
+        """마지막 행 제거 (추가 되돌리기)"""
+        self._n -= 1
+        self._upc[self._n] = None
+        self._qty[self._n] = 0
+        self._ts[self._n] = NAT
+
+    # --- 열 단위 접근 (복사 없는 view) ---
+    def upc_column(self) -> np.ndarray:
+        return self._upc[:self._n]
+
+    def qty_column(self) -> np.ndarray:
+        return self._qty[:self._n]
+
+    def ts_column(self) -> np.ndarray:
+        return self._ts[:self._n]
+
+    def detach(self):
+        """다른 버퍼(세션 파일 메모리 매핑)를 빌려 쓰는 열을 힙으로 복사 — 그 파일을 교체하기 전에"""
+        if not (self._qty.flags.owndata and self._ts.flags.owndata):
+            self._qty = self._qty.copy()
+            self._ts = self._ts.copy()
+
+    def copy(self) -> "RowStore":
+        """저장용 스냅샷 (백그라운드 저장 중에도 스캔 반영 가능)"""
+        return RowStore.from_columns(self.upc_column(), self.qty_column(), self.ts_column())
+
+    # --- DataFrame 변환 ---
+    @classmethod
+    def from_columns(cls, upc, qty, ts) -> "RowStore":
+        n = len(upc)
+        store = cls(n)
+        store._upc[:n] = upc
+        store._qty[:n] = qty
+        store._ts[:n] = ts
+        store._n = n
+        return store
+
+    @classmethod
+    def wrap(cls, upc: np.ndarray, qty: np.ndarray, ts: np.ndarray) -> "RowStore":
+        """복사 없이 배열을 그대로 열로 씀 (쓰기 가능해야 함) — 첫 append 때 힙으로 옮겨진다"""
+        store = cls.__new__(cls)
+        store._upc, store._qty, store._ts = upc, qty, ts
+        store._n = len(upc)
+        return store
+
+    @classmethod
+    def from_dataframe(cls, df: "pd.DataFrame") -> "RowStore":
+        import pandas as pd
+        upc = df["UPC"].astype(object).where(df["UPC"].notna(), None).to_numpy()
+        qty = pd.to_numeric(df["Qty"], errors="coerce").fillna(0).to_numpy(dtype=np.int64)
+        ts = (pd.to_datetime(df["LastScannedAt"], errors="coerce")
+              .to_numpy(dtype="datetime64[ns]").view(np.int64))
+        return cls.from_columns(upc, qty, ts)
+
+    def to_dataframe(self) -> "pd.DataFrame":
+        import pandas as pd
+        return pd.DataFrame({
+            "UPC": pd.array(self.upc_column(), dtype="string"),
+            "Qty": self.qty_column().copy(),
+            "LastScannedAt": self.ts_column().view("datetime64[ns]").copy(),
+        }, columns=COLUMNS)
@@ -0,0 +1,154 @@
+import numpy as np
+
+from .store import NAT
+
+# 되돌리기/다시 실행 기록
+# DataFrame 스냅샷 대신 바뀐 행의 (전, 후) 값만 고정 크기 링 배열에 쌓는다.
+# 한 스텝(스캔 한 건, 편집 한 번)은 연속된 레코드 묶음이고, 첫 레코드에 start 표시.
+
+DEFAULT_LIMIT = 10_000   # 보관할 레코드(행 변경) 수 — 넘치면 가장 오래된 스텝부터 버림
+
+OP_APPEND = 1   # 신규 행 (row, upc1=UPC, ts1) — 되돌리면 마지막 행 제거
+OP_CHANGE = 2   # 수량/시각 변경 (row, qty0→qty1, ts0→ts1)
+OP_RENAME = 3   # OP_CHANGE + UPC 변경 (upc0→upc1)
+OP_SCAN = 4     # 스캔으로 인한 OP_CHANGE — 스캔 로그에 남은 변경 (upc0 칸에 스테이션 번호)
+
+
+class Delta:
+    """레코드 한 건 (undo_step/redo_step 결과)"""
+    __slots__ = ("op", "row", "upc0", "upc1", "qty0", "qty1", "ts0", "ts1")
+
+    def __init__(self, op, row, upc0, upc1, qty0, qty1, ts0, ts1):
+        self.op, self.row = op, row
+        self.upc0, self.upc1 = upc0, upc1
+        self.qty0, self.qty1 = qty0, qty1
+        self.ts0, self.ts1 = ts0, ts1
+
+
+class UndoHistory:
+    """QUndoStack처럼 쓰는 행 변경 기록 — 메모리는 limit 레코드로 고정
+
+    레코드 위치는 단조 증가하는 절대 번호이고 링 칸은 번호 % limit.
+    [base, top)은 되돌릴 수 있는 레코드, [top, end)는 다시 실행할 수 있는 레코드.
+    새 레코드를 쌓으면 다시 실행 기록은 버린다.
+    """
+    def __init__(self, limit: int = DEFAULT_LIMIT):
+        self._alloc(limit)
+
+    def _alloc(self, limit: int):
+        limit = max(int(limit), 1)
+        self._op = np.zeros(limit, dtype=np.uint8)
+        self._start = np.zeros(limit, dtype=bool)
+        self._row = np.zeros(limit, dtype=np.int64)
+        self._qty = np.zeros((limit, 2), dtype=np.int64)
+        self._ts = np.full((limit, 2), NAT, dtype=np.int64)
+        self._upc = np.empty((limit, 2), dtype=object)   # OP_APPEND/OP_RENAME만 사용
+        self._base = self._top = self._end = 0
+        self._step = -1          # 기록 중인 스텝의 첫 레코드 번호
+        self._new_step = False   # 다음 레코드가 새 스텝의 시작
+        self._overflow = False   # 기록 중인 스텝이 limit보다 커서 버림
+
+    @property
+    def limit(self) -> int:
+        return len(self._op)
+
+    def set_limit(self, limit: int):
+        """크기 변경 — 기존 기록은 비운다"""
+        if int(limit) != self.limit:
+            self._alloc(limit)
+
+    def clear(self):
+        self._upc.fill(None)
+        self._base = self._top = self._end = 0
+        self._step = -1
+        self._new_step = self._overflow = False
+
+    def __len__(self) -> int:
+        """되돌릴 수 있는 레코드 수"""
+        return self._top - self._base
+
+    def can_undo(self) -> bool:
+        return self._top > self._base
+
+    def can_redo(self) -> bool:
+        return self._end > self._top
+
+    # --- 기록 ---
+    def begin(self):
+        """새 스텝 시작 — 레코드가 하나도 없으면 스텝도 생기지 않는다"""
+        self._new_step = True
+
+    def _push(self, op: int, row: int, upc0, upc1, qty0: int, qty1: int, ts0: int, ts1: int):
+        if self._new_step:
+            self._new_step = self._overflow = False
+            self._step = self._top
+        elif self._overflow:
+            return
+        if self._top - self._base == self.limit:
+            self._drop_oldest()
+            if self._overflow:
+                return
+        i = self._top % self.limit
+        self._op[i] = op
+        self._start[i] = self._top == self._step
+        self._row[i] = row
+        self._qty[i] = qty0, qty1
+        self._ts[i] = ts0, ts1
+        self._upc[i] = upc0, upc1
+        self._top += 1
+        self._end = self._top   # 다시 실행 기록 버림
+
+    def _drop_oldest(self):
+        """가장 오래된 스텝 하나를 버린다 — 기록 중인 스텝이 limit를 넘으면 전부 버림"""
+        if self._base == self._step:
+            self.clear()
+            self._overflow = True
+            return
+        limit = self.limit
+        self._base += 1
+        while self._base < self._top and not self._start[self._base % limit]:
+            self._base += 1
+
+    def record_append(self, row: int, upc: str, ts: int):
+        self._push(OP_APPEND, row, None, upc, 0, 0, NAT, ts)
+
+    def record_scan(self, row: int, qty0: int, qty1: int, ts0: int, ts1: int, station: int):
+        """수량 스캔 — 되돌리거나 다시 실행할 때 스캔 로그에도 보정을 남긴다 (model.scanlog)"""
+        self._push(OP_SCAN, row, station, None, qty0, qty1, ts0, ts1)
+
+    def record_change(self, row: int, qty0: int, qty1: int, ts0: int, ts1: int, upc0=None, upc1=None):
+        """upc0 != upc1이면 UPC 변경도 함께 기록"""
+        if upc0 != upc1:
+            self._push(OP_RENAME, row, upc0, upc1, qty0, qty1, ts0, ts1)
+        else:
+            self._push(OP_CHANGE, row, None, None, qty0, qty1, ts0, ts1)
+
+    # --- 되돌리기/다시 실행 ---
+    def _delta(self, pos: int) -> Delta:
+        i = pos % self.limit
+        return Delta(int(self._op[i]), int(self._row[i]), self._upc[i, 0], self._upc[i, 1],
+                     int(self._qty[i, 0]), int(self._qty[i, 1]), int(self._ts[i, 0]), int(self._ts[i, 1]))
+
+    def undo_step(self) -> list[Delta]:
+        """마지막 스텝의 레코드 (최근 것부터 — 이 순서로 되돌린다)"""
+        out = []
+        limit = self.limit
+        while self._top > self._base:
+            self._top -= 1
+            out.append(self._delta(self._top))
+            if self._start[self._top % limit]:
+                break
+        self._new_step = True
+        return out
+
+    def redo_step(self) -> list[Delta]:
+        """다음 스텝의 레코드 (기록 순서 — 이 순서로 다시 적용)"""
+        out = []
+        limit = self.limit
+        while self._top < self._end:
+            out.append(self._delta(self._top))
+            self._top += 1
+            if self._top == self._end or self._start[self._top % limit]:
+                break
+        self._new_step = True
+        return out
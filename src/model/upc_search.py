@@ -0,0 +1,146 @@
+import numpy as np
+
+# UPC 부분 검색 인덱스 (찾기 상자 / 모르는 코드의 비슷한 UPC 제안)
+# 라벨이 일부 훼손되면 앞부분이나 뒷부분만 읽히는 경우가 대부분이라,
+# 정렬된 UPC 배열(접두어)과 뒤집은 UPC의 정렬 배열(접미어)을 이진 탐색한다.
+# 새 UPC는 작은 대기 목록에 모았다가 MERGE_ROWS마다 정렬 배열에 끼워 넣는다.
+# 이름이 바뀌거나 지워진 행의 옛 항목은 지우지 않고, 조회할 때 저장소와 대조해 거른다.
+
+MERGE_ROWS = 2048      # 대기 목록이 이만큼 차면 정렬 배열에 병합
+NEIGHBORS = 256        # 편집 거리 후보: 정렬 배열에서 code 자리의 앞뒤 이웃 수 (접두어/접미어 배열 각각)
+_MAX_CHAR = "\U0010ffff"
+
+
+def _sorted(keys: np.ndarray, rows: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    order = np.argsort(keys, kind="stable")
+    return keys[order], rows[order]
+
+
+def _reverse(keys) -> np.ndarray:
+    return np.strings.slice(np.asarray(keys, dtype=str), None, None, -1)
+
+
+def _width(keys: np.ndarray) -> int:
+    return keys.dtype.itemsize // 4
+
+
+def _range(keys: np.ndarray, text: str) -> tuple[int, int]:
+    """text로 시작하는 키의 [lo, hi) — O(log n)
+
+    배열 폭보다 긴 검색어는 searchsorted가 배열 전체를 넓은 dtype으로 복사하므로 미리 거른다.
+    """
+    width = _width(keys)
+    if len(text) > width:
+        return 0, 0
+    lo = int(np.searchsorted(keys, text, "left"))
+    if len(text) == width:
+        return lo, int(np.searchsorted(keys, text, "right"))
+    return lo, int(np.searchsorted(keys, text + _MAX_CHAR, "left"))
+
+
+class UpcSearch:
+    """접두어/접미어 이진 탐색 + 부분 문자열 스캔
+
+    조회 결과는 (UPC, 저장 행) 후보 — 저장소와 대조하는 것은 호출한 쪽(DataFrameModel) 몫이다.
+    """
+    def __init__(self, upc: np.ndarray | None = None):
+        if upc is None or not len(upc):
+            keys, rows = np.array([], dtype=str), np.array([], dtype=np.int64)
+        else:
+            rows = np.flatnonzero(np.not_equal(upc, None))
+            keys = upc[rows].astype(str)
+        self._keys, self._rows = _sorted(keys, rows)
+        self._rkeys, self._rrows = _sorted(_reverse(keys), rows)
+        self._pending: list[tuple[str, int]] = []
+
+    def __len__(self) -> int:
+        """항목 수 (옛 항목 포함)"""
+        return len(self._keys) + len(self._pending)
+
+    def add(self, upc: str, row: int):
+        self._pending.append((upc, row))
+        if len(self._pending) >= MERGE_ROWS:
+            self._merge()
+
+    def _merge(self):
+        keys = np.array([k for k, _ in self._pending], dtype=str)
+        rows = np.array([r for _, r in self._pending], dtype=np.int64)
+        self._pending = []
+        self._keys, self._rows = self._insert(self._keys, self._rows, keys, rows)
+        self._rkeys, self._rrows = self._insert(self._rkeys, self._rrows, _reverse(keys), rows)
+
+    @staticmethod
+    def _insert(keys, rows, new_keys, new_rows):
+        new_keys, new_rows = _sorted(new_keys, new_rows)
+        dtype = np.result_type(keys.dtype, new_keys.dtype)   # 더 긴 UPC가 잘리지 않도록
+        at = np.searchsorted(keys, new_keys, "right")
+        return np.insert(keys.astype(dtype, copy=False), at, new_keys), np.insert(rows, at, new_rows)
+
+    # --- 조회 ---
+    def prefix(self, text: str, limit: int) -> list[tuple[str, int]]:
+        """text로 시작하는 UPC (정렬 순서, 대기 목록은 뒤에)"""
+        lo, hi = _range(self._keys, text)
+        hi = min(hi, lo + limit)
+        out = list(zip(self._keys[lo:hi].tolist(), self._rows[lo:hi].tolist()))
+        out += [(k, r) for k, r in self._pending if k.startswith(text)]
+        return out
+
+    def suffix(self, text: str, limit: int) -> list[tuple[str, int]]:
+        """text로 끝나는 UPC"""
+        lo, hi = _range(self._rkeys, text[::-1])
+        hi = min(hi, lo + limit)
+        out = [(k[::-1], r) for k, r in zip(self._rkeys[lo:hi].tolist(), self._rrows[lo:hi].tolist())]
+        out += [(k, r) for k, r in self._pending if k.endswith(text)]
+        return out
+
+    def contains(self, text: str, limit: int) -> list[tuple[str, int]]:
+        """text가 들어 있는 UPC — 전체 스캔 (1M행 수십 ms, 접두어/접미어로 못 찾았을 때만)"""
+        hit = np.flatnonzero(np.strings.find(self._keys, text) >= 0)[:limit]
+        out = list(zip(self._keys[hit].tolist(), self._rows[hit].tolist()))
+        out += [(k, r) for k, r in self._pending if text in k]
+        return out
+
+    def _neighbors(self, keys: np.ndarray, rows: np.ndarray, text: str):
+        at = int(np.searchsorted(keys, text[:_width(keys)]))
+        lo, hi = max(at - NEIGHBORS, 0), at + NEIGHBORS
+        return zip(keys[lo:hi].tolist(), rows[lo:hi].tolist())
+
+    def similar(self, code: str, max_dist: int = 2) -> list[tuple[int, str, int]]:
+        """편집 거리 max_dist 이하인 UPC (거리, UPC, 행) — 가까운 순
+
+        뒤쪽 글자가 틀렸다면 앞부분이 같은 UPC가, 앞쪽이 틀렸다면 뒷부분이 같은 UPC가
+        정렬 배열에서 code 자리 근처에 모인다. 두 배열의 이웃만 거리를 계산한다 (전체 스캔 없음).
+        """
+        half = max(len(code) // 2, 1)
+        cands = dict(self._neighbors(self._keys, self._rows, code))
+        cands.update((k[::-1], r) for k, r in self._neighbors(self._rkeys, self._rrows, code[::-1]))
+        cands.update((k, r) for k, r in self._pending if k[:half] == code[:half] or k[-half:] == code[-half:])
+        cands = {k: r for k, r in cands.items() if abs(len(k) - len(code)) <= max_dist}
+        if not cands:
+            return []
+        keys = list(cands)
+        dist = edit_distances(code, np.array(keys, dtype=str))
+        hit = np.flatnonzero(dist <= max_dist)
+        return sorted((int(dist[i]), keys[i], cands[keys[i]]) for i in hit)
+
+
+def edit_distances(code: str, cands: np.ndarray) -> np.ndarray:
+    """code와 후보 각각의 레벤슈타인 거리 — 후보 축으로 벡터화한 DP (후보 n개 × 길이² 번의 배열 연산)"""
+    n = len(cands)
+    q = np.array([ord(ch) for ch in code], dtype=np.uint32)
+    m = len(q)
+    width = cands.dtype.itemsize // 4
+    chars = cands.view(np.uint32).reshape(n, width)   # 짧은 후보는 0으로 채워져 있음
+    lens = np.strings.str_len(cands)
+    out = np.where(lens == 0, m, 0)
+    prev = np.tile(np.arange(m + 1), (n, 1))          # 후보 앞 0글자 vs code 앞 j글자
+    for i in range(width):
+        cur = np.empty_like(prev)
+        cur[:, 0] = i + 1
+        cost = prev[:, :-1] + (chars[:, i:i + 1] != q)  # 대체(같으면 0)
+        for j in range(1, m + 1):
+            cur[:, j] = np.minimum(np.minimum(prev[:, j], cur[:, j - 1]) + 1, cost[:, j - 1])
+        done = lens == i + 1
+        out[done] = cur[done, m]
+        prev = cur
+    return out
@@ -0,0 +1,124 @@
+import numpy as np
+import pandas as pd
+
+from .io_excel import CHUNK_ROWS, import_store
+from .store import RowStore
+
+# 재고 차이 보고서: 센 수량(모델) ↔ 예상 재고(두 번째 통합문서)
+# UPC 정규화(공백 제거 + 대문자) 후 pandas 해시 인덱스로 한 번에 조인 — 키 열 두 개에 비례하는 메모리
+
+STATUSES = ("Over", "Under", "Missing", "Unexpected", "Match")
+OVER, UNDER, MISSING, UNEXPECTED, MATCH = range(len(STATUSES))
+REPORT_COLUMNS = ["UPC", "Counted", "Expected", "Diff", "Status"]
+
+
+def _normalize(upc: np.ndarray) -> np.ndarray:
+    return pd.Series(upc, dtype="string").str.strip().str.upper().to_numpy(dtype=object, na_value=None)
+
+
+class VarianceReport:
+    """UPC별 (센 수량, 예상 수량, 분류) 열 배열 — 분류 순(초과→부족→누락→예상 외→일치)으로 정렬
+
+    Over: 둘 다 있고 더 많이 셈 / Under: 덜 셈 / Missing: 예상에만 있음(예상 > 0)
+    Unexpected: 센 표에만 있음 / Match: 같음 (예상 0이고 안 센 것 포함)
+    """
+    def __init__(self, upc: np.ndarray, counted: np.ndarray, expected: np.ndarray, status: np.ndarray):
+        order = np.argsort(status, kind="stable")
+        self.upc = upc[order]
+        self.counted = counted[order]
+        self.expected = expected[order]
+        self.status = status[order]
+        # 분류별 구간 (정렬돼 있으므로 status == k는 연속)
+        self.bounds = np.searchsorted(self.status, np.arange(len(STATUSES) + 1))
+
+    def __len__(self) -> int:
+        return len(self.upc)
+
+    @property
+    def diff(self) -> np.ndarray:
+        return self.counted - self.expected
+
+    def rows(self, status: int) -> slice:
+        return slice(int(self.bounds[status]), int(self.bounds[status + 1]))
+
+    def totals(self) -> pd.DataFrame:
+        """분류별 UPC 수와 수량 합계 (+ 전체)"""
+        n = np.bincount(self.status, minlength=len(STATUSES))
+        counted = np.bincount(self.status, weights=self.counted, minlength=len(STATUSES))
+        expected = np.bincount(self.status, weights=self.expected, minlength=len(STATUSES))
+        out = pd.DataFrame({"UPCs": n, "Counted": counted.astype(np.int64),
+                            "Expected": expected.astype(np.int64)}, index=list(STATUSES))
+        out.loc["Total"] = out.sum()
+        out["Diff"] = out["Counted"] - out["Expected"]
+        return out
+
+    def to_dataframe(self, include_match: bool = True) -> pd.DataFrame:
+        stop = len(self) if include_match else int(self.bounds[MATCH])
+        return pd.DataFrame({
+            "UPC": self.upc[:stop],
+            "Counted": self.counted[:stop],
+            "Expected": self.expected[:stop],
+            "Diff": self.diff[:stop],
+            "Status": pd.Categorical.from_codes(self.status[:stop], STATUSES),
+        })
+
+
+def compare_stores(counted: RowStore, expected: RowStore) -> VarianceReport:
+    """센 표(대소문자 달라도 같은 UPC면 합산) ↔ 예상 재고"""
+    codes, keys = pd.factorize(_normalize(counted.upc_column()), use_na_sentinel=True)
+    ok = codes >= 0
+    cq = np.bincount(codes[ok], weights=counted.qty_column()[ok], minlength=len(keys)).astype(np.int64)
+    keys = np.asarray(keys, dtype=object)
+
+    eu = _normalize(expected.upc_column())
+    eq = expected.qty_column()
+    pos = pd.Index(eu).get_indexer(keys)        # 해시 조인: 센 UPC → 예상 행 (-1: 없음)
+    both = pos >= 0
+    seen = np.zeros(len(eu), dtype=bool)
+    seen[pos[both]] = True
+
+    upc = np.concatenate([keys, eu[~seen]])
+    cnt = np.concatenate([cq, np.zeros(int((~seen).sum()), dtype=np.int64)])
+    exp_c = np.zeros(len(keys), dtype=np.int64)
+    exp_c[both] = eq[pos[both]]
+    exp = np.concatenate([exp_c, eq[~seen]])
+    diff = cnt - exp
+    status = np.full(len(upc), MATCH, dtype=np.int8)
+    status[diff > 0] = OVER
+    status[diff < 0] = UNDER
+    n = len(keys)
+    status[:n][~both] = UNEXPECTED
+    status[n:][exp[n:] > 0] = MISSING
+    return VarianceReport(upc, cnt, exp, status)
+
+
+def variance_from_file(counted: RowStore, path: str, progress=None) -> VarianceReport:
+    """예상 재고 통합문서를 import와 같은 검증으로 읽어 비교 (IoWorker 작업)"""
+    return compare_stores(counted, import_store(path, progress=progress))
+
+
+def export_variance(report: VarianceReport, path: str, progress=None, include_match: bool = False,
+                    chunk_rows: int = CHUNK_ROWS):
+    """Variance 시트(차이 나는 UPC, include_match면 전부) + Summary 시트 — save_atomic과 함께 사용"""
+    from openpyxl import Workbook
+    stop = len(report) if include_match else int(report.bounds[MATCH])
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Variance")
+    ws.append(REPORT_COLUMNS)
+    labels = np.array(STATUSES, dtype=object)
+    if progress:
+        progress(0)
+    for start in range(0, stop, chunk_rows):
+        end = min(start + chunk_rows, stop)
+        for row in zip(report.upc[start:end].tolist(), report.counted[start:end].tolist(),
+                       report.expected[start:end].tolist(), report.diff[start:end].tolist(),
+                       labels[report.status[start:end]].tolist()):
+            ws.append(row)
+        if progress:
+            progress(end)
+    summary = wb.create_sheet("Summary")
+    totals = report.totals()
+    summary.append(["Status"] + list(totals.columns))
+    for name, row in totals.iterrows():
+        summary.append([name] + [int(v) for v in row])
+    wb.save(path)
@@ -1,15 +1,20 @@
 from PyQt6.QtWidgets import (
     QMainWindow, QTableView, QStatusBar, QLineEdit,
     QWidget, QVBoxLayout, QToolBar, QFileDialog, QMessageBox,
-    QSizePolicy, QAbstractItemView, QDialog, QFormLayout, QDialogButtonBox
+    QSizePolicy, QAbstractItemView, QDialog, QFormLayout, QDialogButtonBox, QCompleter
 )
 from PyQt6.QtGui import QKeySequence, QAction, QIcon
-from PyQt6.QtCore import Qt, QEvent
+from PyQt6.QtCore import Qt, QEvent, QStringListModel, QThreadPool, QTimer
 
 import os
+import time
 
-from model.store import make_empty_df
 from model.dataframe_model import DataFrameModel
+from model.journal import Journal, default_journal_path
+from controller.key_buffer import KeyBuffer
+from controller.scan_queue import ScanQueue
+from controller.table_controller import ScanEngine
+from utils import perf
 
 
 class EditRowDialog(QDialog):
@@ -58,8 +63,14 @@ class EditRowDialog(QDialog):
 
 class MainWindow(QMainWindow):
     UPC_MIN_LEN = 4
-
-    def __init__(self):
+    BURST_GAP_MS = 30      # 키 간격이 이보다 짧으면 스캐너 입력 — 버퍼 표시를 미룸
+    BURST_IDLE_MS = 50     # 연사 중 표시 갱신 주기 (Enter가 안 오면 이때 보여줌)
+    UNDO_LIMIT = 10_000            # 되돌리기 기록 (행 변경 레코드 수)
+    AUTOSAVE_INTERVAL_MS = 30_000
+    SCAN_SERVER_HOST = "127.0.0.1"   # 기본은 이 PC만 — 핸드헬드는 UPC_SCAN_HOST로 명시 (예: 0.0.0.0)
+    SCAN_SERVER_PORT = 5151          # TCP와 UDP 같은 번호
+
+    def __init__(self, journal_path: str | None = None):
         super().__init__()
         self.setWindowTitle("UPC Counter")
         self.resize(900, 600)
@@ -68,12 +79,35 @@ class MainWindow(QMainWindow):
         self.setWindowIcon(QIcon("../assets/app.ico"))
 
         # 상태
-        self.model = DataFrameModel(make_empty_df())
+        self.model = DataFrameModel()   # 빈 RowStore — pandas는 첫 불러오기/저장 때 로드
+        self.model.set_undo_limit(self.UNDO_LIMIT)
         self.current_row = -1
-        self.buffer = []
+        self.buffer = KeyBuffer(self.BURST_GAP_MS)
         self.current_file: str | None = None
         self.is_dirty: bool = False
         self.edit_warning_shown: bool = False  # 더블클릭 수정 경고 1회용
+        self._io_job = None                    # 진행 중인 Open/Save 작업 (IoWorker)
+        self._io_kind: str | None = None       # "open" | "save"
+        self._io_path: str | None = None
+        self._io_revision = 0                  # 저장 시작 시점의 모델 revision
+        self._pending_scans: list[str] = []    # Open/복구 중 들어온 스캔 (완료 후 반영)
+        self._close_after_save = False
+        # 크래시 복구용 저널 — start_journal() 호출 시 활성화
+        self.journal = Journal(journal_path or default_journal_path())
+        self._io_journal_mark = 0
+        self._io_dirty_rows = None             # 저장 스냅샷에 포함된 변경 행 (실패 시 되돌림)
+        # 자동 저장: 바뀐 행만 체크포인트(SQLite)에 기록
+        self._autosave_pool = QThreadPool(self)
+        self._autosave_pool.setMaxThreadCount(1)
+        self._autosave_job = None
+        self._autosave_rows = None
+        self._autosave_generation = 0          # Open/Save마다 증가 — 늦게 끝난 자동 저장 무시
+        self._autosave_job_generation = 0
+        self._autosave_snapshot_revision = 0
+        self._autosave_revision: int | None = None   # 마지막 체크포인트가 반영한 revision
+        self._autosave_timer = QTimer(self)
+        self._autosave_timer.setInterval(self.AUTOSAVE_INTERVAL_MS)
+        self._autosave_timer.timeout.connect(self.autosave)
 
         # 테이블
         self.table = QTableView()
@@ -82,6 +116,10 @@ class MainWindow(QMainWindow):
         self.table.setSelectionMode(QTableView.SelectionMode.SingleSelection)
         self.table.verticalHeader().setVisible(False)
         self.table.setAlternatingRowColors(True)
+        # 정렬은 모델이 직접 처리 (DataFrameModel.sort) — 처음엔 입력 순서, 세 번째 클릭으로 해제
+        header = self.table.horizontalHeader()
+        header.setSortIndicatorClearable(True)
+        header.setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
         self.table.setSortingEnabled(True)
         self.table.setColumnWidth(0, 260)
         self.table.setColumnWidth(1, 80)
@@ -93,6 +131,8 @@ class MainWindow(QMainWindow):
 
         # 모델 시그널
         self.model.changed.connect(self.mark_dirty)
+        self.model.changed.connect(self._update_undo_actions)
+        self.model.modelReset.connect(self._update_undo_actions)
         self.model.error.connect(lambda msg: QMessageBox.warning(self, "수정 오류", msg))
 
         # 상태바 + 입력 버퍼
@@ -105,7 +145,7 @@ class MainWindow(QMainWindow):
         self.buffer_display.setMinimumHeight(40)
         self.buffer_display.setMinimumWidth(600)
         self.buffer_display.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        self.buffer_display.returnPressed.connect(self.process_buffer)
+        self.buffer_display.returnPressed.connect(lambda: self.process_buffer())   # 계측 교체가 보이도록
         self.buffer_display.setStyleSheet("""
             QLineEdit {
                 font-size: 14pt;
@@ -133,6 +173,19 @@ class MainWindow(QMainWindow):
             }
         """)
         self.status_bar.addPermanentWidget(self.buffer_display)
+        self._burst_timer = QTimer(self)
+        self._burst_timer.setSingleShot(True)
+        self._burst_timer.setInterval(self.BURST_IDLE_MS)
+        self._burst_timer.timeout.connect(self.update_buffer_display)
+
+        # 스캔 규칙은 UI 없는 엔진이 처리하고, 창은 결과만 표시
+        self.engine = ScanEngine(self.model, self.UPC_MIN_LEN)
+        # 스캔 입력 대기열 (이벤트 루프 한 틱 단위로 일괄 반영)
+        self.scan_queue = ScanQueue(self)
+        self.scan_server = None        # 네트워크 스캐너 수신 (controller.scan_server)
+        self.perf_panel = None         # 숨은 성능 패널 (Ctrl+Shift+P, widgets.perf_panel)
+        self._paint_probe = None
+        self._variance_dialog = None   # 마지막 재고 차이 보고서 창
 
         # 중앙 레이아웃
         central = QWidget()
@@ -144,6 +197,9 @@ class MainWindow(QMainWindow):
         self._init_actions()
         self._connect_signals()
         self._update_title()
+        self._open_catalog()
+        if os.environ.get("UPC_PERF"):
+            self.act_perf.setChecked(True)
 
     # 액션/단축키
     def _init_actions(self):
@@ -178,74 +234,534 @@ class MainWindow(QMainWindow):
         tb.addAction(act_clear)
         self.addAction(act_clear)
 
+        self.act_undo = QAction("Undo", self)
+        self.act_undo.setShortcut(QKeySequence("Ctrl+Z"))
+        self.act_undo.setShortcutContext(Qt.ShortcutContext.ApplicationShortcut)
+        self.act_undo.setEnabled(False)
+        self.act_undo.triggered.connect(self.on_undo)
+        tb.addAction(self.act_undo)
+        self.addAction(self.act_undo)
+
+        self.act_redo = QAction("Redo", self)
+        self.act_redo.setShortcuts([QKeySequence("Ctrl+Y"), QKeySequence("Ctrl+Shift+Z")])
+        self.act_redo.setShortcutContext(Qt.ShortcutContext.ApplicationShortcut)
+        self.act_redo.setEnabled(False)
+        self.act_redo.triggered.connect(self.on_redo)
+        tb.addAction(self.act_redo)
+        self.addAction(self.act_redo)
+
+        self.act_cancel = QAction("Cancel", self)
+        self.act_cancel.setEnabled(False)
+        self.act_cancel.triggered.connect(self.cancel_io)
+        tb.addAction(self.act_cancel)
+
+        self.act_autosave = QAction("Autosave", self)
+        self.act_autosave.setCheckable(True)
+        self.act_autosave.toggled.connect(self.set_autosave)
+        tb.addAction(self.act_autosave)
+
+        act_catalog = QAction("Catalog...", self)
+        act_catalog.triggered.connect(self.on_import_catalog)
+        tb.addAction(act_catalog)
+
+        act_variance = QAction("Variance...", self)
+        act_variance.triggered.connect(self.on_variance)
+        tb.addAction(act_variance)
+
+        act_lint = QAction("Validate...", self)
+        act_lint.triggered.connect(self.on_validate)
+        tb.addAction(act_lint)
+
+        self.act_network = QAction("Network", self)
+        self.act_network.setCheckable(True)
+        self.act_network.toggled.connect(self.set_scan_server)
+        tb.addAction(self.act_network)
+
+        # 툴바에는 없는 성능 패널 토글
+        self.act_perf = QAction("Performance", self)
+        self.act_perf.setCheckable(True)
+        self.act_perf.setShortcut(QKeySequence("Ctrl+Shift+P"))
+        self.act_perf.setShortcutContext(Qt.ShortcutContext.ApplicationShortcut)
+        self.act_perf.toggled.connect(self.set_perf)
+        self.addAction(self.act_perf)
+
+        # UPC 필터 (부분 문자열, 대소문자 무시) — Enter/Esc로 스캔 입력에 포커스 복귀
+        self.filter_edit = QLineEdit()
+        self.filter_edit.setPlaceholderText("UPC 필터")
+        self.filter_edit.setClearButtonEnabled(True)
+        self.filter_edit.setMaximumWidth(200)
+        self.filter_edit.textChanged.connect(self.model.set_filter)
+        self.filter_edit.returnPressed.connect(self.buffer_display.setFocus)
+        tb.addSeparator()
+        tb.addWidget(self.filter_edit)
+
+        # UPC 찾기 — 앞/뒷부분만 알아도 후보를 보여 주고, 고르거나 Enter면 그 행으로 이동
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText("UPC 찾기 (Ctrl+F)")
+        self.search_edit.setClearButtonEnabled(True)
+        self.search_edit.setMaximumWidth(200)
+        self.search_hits = QStringListModel(self)
+        completer = QCompleter(self.search_hits, self)
+        # 접미어 후보도 있으므로 QCompleter 자체 접두어 필터는 끈다
+        completer.setCompletionMode(QCompleter.CompletionMode.UnfilteredPopupCompletion)
+        completer.activated[str].connect(self.jump_to_upc)
+        self.search_edit.setCompleter(completer)
+        self.search_edit.textEdited.connect(self.on_search_edited)
+        self.search_edit.returnPressed.connect(self.on_search_entered)
+        tb.addWidget(self.search_edit)
+        act_find = QAction("Find UPC", self)
+        act_find.setShortcut(QKeySequence("Ctrl+F"))
+        act_find.triggered.connect(self.search_edit.setFocus)
+        act_find.triggered.connect(self.search_edit.selectAll)
+        self.addAction(act_find)
+
     def _connect_signals(self):
         self.table.selectionModel().selectionChanged.connect(self.on_selection_changed)
+        # 정렬/필터/삽입으로 선택 행의 위치가 바뀌면 current_row를 다시 읽는다
+        for sig in (self.model.layoutChanged, self.model.rowsMoved,
+                    self.model.rowsInserted, self.model.rowsRemoved):
+            sig.connect(self._sync_current_row)
 
     # 제목/더티 표시
     def _update_title(self):
         name = (os.path.basename(self.current_file) if self.current_file else "Untitled")
         star = "*" if self.is_dirty else ""
-        self.setWindowTitle(f"UPC Counter - {name}{star}")
+        # 파일에는 아직 저장 안 됐지만 변경분이 모두 체크포인트에 있는 상태
+        autosaved = " (자동 저장됨)" if self.is_dirty and self._autosave_revision == self.model.revision() else ""
+        self.setWindowTitle(f"UPC Counter - {name}{star}{autosaved}")
 
     def mark_dirty(self):
+        if self._autosave_revision is not None and self._autosave_revision != self.model.revision():
+            self._autosave_revision = None
+            self._update_title()
         if not self.is_dirty:
             self.is_dirty = True
             self._update_title()
 
+    # 되돌리기 / 다시 실행 (스캔한 UPC 한 건, 편집 한 번 단위)
+    def _update_undo_actions(self):
+        self.act_undo.setEnabled(self.model.can_undo())
+        self.act_redo.setEnabled(self.model.can_redo())
+
+    def on_undo(self):
+        self._after_history_step(self.model.undo(), "되돌렸습니다.")
+
+    def on_redo(self):
+        self._after_history_step(self.model.redo(), "다시 실행했습니다.")
+
+    def _after_history_step(self, row: int, msg: str):
+        # 바뀐 행을 선택 (지운 행이면 선택 해제 — 다음 수량 스캔이 엉뚱한 행에 더해지지 않도록)
+        if row >= 0:
+            self.select_row(row)
+        else:
+            self.table.clearSelection()
+            self.current_row = -1
+        self.status_bar.showMessage(msg, 2000)
+
     # 선택 변경
     def on_selection_changed(self, *_):
         indexes = self.table.selectionModel().selectedRows()
         if indexes:
             self.current_row = indexes[0].row()
-            upc = self.model.dataframe().iat[self.current_row, 0]
-            qty = self.model.dataframe().iat[self.current_row, 1]
+            upc = self.model.upc_at(self.current_row)
+            qty = self.model.qty_at(self.current_row)
             self.status_bar.showMessage(f"선택됨: UPC={upc}, Qty={qty}", 3000)
         else:
             self.current_row = -1
             self.status_bar.showMessage("선택된 행이 없습니다.", 1500)
 
-    # Open / Save / Save As
-    def on_open_excel(self):
-        from model.io_excel import import_excel
-        path, _ = QFileDialog.getOpenFileName(self, "Open Excel", "", "Excel Files (*.xlsx)")
-        if not path:
+    def _sync_current_row(self, *_):
+        indexes = self.table.selectionModel().selectedRows()
+        self.current_row = indexes[0].row() if indexes else -1
+        if self.model.filter_text() != self.filter_edit.text().strip().upper():
+            # 스캔한 행을 보이려고 모델이 필터를 해제한 경우
+            self.filter_edit.blockSignals(True)
+            self.filter_edit.clear()
+            self.filter_edit.blockSignals(False)
+
+    # Open / Save / Save As — 백그라운드 스레드에서 실행
+    def _start_io(self, kind: str, path: str, fn, *args) -> bool:
+        from controller.io_worker import IoWorker
+        if self._io_job is not None:
+            self.status_bar.showMessage("다른 파일 작업이 진행 중입니다.", 2000)
+            return False
+        self._autosave_pool.waitForDone()   # 자동 저장이 저널을 정리하는 중이면 끝날 때까지
+        self._autosave_generation += 1
+        job = IoWorker(fn, *args)
+        job.signals.progress.connect(self._on_io_progress)
+        job.signals.finished.connect(self._on_io_finished)
+        job.signals.failed.connect(self._on_io_failed)
+        job.signals.cancelled.connect(self._on_io_cancelled)
+        self._io_job, self._io_kind, self._io_path = job, kind, path
+        if self.scan_server is not None and kind in ("open", "recover"):
+            self.scan_server.set_paused(True)   # 새 데이터로 바뀐 뒤 반영
+        self.act_cancel.setEnabled(True)
+        self.status_bar.showMessage(f"{self._io_label()}: {self._io_name()}")
+        QThreadPool.globalInstance().start(job)
+        return True
+
+    def _finish_io(self):
+        self._io_job = None
+        self._io_kind = None
+        self._io_path = None
+        self.act_cancel.setEnabled(False)
+        if self.scan_server is not None:
+            self.scan_server.set_paused(False)
+        # Open/복구 중 쌓인 스캔은 새 데이터 위에 순서대로 반영
+        pending, self._pending_scans = self._pending_scans, []
+        for raw in pending:
+            self._apply_scan(raw)
+
+    def cancel_io(self):
+        if self._io_job is not None:
+            self._io_job.cancel()
+            self.status_bar.showMessage("취소하는 중...")
+
+    def _io_label(self) -> str:
+        return {"open": "불러오는 중", "recover": "복구 중", "catalog": "카탈로그 가져오는 중",
+                "variance": "예상 재고와 비교 중", "lint": "검사 중",
+                "report": "보고서 저장 중"}.get(self._io_kind, "저장 중")
+
+    def _io_name(self) -> str:
+        return os.path.basename(self._io_path) if self._io_path else "Untitled"
+
+    def _on_io_progress(self, rows: int):
+        if self._io_job is None:
             return
-        try:
-            df = import_excel(path)
-            self.model.set_dataframe(df)
+        self.status_bar.showMessage(f"{self._io_label()}: {self._io_name()} — {rows:,}행")
+
+    def _on_io_finished(self, result):
+        kind, path = self._io_kind, self._io_path
+        if kind == "open":
+            from model import checkpoint
+            # 버린 세션의 자동 저장본은 더 이상 쓰이지 않음
+            checkpoint.remove(checkpoint.checkpoint_path(self.current_file))
+            self.model.set_store(result)
+            self.current_row = -1
             self.current_file = path
             self.is_dirty = False
-            self._update_title()
+            self._autosave_revision = None
+            if self.journal.active:
+                self.journal.start(path)
             self.status_bar.showMessage(f"불러오기 완료: {os.path.basename(path)}", 5000)
-        except Exception as e:
-            QMessageBox.critical(self, "Open 실패", str(e))
+        elif kind == "recover":
+            store, touched = result
+            self.model.set_store(store)
+            self.model.mark_rows_dirty(touched)   # 저널로 복구한 행은 다음 자동 저장 대상
+            self.current_row = -1
+            self.current_file = path
+            self.is_dirty = True
+            self.journal.resume()
+            self.model.set_journal(self.journal)
+            self.status_bar.showMessage(f"복구 완료: {len(store):,}행", 5000)
+        elif kind == "variance":
+            from widgets.variance_dialog import VarianceDialog
+            self.status_bar.clearMessage()
+            self._variance_dialog = VarianceDialog(self, result, path)
+            self._variance_dialog.show()
+        elif kind == "lint":
+            self.status_bar.clearMessage()
+            QTimer.singleShot(0, lambda: self._offer_lint_report(result, path))   # 이 작업을 정리한 뒤
+        elif kind == "report":
+            self.status_bar.showMessage(f"보고서 저장 완료: {os.path.basename(path)}", 3000)
+        elif kind == "catalog":
+            self._open_catalog(result.path)
+            skipped = f", 건너뜀 {result.invalid:,}" if result.invalid else ""
+            self.status_bar.showMessage(f"카탈로그 {result.count:,}개 UPC{skipped}", 5000)
+        else:
+            from model import checkpoint
+            old_file, self.current_file = self.current_file, path
+            # 저장 중 들어온 스캔이 있으면 여전히 dirty
+            self.is_dirty = self.model.revision() != self._io_revision
+            self._autosave_revision = None
+            if self.journal.active:
+                self.journal.compact(path, self._io_journal_mark)
+            # 새 기준 파일이 생겼으므로 체크포인트는 비운다 (저널 정리 후에 삭제)
+            checkpoint.remove(checkpoint.checkpoint_path(old_file))
+            checkpoint.remove(checkpoint.checkpoint_path(path))
+            self._io_dirty_rows = None
+            self.status_bar.showMessage(f"저장 완료: {os.path.basename(path)}", 3000)
+        self._update_title()
+        self._finish_io()
+        if kind == "save" and self._close_after_save:
+            self._close_after_save = False
+            self.close()
+
+    def _restore_save_dirty_rows(self):
+        if self._io_kind == "save" and self._io_dirty_rows is not None:
+            self.model.mark_rows_dirty(self._io_dirty_rows)
+            self._io_dirty_rows = None
+
+    def _on_io_failed(self, msg: str):
+        title = {"open": "Open 실패", "recover": "복구 실패", "catalog": "카탈로그 가져오기 실패",
+                 "variance": "비교 실패", "lint": "검사 실패",
+                 "report": "보고서 저장 실패"}.get(self._io_kind, "Save 실패")
+        if self._io_kind == "open" and msg.startswith(("잘못된", "중복된")):
+            msg += "\n\nValidate...로 검사하면 모든 문제를 한 번에 볼 수 있습니다."
+        self._restore_save_dirty_rows()
+        if self._io_kind == "recover":
+            self._discard_journal(keep_copy=True)
+        self._close_after_save = False
+        if self._io_kind == "catalog":
+            self._open_catalog()   # 가져오기 전 카탈로그로 복귀
+        self._finish_io()
+        QMessageBox.critical(self, title, msg)
+
+    def _on_io_cancelled(self):
+        self._restore_save_dirty_rows()
+        if self._io_kind == "recover":
+            self._discard_journal(keep_copy=True)
+        self._close_after_save = False
+        if self._io_kind == "catalog":
+            self._open_catalog()
+        self._finish_io()
+        self.status_bar.showMessage("작업이 취소되었습니다.", 3000)
+
+    def on_open_excel(self):
+        from model.session import load_store
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Open", "", "Excel / UPC Session (*.xlsx *.upcs);;Excel Files (*.xlsx);;UPC Session (*.upcs)")
+        if not path:
+            return
+        self._start_io("open", path, load_store, path)
+
+    def _save_to(self, path: str) -> bool:
+        from functools import partial
+        from model.io_excel import save_atomic
+        from model.session import save_store
+        # 스냅샷을 저장하므로 저장 중에도 스캔은 모델에 바로 반영된다
+        if self._io_job is not None:
+            self.status_bar.showMessage("다른 파일 작업이 진행 중입니다.", 2000)
+            return False
+        self._autosave_pool.waitForDone()
+        # 세션 파일에서 연 열은 그 파일을 메모리 매핑으로 빌려 쓰므로, 교체 전에 힙으로 옮긴다
+        self.model.store().detach()
+        snapshot = self.model.store().copy()
+        self._io_revision = self.model.revision()
+        self._io_journal_mark = self.journal.position()
+        self._io_dirty_rows = self.model.take_dirty_rows()
+        # 이번 세션의 스캔 처리량/UPC별 스캔 수/공백 구간 (xlsx에 추가 시트로)
+        export = partial(save_store, activity=self.model.scan_log().activity())
+        return self._start_io("save", path, save_atomic, export, snapshot, path)
 
     def on_save(self):
-        from model.io_excel import export_excel
         if self.current_file:
-            try:
-                export_excel(self.model.dataframe(), self.current_file)
-                self.is_dirty = False
-                self._update_title()
-                self.status_bar.showMessage(f"저장 완료: {os.path.basename(self.current_file)}", 3000)
-            except Exception as e:
-                QMessageBox.critical(self, "Save 실패", str(e))
+            self._save_to(self.current_file)
         else:
             self.on_save_as()
 
     def on_save_as(self):
-        from model.io_excel import export_excel
-        path, _ = QFileDialog.getSaveFileName(self, "Save As", "upc_data.xlsx", "Excel Files (*.xlsx)")
+        from model.session import SESSION_EXT
+        path, selected = QFileDialog.getSaveFileName(
+            self, "Save As", "upc_data.xlsx", "Excel Files (*.xlsx);;UPC Session (*.upcs)")
         if not path:
             return
+        if not os.path.splitext(path)[1]:
+            path += SESSION_EXT if SESSION_EXT in selected else ".xlsx"
+        self._save_to(path)
+
+    # 제품 카탈로그 (UPC → 설명/예상 수량, 메모리 매핑 인덱스)
+    def _open_catalog(self, path: str | None = None):
+        from model.catalog import Catalog, default_catalog_path
+        path = path or default_catalog_path()
+        if not os.path.exists(path):
+            return
         try:
-            export_excel(self.model.dataframe(), path)
-            self.current_file = path
-            self.is_dirty = False
-            self._update_title()
-            self.status_bar.showMessage(f"저장 완료: {os.path.basename(path)}", 3000)
-        except Exception as e:
-            QMessageBox.critical(self, "Save As 실패", str(e))
+            catalog = Catalog(path)
+        except (OSError, ValueError) as e:
+            self.status_bar.showMessage(f"카탈로그를 열 수 없습니다: {e}", 5000)
+            return
+        self._close_catalog()
+        self.model.set_catalog(catalog)
+
+    def _close_catalog(self):
+        catalog = self.model.catalog()
+        if catalog is not None:
+            self.model.set_catalog(None)
+            catalog.close()
+
+    def on_import_catalog(self):
+        from model.catalog import build_catalog, default_catalog_path
+        path, _ = QFileDialog.getOpenFileName(self, "Import Catalog", "", "Catalog (*.xlsx *.csv)")
+        if not path:
+            return
+        if self._io_job is not None:
+            self.status_bar.showMessage("다른 파일 작업이 진행 중입니다.", 2000)
+            return
+        self._close_catalog()   # 인덱스 파일을 교체하므로 매핑을 먼저 푼다
+        self._start_io("catalog", path, build_catalog, path, default_catalog_path(), self.UPC_MIN_LEN)
+
+    # 재고 차이 (센 수량 ↔ 예상 재고 통합문서)
+    def on_variance(self):
+        from model.variance import variance_from_file
+        path, _ = QFileDialog.getOpenFileName(self, "Expected Stock", "", "Excel Files (*.xlsx)")
+        if not path:
+            return
+        # 저장처럼 스냅샷으로 비교 — 비교 중에도 스캔은 계속 반영
+        self._start_io("variance", path, variance_from_file, self.model.store().copy(), path)
+
+    def on_validate(self):
+        import multiprocessing
+        from functools import partial
+        from model.lint import lint_workbook
+        path, _ = QFileDialog.getOpenFileName(self, "Validate Workbook", "", "Excel Files (*.xlsx)")
+        if not path:
+            return
+        # 구간별 검사 프로세스 — GUI 프로세스를 fork하지 않도록 spawn
+        self._start_io("lint", path, partial(lint_workbook, mp_context=multiprocessing.get_context("spawn")), path)
+
+    def _offer_lint_report(self, report, path: str):
+        from model.lint import RULES, export_lint
+        from model.io_excel import save_atomic
+        name = os.path.basename(path)
+        if not len(report):
+            QMessageBox.information(self, "Validate", f"{name}: {report.rows:,}행 — 문제 없음")
+            return
+        counts = "\n".join(f"- {rule}: {n:,}" for rule, n in zip(RULES, report.counts().tolist()) if n)
+        verdict = "불러올 수 있음 (경고만)" if report.importable else "이대로는 불러올 수 없음"
+        reply = QMessageBox.question(
+            self, "Validate", f"{name}: {report.rows:,}행 검사, 문제 {len(report):,}건 — {verdict}\n{counts}\n\n"
+                              "오류 보고서를 저장할까요?")
+        if reply != QMessageBox.StandardButton.Yes:
+            return
+        root = os.path.splitext(path)[0]
+        out, _ = QFileDialog.getSaveFileName(self, "Save Report", f"{root}.errors.xlsx",
+                                             "Excel Files (*.xlsx);;CSV (*.csv)")
+        if out:
+            self._start_io("report", out, save_atomic, export_lint, report, out)
+
+    # 자동 저장 (바뀐 행만 체크포인트에 기록, 백그라운드)
+    def set_autosave(self, on: bool):
+        if on:
+            self._autosave_timer.start()
+        else:
+            self._autosave_timer.stop()
+
+    def autosave(self):
+        from controller.io_worker import IoWorker, write_autosave
+        if self._autosave_job is not None or self._io_job is not None or not self.model.has_dirty_rows():
+            return
+        rows = self.model.take_dirty_rows()
+        journal = self.journal if self.journal.active else None
+        job = IoWorker(write_autosave, self.current_file, self.model.rows_snapshot(rows),
+                       len(self.model.store()), journal, self.journal.position(), self.journal.generation)
+        job.signals.finished.connect(self._on_autosave_finished)
+        job.signals.failed.connect(self._on_autosave_failed)
+        self._autosave_job = job
+        self._autosave_rows = rows
+        self._autosave_snapshot_revision = self.model.revision()
+        self._autosave_job_generation = self._autosave_generation
+        self._autosave_pool.start(job)
+
+    def _on_autosave_finished(self, _seq):
+        self._autosave_job = None
+        self._autosave_rows = None
+        if self._autosave_job_generation != self._autosave_generation:
+            return
+        self._autosave_revision = self._autosave_snapshot_revision
+        self._update_title()
+
+    def _on_autosave_failed(self, msg: str):
+        if self._autosave_job_generation == self._autosave_generation:
+            self.model.mark_rows_dirty(self._autosave_rows)
+        self._autosave_job = None
+        self._autosave_rows = None
+        self.status_bar.showMessage(f"자동 저장 실패: {msg}", 5000)
+
+    # 크래시 복구 저널
+    def start_journal(self):
+        """시작 시 호출: 남은 저널이 있으면 복구를 제안하고, 아니면 새 저널 시작"""
+        from model.journal import base_matches, pending_records, read_header
+        path = self.journal.path
+        n = pending_records(path)
+        if n:
+            header = read_header(path)[0]
+            base = header.get("base")
+            if not base_matches(header):
+                QMessageBox.warning(
+                    self, "복구 불가",
+                    f"저장되지 않은 스캔 {n:,}건이 있지만 기준 파일이 변경되어 복구할 수 없습니다.\n"
+                    f"기준 파일: {base or 'Untitled'}"
+                )
+                self._discard_journal(keep_copy=True)
+            else:
+                reply = QMessageBox.question(
+                    self, "복구",
+                    f"저장되지 않은 스캔 {n:,}건이 있습니다.\n"
+                    f"마지막 저장 파일({os.path.basename(base) if base else 'Untitled'}) 위에 복구하시겠습니까?",
+                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+                )
+                if reply == QMessageBox.StandardButton.Yes:
+                    self._start_recovery(base)
+                    return
+        self.journal.start(self.current_file)
+        self.model.set_journal(self.journal)
+
+    def _start_recovery(self, base: str | None):
+        from model.session import load_store
+        from controller.io_worker import load_with_journal
+        self._start_io("recover", base, load_with_journal, load_store, base, self.journal.path)
+
+    def _discard_journal(self, keep_copy: bool = False):
+        """저널 폐기 후 새로 시작 (keep_copy면 .bak으로 보관)"""
+        self.journal.close()
+        if keep_copy and os.path.exists(self.journal.path):
+            os.replace(self.journal.path, self.journal.path + ".bak")
+        self.journal.start(self.current_file)
+        self.model.set_journal(self.journal)
+
+    # 네트워크 스캐너 수신
+    def set_scan_server(self, on: bool):
+        from controller.scan_server import ScanServer, is_loopback
+        if not on:
+            if self.scan_server is not None:
+                self.scan_server.stop()
+                self.scan_server = None
+                self.status_bar.showMessage("네트워크 수신 중지", 2000)
+            return
+        if self.scan_server is not None:
+            return
+        host = os.environ.get("UPC_SCAN_HOST") or self.SCAN_SERVER_HOST
+        token = os.environ.get("UPC_SCAN_TOKEN") or None
+        allow = [a for a in os.environ.get("UPC_SCAN_ALLOW", "").split(",") if a.strip()] or None
+        try:
+            if token is None and allow is None and not is_loopback(host):
+                # 인증 없이 네트워크 전체에 열면 아무 PC나 재고를 바꿀 수 있다
+                raise ValueError("UPC_SCAN_TOKEN 또는 UPC_SCAN_ALLOW를 함께 설정하세요.")
+            server = ScanServer(self.model, host, self.SCAN_SERVER_PORT, udp_port=self.SCAN_SERVER_PORT,
+                                upc_min_len=self.UPC_MIN_LEN, token=token, allow=allow, parent=self)
+            server.start()
+        except (OSError, ValueError) as e:
+            QMessageBox.warning(self, "네트워크 수신", f"{host}:{self.SCAN_SERVER_PORT}를 열 수 없습니다.\n{e}")
+            self.act_network.blockSignals(True)
+            self.act_network.setChecked(False)
+            self.act_network.blockSignals(False)
+            return
+        server.applied.connect(self._on_network_scans)
+        server.set_paused(self._io_kind in ("open", "recover"))
+        self.scan_server = server
+        self.status_bar.showMessage(f"네트워크 수신 중: {host} TCP/UDP {self.SCAN_SERVER_PORT}", 3000)
+
+    def _on_network_scans(self, n: int):
+        self.mark_dirty()
+        self.status_bar.showMessage(f"네트워크 스캔 {n}건 반영", 2000)
+
+    # 성능 계측 (켜져 있을 때만 핫 패스를 감싼다 — utils.perf)
+    def set_perf(self, on: bool):
+        from widgets.perf_panel import PaintProbe, PerfPanel
+        if self.perf_panel is None:
+            self.perf_panel = PerfPanel(self)
+            self.perf_panel.closed.connect(lambda: self.act_perf.setChecked(False))
+            self.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, self.perf_panel)
+            self._paint_probe = PaintProbe(self.table)
+        if on:
+            perf.enable()
+            self._paint_probe.install()
+            self.perf_panel.show()
+        else:
+            self._paint_probe.remove()
+            perf.disable()
+            self.perf_panel.hide()
 
     # 키 처리 / 입력 버퍼
     def keyPressEvent(self, event):
@@ -268,30 +784,75 @@ class MainWindow(QMainWindow):
             return
 
         if text and not text.isspace():
-            self.buffer.append(text)
-            self.update_buffer_display()
+            if self.buffer.push(text, time.perf_counter()):
+                self.update_buffer_display()
+            elif not self._burst_timer.isActive():
+                self._burst_timer.start()   # 스캐너 연사: 위젯은 건드리지 않고 모아 둠
         else:
             super().keyPressEvent(event)
 
     def update_buffer_display(self):
-        self.buffer_display.setText("".join(self.buffer))
+        self._burst_timer.stop()
+        text = self.buffer.text()
+        if text != self.buffer_display.text():
+            self.buffer_display.setText(text)
 
     def clear_buffer(self):
-        self.buffer = []
+        self.buffer.clear()
         self.update_buffer_display()
         self.status_bar.showMessage("버퍼를 지웠습니다.", 1500)
 
     def process_buffer(self):
-        from controller.input_handler import handle_input
-        raw = "".join(self.buffer).strip()
+        raw = self.buffer.text().strip()
         self.clear_buffer()
-        if raw:
-            handle_input(self, raw)
-            self.mark_dirty()
+        if not raw:
+            return
+        if self._io_kind in ("open", "recover"):
+            # 불러오기/복구 중에는 대기열에 보관 → 새 저장소로 바뀐 뒤 반영 (버리지 않음)
+            self._pending_scans.append(raw)
+            self.status_bar.showMessage(f"{self._io_label()} — 대기 스캔 {len(self._pending_scans)}건")
+            return
+        self._apply_scan(raw)
+
+    def _apply_scan(self, raw: str):
+        # 한 틱 동안 들어온 스캔을 모아 일괄 반영 (controller.scan_queue)
+        self.scan_queue.push(raw)
+
+    # UPC 찾기
+    def on_search_edited(self, text: str):
+        self.search_hits.setStringList(self.model.search_upc(text) if len(text.strip()) >= 2 else [])
+
+    def on_search_entered(self):
+        text = self.search_edit.text().strip().upper()
+        if not text:
+            return
+        if self.model.has_upc(text):
+            self.jump_to_upc(text)
+            return
+        # 앞/뒷부분으로 못 찾으면 중간 부분까지 (전체 스캔이라 Enter에서만)
+        hits = self.model.search_upc(text) or self.model.search_upc(text, contains=True)
+        if not hits:
+            self.status_bar.showMessage(f"'{text}'이(가) 들어 있는 UPC가 없습니다.", 3000)
+            return
+        if len(hits) > 1:
+            self.status_bar.showMessage(f"'{text}' 후보 {len(hits)}개 — 첫 번째로 이동", 3000)
+        self.jump_to_upc(hits[0])
+
+    def jump_to_upc(self, upc: str):
+        row = self.model.find_row_by_upc(upc)
+        if row < 0 and self.model.has_upc(upc):
+            self.model.set_filter("")   # 필터에 가려진 행 (필터 상자는 _sync_current_row가 비운다)
+            row = self.model.find_row_by_upc(upc)
+        if row < 0:
+            return
+        self.select_row(row)
+        self.table.scrollTo(self.model.index(row, 0))
+        self.buffer_display.setFocus()
 
     def select_row(self, row_idx: int):
         if row_idx < 0:
             return
+        self.model.fetch_to(row_idx)   # 아직 노출하지 않은 행이면 거기까지 가져온다
         self.table.clearSelection()
         self.table.selectRow(row_idx)
         self.current_row = row_idx
@@ -318,8 +879,8 @@ class MainWindow(QMainWindow):
                 self.edit_warning_shown = True
 
             r = idx.row()
-            cur_upc = str(self.model.dataframe().iat[r, 0] or "")
-            cur_qty = int(self.model.dataframe().iat[r, 1] or 0)
+            cur_upc = self.model.upc_at(r)
+            cur_qty = self.model.qty_at(r)
 
             dlg = EditRowDialog(self, cur_upc, cur_qty)
             if dlg.exec() == QDialog.DialogCode.Accepted:
@@ -331,15 +892,40 @@ class MainWindow(QMainWindow):
 
     # (선택) 창 닫을 때 저장 여부 묻기
     def closeEvent(self, event):
+        if self._io_job is not None:
+            self.status_bar.showMessage("파일 작업이 끝난 뒤 다시 시도하세요.", 3000)
+            event.ignore()
+            return
         if self.is_dirty:
             reply = QMessageBox.question(
                 self, "저장", "변경사항을 저장하시겠습니까?",
                 QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No | QMessageBox.StandardButton.Cancel
             )
             if reply == QMessageBox.StandardButton.Yes:
-                self.on_save()
-                event.accept()
+                # 저장 완료 후 창을 닫는다 (_on_io_finished)
+                if self.current_file:
+                    self._close_after_save = self._save_to(self.current_file)
+                else:
+                    self.on_save_as()
+                    self._close_after_save = self._io_job is not None
+                event.ignore()
             elif reply == QMessageBox.StandardButton.No:
+                # 저장하지 않고 종료 → 저널도 버린다
+                from model import checkpoint
+                self.act_network.setChecked(False)   # 네트워크 수신 중지
+                self._autosave_pool.waitForDone()
+                was_active = self.journal.active
+                self.journal.close()
+                if was_active and os.path.exists(self.journal.path):
+                    os.remove(self.journal.path)
+                    checkpoint.remove(checkpoint.checkpoint_path(self.current_file))
                 event.accept()
             else:
                 event.ignore()
+        else:
+            self.act_network.setChecked(False)
+            self._autosave_pool.waitForDone()
+            self.journal.close()
+
+
+perf.register(MainWindow, "process_buffer", slow_ms=50, mark="scan")
@@ -0,0 +1,81 @@
+"""로그 설정: 한 줄 JSON(구조화) + 성능 로그 빈도 제한
+
+    setup_logging("INFO", "upc_counter.log")   # 파일 없으면 stderr
+    logging.getLogger(PERF_LOGGER).warning("slow", extra={"metric": "...", "ms": 12.3})
+
+extra로 넘긴 필드는 JSON 키로 그대로 나간다.
+"""
+import json
+import logging
+import threading
+import time
+
+APP_LOGGER = "upc_counter"
+PERF_LOGGER = "upc_counter.perf"
+
+# LogRecord 기본 속성 — 이 밖의 속성은 extra로 들어온 필드
+_STD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime", "taskName"}
+
+
+class JsonFormatter(logging.Formatter):
+    """ts, level, logger, msg + extra 필드를 한 줄 JSON으로"""
+    def format(self, record: logging.LogRecord) -> str:
+        out = {
+            "ts": round(record.created, 3),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        out.update((k, v) for k, v in vars(record).items() if k not in _STD_ATTRS)
+        if record.exc_info:
+            out["exc"] = self.formatException(record.exc_info)
+        return json.dumps(out, ensure_ascii=False, default=str)
+
+
+class RateLimitFilter(logging.Filter):
+    """키(메세지 + metric)별 토큰 버킷: 초당 rate건, 최대 burst건 연속 허용
+
+    버려진 건수는 다음에 통과하는 기록의 suppressed 필드로 알린다.
+    """
+    def __init__(self, rate: float = 1.0, burst: int = 5):
+        super().__init__()
+        self.rate = rate
+        self.burst = burst
+        self._buckets: dict = {}    # 키 → [토큰, 마지막 시각, 버린 수]
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        key = (record.msg, getattr(record, "metric", None))
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = [float(self.burst), now, 0]
+            bucket[0] = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+            if bucket[0] < 1:
+                bucket[2] += 1
+                return False
+            bucket[0] -= 1
+            if bucket[2]:
+                record.suppressed = bucket[2]
+                bucket[2] = 0
+        return True
+
+
+def setup_logging(level: str | int = "WARNING", path: str | None = None,
+                  perf_rate: float = 1.0, perf_burst: int = 5) -> logging.Logger:
+    """앱 로거(upc_counter.*)에 JSON 핸들러를 붙이고 성능 로그에 빈도 제한을 건다 (여러 번 불러도 한 번만)"""
+    log = logging.getLogger(APP_LOGGER)
+    log.setLevel(level.upper() if isinstance(level, str) else level)
+    if not any(getattr(h, "_upc_counter", False) for h in log.handlers):
+        handler = logging.FileHandler(path, encoding="utf-8") if path else logging.StreamHandler()
+        handler.setFormatter(JsonFormatter())
+        handler._upc_counter = True
+        log.addHandler(handler)
+        log.propagate = False
+    perf = logging.getLogger(PERF_LOGGER)
+    for f in [f for f in perf.filters if isinstance(f, RateLimitFilter)]:
+        perf.removeFilter(f)
+    perf.addFilter(RateLimitFilter(perf_rate, perf_burst))
+    return log
@@ -0,0 +1,213 @@
+"""핫 패스 계측 — 꺼져 있으면 원래 함수를 그대로 쓰므로 비용 0
+
+    perf.register(DataFrameModel, "append_row", "add_qty")   # 메서드 등록 (모듈 로드 시)
+    @perf.timed(slow_ms=50)   # 모듈 함수는 정의할 때 감싼다 (from-import로 가져가도 계측됨)
+    perf.enable()      # 등록된 함수를 시간 재는 래퍼로 교체
+    perf.summary()     # {이름: {count, rate, p50_us, p99_us, max_us}}
+    perf.export_trace("trace.json")   # 또는 .csv
+    perf.disable()     # 원래 함수로 되돌림
+
+각 지표는 최근 RingHistogram.SIZE개 (끝난 시각, 소요 µs)를 고리 버퍼에 담는다.
+slow_ms를 넘긴 호출은 upc_counter.perf 로거로 남긴다 (utils.logging_conf에서 빈도 제한).
+"""
+import csv
+import functools
+import json
+import logging
+import time
+
+import numpy as np
+
+from .logging_conf import PERF_LOGGER
+
+_clock = time.perf_counter
+_log = logging.getLogger(PERF_LOGGER)
+
+
+class RingHistogram:
+    """최근 SIZE개 샘플의 고리 버퍼 + 누적 개수/합계 (record는 리스트 대입 두 번)"""
+    SIZE = 4096   # 2의 거듭제곱 (인덱스를 & 로 계산)
+
+    def __init__(self, name: str, slow_ms: float | None = None):
+        self.name = name
+        self.slow_us = slow_ms * 1000 if slow_ms else float("inf")
+        self._t = [0.0] * self.SIZE    # 끝난 시각 (perf_counter 초)
+        self._d = [0.0] * self.SIZE    # 소요 시간 (µs)
+        self.count = 0
+        self.total_us = 0.0
+
+    def record(self, dur_us: float, end: float):
+        i = self.count & (self.SIZE - 1)
+        self._t[i] = end
+        self._d[i] = dur_us
+        self.count += 1
+        self.total_us += dur_us
+        if dur_us > self.slow_us:
+            _log.warning("slow", extra={"metric": self.name, "ms": round(dur_us / 1000, 2)})
+
+    def clear(self):
+        self.count = 0
+        self.total_us = 0.0
+
+    def samples(self) -> tuple[np.ndarray, np.ndarray]:
+        """(끝난 시각, 소요 µs) — 오래된 것부터"""
+        n = min(self.count, self.SIZE)
+        start = self.count - n
+        idx = (np.arange(start, self.count) & (self.SIZE - 1)) if n else np.empty(0, dtype=np.int64)
+        return np.asarray(self._t)[idx], np.asarray(self._d)[idx]
+
+    def stats(self, now: float | None = None, window: float = 1.0) -> dict:
+        """최근 window초의 초당 호출 수와 고리 버퍼 전체의 분위수"""
+        t, d = self.samples()
+        now = _clock() if now is None else now
+        out = {"count": self.count, "rate": float(np.count_nonzero(t > now - window)) / window}
+        if len(d):
+            p50, p99 = np.percentile(d, (50, 99))
+            out.update(p50_us=float(p50), p99_us=float(p99), max_us=float(d.max()))
+        return out
+
+
+_hists: dict[str, RingHistogram] = {}
+_targets: list[tuple] = []          # (owner, attr, metric, mark, slow_ms)
+_originals: dict[tuple, object] = {}
+_marks: dict[str, list[float]] = {}  # mark 키 → 아직 화면에 안 그려진 시작 시각들
+_enabled = False
+_t0 = 0.0                            # enable() 시각 — 추적 파일의 기준
+
+
+def enabled() -> bool:
+    return _enabled
+
+
+def histogram(name: str, slow_ms: float | None = None) -> RingHistogram:
+    hist = _hists.get(name)
+    if hist is None:
+        hist = _hists[name] = RingHistogram(name, slow_ms)
+    return hist
+
+
+def _metric_name(owner, attr: str) -> str:
+    return f"{owner.__name__.rsplit('.', 1)[-1]}.{attr}"
+
+
+def _wrap(fn, hist: RingHistogram, mark: str | None):
+    pending = _marks.setdefault(mark, []) if mark else None
+
+    @functools.wraps(fn)
+    def timed(*args, **kwargs):
+        t0 = _clock()
+        if pending is not None and len(pending) < RingHistogram.SIZE:
+            pending.append(t0)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            t1 = _clock()
+            hist.record((t1 - t0) * 1e6, t1)
+    return timed
+
+
+def _install(owner, attr: str, metric: str, mark: str | None, slow_ms):
+    if (owner, attr) in _originals:
+        return
+    orig = owner.__dict__[attr] if isinstance(owner, type) else getattr(owner, attr)
+    _originals[(owner, attr)] = orig
+    setattr(owner, attr, _wrap(orig, histogram(metric, slow_ms), mark))
+
+
+def timed(fn=None, *, slow_ms: float | None = None, mark: str | None = None):
+    """모듈 함수용 데코레이터 — 꺼져 있으면 플래그 확인 한 번 뒤 원래 함수를 부른다
+
+    register는 속성을 바꿔 끼우므로 `from .io_excel import import_store`처럼 이미 가져간
+    이름에는 닿지 않는다. 모듈 함수는 이것으로 정의 위치에서 감싼다.
+    """
+    def deco(fn):
+        metric = f"{fn.__module__.rsplit('.', 1)[-1]}.{fn.__name__}"
+        wrapped = []   # 처음 켜졌을 때 한 번 만든다
+
+        @functools.wraps(fn)
+        def call(*args, **kwargs):
+            if not _enabled:
+                return fn(*args, **kwargs)
+            if not wrapped:
+                wrapped.append(_wrap(fn, histogram(metric, slow_ms), mark))
+            return wrapped[0](*args, **kwargs)
+        return call
+    return deco(fn) if fn is not None else deco
+
+
+def register(owner, *attrs: str, slow_ms: float | None = None, mark: str | None = None):
+    """owner 클래스의 메서드들을 계측 대상으로 등록 (모듈 함수는 timed)
+
+    mark를 주면 호출 시작 시각을 그 키로 남겨 settle()에서 화면 반영까지의 지연을 잰다.
+    이미 켜져 있으면 바로 교체한다 (지연 import된 모듈).
+    """
+    for attr in attrs:
+        metric = _metric_name(owner, attr)
+        _targets.append((owner, attr, metric, mark, slow_ms))
+        if _enabled:
+            _install(owner, attr, metric, mark, slow_ms)
+
+
+def enable():
+    global _enabled, _t0
+    if _enabled:
+        return
+    _enabled = True
+    _t0 = _clock()
+    for owner, attr, metric, mark, slow_ms in _targets:
+        _install(owner, attr, metric, mark, slow_ms)
+
+
+def disable():
+    global _enabled
+    if not _enabled:
+        return
+    _enabled = False
+    for (owner, attr), orig in _originals.items():
+        setattr(owner, attr, orig)
+    _originals.clear()
+    for pending in _marks.values():
+        pending.clear()
+
+
+def reset():
+    for hist in _hists.values():
+        hist.clear()
+    for pending in _marks.values():
+        pending.clear()
+
+
+def settle(mark: str, name: str, slow_ms: float | None = None):
+    """mark로 남긴 시작 시각들 → 지금까지의 지연을 name 지표에 기록 (예: 스캔 → 화면 반영)"""
+    pending = _marks.get(mark)
+    if not pending:
+        return
+    now = _clock()
+    hist = histogram(name, slow_ms)
+    for t in pending:
+        hist.record((now - t) * 1e6, now)
+    pending.clear()
+
+
+def summary() -> dict:
+    now = _clock()
+    return {name: hist.stats(now) for name, hist in sorted(_hists.items()) if hist.count}
+
+
+def export_trace(path: str):
+    """고리 버퍼의 샘플을 파일로 — .csv면 (metric, t_s, dur_us) 행, 아니면 JSON"""
+    if path.lower().endswith(".csv"):
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            w = csv.writer(f)
+            w.writerow(["metric", "t_s", "dur_us"])
+            for name, hist in sorted(_hists.items()):
+                for t, d in zip(*hist.samples()):
+                    w.writerow([name, f"{t - _t0:.6f}", f"{d:.1f}"])
+        return
+    trace = {
+        "summary": summary(),
+        "samples": {name: [[round(t - _t0, 6), round(d, 1)] for t, d in zip(*hist.samples())]
+                    for name, hist in sorted(_hists.items()) if hist.count},
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(trace, f)
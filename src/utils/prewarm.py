@@ -0,0 +1,54 @@
+"""무거운 모듈 미리 불러오기
+
+시작 경로에서는 pandas/openpyxl을 import하지 않는다 (빈 RowStore로 창을 띄움).
+첫 화면이 그려진 뒤 백그라운드 스레드에서 미리 import해 두면 처음 Open/Save를
+누를 때 멈칫하지 않는다. import 잠금은 모듈 단위라, 그사이 GUI 스레드가 같은
+모듈을 import하면 끝날 때까지 기다렸다가 같은 모듈 객체를 쓴다.
+"""
+import importlib
+import logging
+import threading
+import time
+
+from PyQt6.QtCore import QEvent, QObject, QTimer
+
+from .logging_conf import APP_LOGGER
+
+MODULES = ("pandas", "openpyxl", "model.io_excel")
+
+
+def start(modules=MODULES) -> threading.Thread:
+    t = threading.Thread(target=_run, args=(tuple(modules),), name="prewarm", daemon=True)
+    t.start()
+    return t
+
+
+def _run(modules: tuple):
+    log = logging.getLogger(APP_LOGGER)
+    for name in modules:
+        t0 = time.perf_counter()
+        try:
+            importlib.import_module(name)
+        except Exception:
+            log.warning("미리 불러오기 실패: %s", name, exc_info=True)
+            continue
+        log.debug("미리 불러옴: %s", name, extra={"ms": (time.perf_counter() - t0) * 1000})
+
+
+class _FirstPaint(QObject):
+    def __init__(self, widget, modules):
+        super().__init__(widget)
+        self._modules = modules
+        widget.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Paint:
+            obj.removeEventFilter(self)
+            # 이번 그리기가 끝난 다음 이벤트 루프 차례에 시작
+            QTimer.singleShot(0, lambda: start(self._modules))
+        return False
+
+
+def start_after_paint(widget, modules=MODULES):
+    """widget이 처음 그려진 뒤 start(modules)"""
+    _FirstPaint(widget, modules)
@@ -0,0 +1,129 @@
+import logging
+import time
+
+from PyQt6.QtCore import QEvent, QObject, QTimer, pyqtSignal
+from PyQt6.QtGui import QFontDatabase
+from PyQt6.QtWidgets import (
+    QDockWidget, QFileDialog, QHBoxLayout, QLabel, QMessageBox, QPlainTextEdit,
+    QPushButton, QVBoxLayout, QWidget
+)
+
+from utils import perf
+from utils.logging_conf import PERF_LOGGER
+
+PAINT_SLOW_MS = 50
+RENDER_SLOW_MS = 100
+
+
+class PaintProbe(QObject):
+    """테이블 viewport의 그리기 시간과 스캔(Enter) → 화면 반영 지연을 잰다
+
+    viewport에 이벤트 필터로 붙어 Paint를 직접 view.viewportEvent로 처리하고
+    앞뒤 시각을 기록한다. 계측을 켤 때만 설치.
+    """
+    def __init__(self, view):
+        super().__init__(view)
+        self._view = view
+        self._paint = perf.histogram("view.paint", PAINT_SLOW_MS)
+
+    def install(self):
+        self._view.viewport().installEventFilter(self)
+
+    def remove(self):
+        self._view.viewport().removeEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if event.type() != QEvent.Type.Paint:
+            return False
+        t0 = time.perf_counter()
+        self._view.viewportEvent(event)
+        t1 = time.perf_counter()
+        self._paint.record((t1 - t0) * 1e6, t1)
+        perf.settle("scan", "scan_to_render", RENDER_SLOW_MS)
+        return True
+
+
+class PerfPanel(QDockWidget):
+    """숨은 성능 패널 (Ctrl+Shift+P): 초당 스캔, 스캔→화면 p99, 그리기 p99 + 지표 표"""
+    REFRESH_MS = 500
+    SUMMARY_LOG_EVERY = 20     # 새로 고침 20번(10초)마다 요약을 로그로
+    closed = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__("성능", parent)
+        self.setObjectName("perf_panel")
+        self._log = logging.getLogger(PERF_LOGGER)
+        self._ticks = 0
+
+        self.headline = QLabel()
+        self.headline.setStyleSheet("font-size: 12pt; font-weight: bold;")
+        self.table = QPlainTextEdit()
+        self.table.setReadOnly(True)
+        self.table.setFont(QFontDatabase.systemFont(QFontDatabase.SystemFont.FixedFont))
+        self.table.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+
+        btn_reset = QPushButton("초기화")
+        btn_reset.clicked.connect(self._reset)
+        btn_export = QPushButton("추적 저장...")
+        btn_export.clicked.connect(self._export)
+        buttons = QHBoxLayout()
+        buttons.addStretch(1)
+        buttons.addWidget(btn_reset)
+        buttons.addWidget(btn_export)
+
+        body = QWidget()
+        layout = QVBoxLayout(body)
+        layout.addWidget(self.headline)
+        layout.addWidget(self.table)
+        layout.addLayout(buttons)
+        self.setWidget(body)
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(self.REFRESH_MS)
+        self._timer.timeout.connect(self.refresh)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.refresh()
+        self._timer.start()
+
+    def hideEvent(self, event):
+        self._timer.stop()
+        super().hideEvent(event)
+
+    def closeEvent(self, event):
+        super().closeEvent(event)
+        self.closed.emit()
+
+    def refresh(self):
+        stats = perf.summary()
+        scans = stats.get("MainWindow.process_buffer", {}).get("rate", 0.0)
+        render = stats.get("scan_to_render", {}).get("p99_us")
+        paint = stats.get("view.paint", {}).get("p99_us")
+        ms = lambda us: "-" if us is None else f"{us / 1000:.1f} ms"
+        self.headline.setText(f"스캔 {scans:.0f}/s   스캔→화면 p99 {ms(render)}   그리기 p99 {ms(paint)}")
+
+        lines = [f"{'지표':<40}{'호출':>9}{'/s':>8}{'p50 µs':>10}{'p99 µs':>10}{'max µs':>11}"]
+        for name, s in stats.items():
+            lines.append(f"{name:<40}{s['count']:>9,}{s['rate']:>8.0f}"
+                         f"{s.get('p50_us', 0):>10.1f}{s.get('p99_us', 0):>10.1f}{s.get('max_us', 0):>11.1f}")
+        self.table.setPlainText("\n".join(lines))
+
+        self._ticks += 1
+        if self._ticks % self.SUMMARY_LOG_EVERY == 0 and stats:
+            self._log.info("summary", extra={"metrics": {
+                name: {k: round(v, 1) for k, v in s.items()} for name, s in stats.items()}})
+
+    def _reset(self):
+        perf.reset()
+        self.refresh()
+
+    def _export(self):
+        path, _ = QFileDialog.getSaveFileName(self, "추적 저장", "perf_trace.json",
+                                              "JSON (*.json);;CSV (*.csv)")
+        if not path:
+            return
+        try:
+            perf.export_trace(path)
+        except OSError as e:
+            QMessageBox.warning(self, "추적 저장", f"저장 실패: {e}")
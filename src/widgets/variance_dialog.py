@@ -0,0 +1,135 @@
+import os
+
+import numpy as np
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, QThreadPool, Qt
+from PyQt6.QtGui import QColor
+from PyQt6.QtWidgets import (
+    QComboBox, QDialog, QFileDialog, QHBoxLayout, QHeaderView, QLabel, QMessageBox,
+    QPushButton, QTableView, QVBoxLayout
+)
+
+from model.variance import MATCH, REPORT_COLUMNS, STATUSES, VarianceReport
+
+_DIFF_COLORS = {True: QColor("#1a7f37"), False: QColor("#c62828")}   # 초과 / 부족
+
+
+class VarianceTableModel(QAbstractTableModel):
+    """VarianceReport의 한 구간(분류 하나 또는 차이 전체)을 보여주는 읽기 전용 모델"""
+    def __init__(self, report: VarianceReport, parent=None):
+        super().__init__(parent)
+        self._report = report
+        self._rows = slice(0, int(report.bounds[MATCH]))
+        self._labels = np.array(STATUSES, dtype=object)
+
+    def set_rows(self, rows: slice):
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._rows.stop - self._rows.start
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(REPORT_COLUMNS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        r, c = self._rows.start + index.row(), index.column()
+        rep = self._report
+        if role == Qt.ItemDataRole.DisplayRole:
+            if c == 0:
+                return str(rep.upc[r])
+            if c == 1:
+                return str(int(rep.counted[r]))
+            if c == 2:
+                return str(int(rep.expected[r]))
+            if c == 3:
+                return f"{int(rep.counted[r] - rep.expected[r]):+d}"
+            return self._labels[rep.status[r]]
+        if role == Qt.ItemDataRole.ForegroundRole and c == 3:
+            diff = int(rep.counted[r] - rep.expected[r])
+            return _DIFF_COLORS[diff > 0] if diff else None
+        if role == Qt.ItemDataRole.TextAlignmentRole and 1 <= c <= 3:
+            return Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        return REPORT_COLUMNS[section] if orientation == Qt.Orientation.Horizontal else section + 1
+
+
+class VarianceDialog(QDialog):
+    """재고 차이 보고서: 분류별 합계 + 분류 선택 표 + 엑셀 내보내기"""
+    def __init__(self, parent, report: VarianceReport, source: str):
+        super().__init__(parent)
+        self.setWindowTitle(f"재고 차이 — {os.path.basename(source)}")
+        self.resize(720, 560)
+        self._report = report
+        self._job = None
+
+        totals = report.totals()
+        lines = [f"{'':<12}{'UPC':>10}{'센 수량':>12}{'예상':>12}{'차이':>12}"]
+        for name, row in totals.iterrows():
+            lines.append(f"{name:<12}{row['UPCs']:>10,}{row['Counted']:>12,}{row['Expected']:>12,}{row['Diff']:>+12,}")
+        self.summary = QLabel("\n".join(lines))
+        self.summary.setStyleSheet("font-family: monospace;")
+        self.summary.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+
+        self.category = QComboBox()
+        self.category.addItem("차이 전체", None)
+        for k, name in enumerate(STATUSES):
+            self.category.addItem(f"{name} ({int(totals.loc[name, 'UPCs']):,})", k)
+        self.category.currentIndexChanged.connect(self._on_category)
+
+        self.model = VarianceTableModel(report, self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.verticalHeader().setVisible(False)
+        # 행이 많아도 높이 계산을 하지 않도록 고정
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.table.setColumnWidth(0, 220)
+
+        self.status = QLabel()
+        self.btn_export = QPushButton("Export...")
+        self.btn_export.clicked.connect(self._export)
+        bottom = QHBoxLayout()
+        bottom.addWidget(self.status, 1)
+        bottom.addWidget(self.btn_export)
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.summary)
+        layout.addWidget(self.category)
+        layout.addWidget(self.table, 1)
+        layout.addLayout(bottom)
+
+    def _on_category(self, _):
+        k = self.category.currentData()
+        self.model.set_rows(slice(0, int(self._report.bounds[MATCH])) if k is None else self._report.rows(k))
+
+    def _export(self):
+        from controller.io_worker import IoWorker
+        from model.io_excel import save_atomic
+        from model.variance import export_variance
+        path, _ = QFileDialog.getSaveFileName(self, "Export Variance", "variance.xlsx", "Excel Files (*.xlsx)")
+        if not path or self._job is not None:
+            return
+        job = IoWorker(save_atomic, export_variance, self._report, path)
+        job.signals.progress.connect(lambda rows: self.status.setText(f"내보내는 중 — {rows:,}행"))
+        job.signals.finished.connect(lambda p: self._export_done(f"저장 완료: {os.path.basename(p)}"))
+        job.signals.failed.connect(lambda msg: (self._export_done(""), QMessageBox.critical(self, "Export 실패", msg)))
+        job.signals.cancelled.connect(lambda: self._export_done("취소됨"))
+        self._job = job
+        self.btn_export.setEnabled(False)
+        QThreadPool.globalInstance().start(job)
+
+    def _export_done(self, msg: str):
+        self._job = None
+        self.btn_export.setEnabled(True)
+        self.status.setText(msg)
+
+    def done(self, result):
+        if self._job is not None:
+            self._job.cancel()
+        super().done(result)
@@ -0,0 +1,84 @@
+"""pytest 공통 설정 — src를 import 경로에 넣고 Qt는 화면 없이(offscreen) 띄운다
+
+    python -m pytest -q
+"""
+import os
+import sys
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    from PyQt6.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def wait(qapp):
+    """wait(done) — done()이 참이 될 때까지 (최대 timeout_ms) Qt 이벤트 루프를 돌린다"""
+    from PyQt6.QtCore import QEventLoop, QTimer
+
+    def run(done, timeout_ms=10_000):
+        loop = QEventLoop()
+        timer = QTimer()
+        timer.timeout.connect(lambda: done() and loop.quit())
+        timer.start(10)
+        QTimer.singleShot(timeout_ms, loop.quit)
+        loop.exec()
+        qapp.processEvents()
+    return run
+
+
+def _random_edits(m, rnd, steps: int = 1, *, views: bool = True, undo: bool = True, reveal: bool | None = None):
+    """스캔/수량 추가/셀 편집/조용한 편집을 섞은 무작위 조작 steps번
+
+    views면 정렬/필터 변경, undo면 되돌리기/다시 실행도 섞는다.
+    reveal은 apply_scans에 넘길 값 (None이면 무작위).
+    """
+    from PyQt6.QtCore import Qt
+
+    def upc():
+        return rnd.choice("ABC") + str(rnd.randint(1000, 1030))
+    for _ in range(steps):
+        n = m.rowCount()
+        r = rnd.random()
+        if views and r < 0.05:
+            m.sort(rnd.choice([-1, 0, 1, 2]), rnd.choice([Qt.SortOrder.AscendingOrder, Qt.SortOrder.DescendingOrder]))
+        elif views and r < 0.08:
+            m.set_filter(rnd.choice(["", "A", "B1", "10"]))
+        elif undo and 0.08 <= r < 0.2:
+            m.undo()
+        elif undo and 0.2 <= r < 0.28:
+            m.redo()
+        elif r < 0.6 or not n:
+            events = []
+            for _ in range(rnd.randint(1, 4)):
+                events.append(("upc", upc()))
+                events += [("qty", rnd.randint(1, 10)) for _ in range(rnd.randint(0, 2))]
+            m.apply_scans(events, rnd.randint(-1, n - 1), reveal=rnd.random() < 0.5 if reveal is None else reveal)
+        elif r < 0.75:
+            m.add_qty(rnd.randrange(n), rnd.randint(1, 10))
+        elif r < 0.9:
+            col = rnd.choice([0, 1])
+            m.setData(m.index(rnd.randrange(n), col), upc() if col == 0 else str(rnd.randint(0, 50)))
+        else:
+            row = rnd.randrange(n)
+            new = rnd.choice([None, upc()])
+            if new is None or not m._is_duplicate_upc(new, m.store_row(row)):
+                m.update_row_values_without_touch(row, new, rnd.choice([None, rnd.randint(0, 9)]))
+
+
+@pytest.fixture
+def mutate():
+    """mutate(model, rnd, steps, views=, undo=, reveal=) — 여러 테스트가 같이 쓰는 무작위 조작기"""
+    return _random_edits
+
+
+@pytest.fixture
+def snap():
+    """snap(store) — 비교용 (UPC, Qty, LastScannedAt) 열 리스트"""
+    return lambda store: (store.upc_column().tolist(), store.qty_column().tolist(), store.ts_column().tolist())
@@ -0,0 +1,46 @@
+from PyQt6.QtCore import QCoreApplication, QEvent, Qt
+from PyQt6.QtGui import QKeyEvent
+
+from controller.key_buffer import KeyBuffer
+
+
+def test_key_buffer_burst_detection():
+    buf = KeyBuffer(30)
+    text = "0123456789" * 10          # CAPACITY보다 길게 → 늘어나도 글자가 빠지지 않음
+    redraw = [buf.push(ch, i * 0.005) for i, ch in enumerate(text)]
+    assert buf.text() == text
+    assert redraw[0] and not any(redraw[1:])   # 5 ms 간격 → 첫 글자만 바로 그림
+    buf.clear()
+    assert buf.push("A", 10.0)                # 사람 속도 (간격이 김) → 매 키 그림
+    assert buf.push("B", 10.2)
+    assert buf.text() == "AB"
+
+
+def test_scanner_burst_through_window(qapp, wait, tmp_path):
+    """키 이벤트를 한꺼번에 큐에 쌓아(스캐너 연사) 모두 반영되는지, 화면 갱신이 스캔 수에 묶이는지"""
+    from ui_main import MainWindow
+    w = MainWindow(journal_path=str(tmp_path / "burst.journal"))
+    scans = [f"{4006381333931 + 7919 * i:013d}" for i in range(200)]
+    updates, drains = [0], [0]
+    w.buffer_display.textChanged.connect(lambda _: updates.__setitem__(0, updates[0] + 1))
+    drain = w.scan_queue.drain
+    w.scan_queue.drain = lambda: (drains.__setitem__(0, drains[0] + 1), drain())
+    try:
+        for upc in scans:
+            for ch in upc:
+                QCoreApplication.postEvent(w, QKeyEvent(
+                    QEvent.Type.KeyPress, Qt.Key.Key_0 + int(ch), Qt.KeyboardModifier.NoModifier, ch))
+            QCoreApplication.postEvent(w, QKeyEvent(
+                QEvent.Type.KeyPress, Qt.Key.Key_Return, Qt.KeyboardModifier.NoModifier, "\r"))
+        wait(lambda: len(w.model.dataframe()) >= len(scans) and not len(w.scan_queue))
+
+        df = w.model.dataframe()
+        assert df["UPC"].tolist() == scans    # 글자 누락/순서 뒤섞임 없음
+        assert w.buffer.text() == "" and w.buffer_display.text() == ""
+        # 연사 중에는 첫 글자 표시와 Enter 뒤 지우기뿐 (감지가 없으면 스캔당 14번)
+        assert updates[0] <= 2 * len(scans)
+        assert 1 <= drains[0] <= len(scans)
+    finally:
+        w.journal.close()
+        w.is_dirty = False
+        w.close()
@@ -0,0 +1,25 @@
+import numpy as np
+
+import cli
+from model.session import load_store, save_store
+from model.store import RowStore
+
+
+def test_overwrite_session_detaches_first(tmp_path, monkeypatch):
+    path = str(tmp_path / "count.upcs")
+    save_store(RowStore.from_columns(np.array(["AAAA1"], dtype=object), np.array([3]), np.array([0])), path)
+    scans = tmp_path / "scans.txt"
+    scans.write_text("AAAA1\n2\n", encoding="utf-8")   # 행 추가 없음 → 열이 계속 매핑을 빌려 씀
+
+    save_atomic = cli.save_atomic
+
+    def checked(export, store, out):
+        # 메모리 매핑된 파일을 교체하기 전에 열이 힙으로 옮겨져 있어야 한다 (Windows에서는 교체 실패)
+        assert store._qty.flags.owndata and store._ts.flags.owndata
+        return save_atomic(export, store, out)
+    monkeypatch.setattr(cli, "save_atomic", checked)
+
+    assert cli.main([path, str(scans)]) == 0
+    store = load_store(path)
+    assert store.upc_column().tolist() == ["AAAA1"]
+    assert store.qty_column().tolist() == [5]
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+from openpyxl import Workbook
+
+from model.io_excel import check_columns, export_excel, import_store
+from model.store import RowStore
+
+
+def _write(path, rows):
+    wb = Workbook()
+    ws = wb.active
+    ws.append(["UPC", "Qty", "LastScannedAt"])
+    for r in rows:
+        ws.append(r)
+    wb.save(path)
+
+
+@pytest.mark.parametrize("qty", [1e20, 2.0 ** 63, 10 ** 20, "99999999999999999999", "9223372036854775808"])
+def test_qty_out_of_int64_range_is_invalid(qty):
+    _, _, _, ok, _ = check_columns(["AAAA1"], [qty], [None])
+    assert not ok[0]
+
+
+def test_qty_int64_limits_are_kept():
+    top = np.iinfo(np.int64).max
+    _, _, qty, ok, _ = check_columns(["AAAA1", "BBBB2", "CCCC3"], [str(top), f"00{top}", " 12 "], [None] * 3)
+    assert ok.all()
+    assert qty.tolist() == [top, top, 12]
+
+
+def test_import_rejects_overflowing_qty(tmp_path):
+    path = tmp_path / "big_qty.xlsx"
+    _write(path, [["AAAA1", 1, None], ["BBBB2", 1e20, None]])
+    with pytest.raises(ValueError, match="Qty"):
+        import_store(str(path))
+
+
+def test_export_import_round_trip(tmp_path):
+    path = str(tmp_path / "round.xlsx")
+    ts = np.array([1_700_000_000_000_000_000, np.iinfo(np.int64).min], dtype=np.int64)
+    store = RowStore.from_columns(np.array(["AAAA1", "BBBB2"], dtype=object), np.array([3, 0]), ts)
+    export_excel(store, path)
+    back = import_store(path)
+    assert back.upc_column().tolist() == ["AAAA1", "BBBB2"]
+    assert back.qty_column().tolist() == [3, 0]
+    assert back.ts_column().tolist() == ts.tolist()
+
+
+@pytest.mark.parametrize("qty,expected", [
+    ("-3", -3), ("+4", 4), ("1.0", 1), ("1e3", 1000), (" 12 ", 12), (-3, -3), (2.0, 2),
+    ("-9223372036854775807", -(2 ** 63 - 1)),
+])
+def test_text_numbers_are_accepted_like_read_excel(qty, expected):
+    _, _, out, ok, _ = check_columns(["AAAA1"], [qty], [None])
+    assert ok[0] and out[0] == expected
+
+
+@pytest.mark.parametrize("qty", [True, False, np.bool_(True), "1.5", "abc", "", "nan", "inf", None])
+def test_bools_and_non_integers_are_rejected(qty):
+    _, _, _, ok, _ = check_columns(["AAAA1"], [qty], [None])
+    assert not ok[0]
+
+
+def test_import_rejects_bool_qty(tmp_path):
+    path = str(tmp_path / "b.xlsx")
+    _write(path, [["AAAA1", True, None], ["BBBB2", "-3", None], ["CCCC3", "1.0", None]])
+    with pytest.raises(ValueError, match="Qty"):
+        import_store(path)
+    _write(path, [["BBBB2", "-3", None], ["CCCC3", "1.0", None]])
+    assert import_store(path).qty_column().tolist() == [-3, 1]
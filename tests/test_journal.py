@@ -0,0 +1,104 @@
+import random
+
+import pytest
+
+from controller.io_worker import load_with_journal, write_autosave
+from model.dataframe_model import DataFrameModel
+from model.io_excel import export_excel, import_store
+from model.journal import Journal, replay
+from model.store import RowStore
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_replay_equals_live_model(qapp, tmp_path, mutate, snap, seed):
+    j = Journal(str(tmp_path / "scan.journal"))
+    j.start(None)
+    m = DataFrameModel()
+    m.set_undo_limit(random.Random(seed).choice([5, 10_000]))
+    m.set_journal(j)
+    try:
+        mutate(m, random.Random(seed), 250)
+        j.flush()
+        store = RowStore()
+        replay(j.path, store)
+        assert len(store) and snap(store) == snap(m.store())
+    finally:
+        j.close()
+
+
+@pytest.mark.parametrize("seed", range(4))
+@pytest.mark.parametrize("crash_before_compact", [False, True])
+def test_checkpoint_and_journal_recover_live_model(qapp, tmp_path, monkeypatch, mutate, snap, seed,
+                                                   crash_before_compact):
+    """저장 파일 + 자동 저장 체크포인트 + 저널 재생 == 죽기 직전의 모델"""
+    rnd = random.Random(seed)
+    base = str(tmp_path / "count.xlsx")
+    m = DataFrameModel()
+    mutate(m, rnd, 60)
+    export_excel(m.store(), base)
+
+    j = Journal(str(tmp_path / "scan.journal"))
+    m.set_store(import_store(base))
+    j.start(base)
+    m.set_journal(j)
+    try:
+        for i in range(3):
+            mutate(m, rnd, 80)
+            if crash_before_compact and i == 2:
+                # 체크포인트만 쓰고 저널 정리 전에 죽은 경우
+                monkeypatch.setattr(j, "compact", lambda *a, **k: True)
+            rows = m.take_dirty_rows()
+            write_autosave(base, m.rows_snapshot(rows), len(m.store()), j, j.position(), j.generation)
+        mutate(m, rnd, 80)
+        j.flush()
+        store, _ = load_with_journal(import_store, base, j.path)
+        assert snap(store) == snap(m.store())
+    finally:
+        j.close()
+
+
+def test_records_do_not_wait_for_fsync_or_compaction(tmp_path, monkeypatch):
+    import threading
+    import time
+
+    import model.journal as journal_mod
+    j = Journal(str(tmp_path / "scan.journal"), interval_ms=10_000)
+    j.start(None)
+    gate, entered = threading.Event(), threading.Event()
+    real_fsync = journal_mod.os.fsync
+
+    def slow_fsync(fd):   # 디스크가 느린 경우
+        entered.set()
+        gate.wait(5)
+        real_fsync(fd)
+    try:
+        j.record_append(0, "AAAA1", 1)
+        monkeypatch.setattr(journal_mod.os, "fsync", slow_fsync)
+        flusher = threading.Thread(target=j.flush)
+        flusher.start()
+        assert entered.wait(5)
+        t0 = time.perf_counter()
+        j.record_add(0, 2, 2)                 # fsync 중에도 바로 돌아온다
+        assert time.perf_counter() - t0 < 1
+        gate.set()
+        flusher.join()
+
+        # compact가 파일을 다시 쓰는 동안 들어온 레코드도 새 파일에 남는다
+        gate.clear()
+        entered.clear()
+        mark = j.position()
+        compactor = threading.Thread(target=j.compact, args=(None, 0))
+        compactor.start()
+        assert entered.wait(5)
+        j.record_add(0, 3, 3)
+        gate.set()
+        compactor.join()
+        monkeypatch.setattr(journal_mod.os, "fsync", real_fsync)
+        j.flush()
+        assert j.position() == mark + 1
+        store = RowStore()
+        replay(j.path, store)
+        assert store.qty_column().tolist() == [5]
+    finally:
+        gate.set()
+        j.close()
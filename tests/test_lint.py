@@ -0,0 +1,37 @@
+import datetime
+
+import pytest
+from openpyxl import Workbook
+
+import model.lint as lint
+from model.lint import BAD_QTY, BAD_UPC, BLANK, DUPLICATE, lint_workbook
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    wb = Workbook()
+    ws = wb.active
+    ws.append(["UPC", "Qty", "LastScannedAt"])
+    for r in [("AAAA1", 1, datetime.datetime(2024, 1, 1)), ("aaaa1 ", 2, None), ("AB", 3, None),
+              None, ("BBBB2", 1e20, None), ("CCCC3", "99999999999999999999", None), ("DDDD4", "x", None),
+              ("EEEE5", 2 ** 62, None), ("FFFF6", "9223372036854775807", None)]:
+        ws.append(list(r) if r else [])
+    path = str(tmp_path / "in.xlsx")
+    wb.save(path)
+    return path
+
+
+def test_qty_out_of_int64_range(workbook):
+    rep = lint_workbook(workbook, workers=1)
+    assert not rep.importable
+    qty = {r: m for r, rule, m in zip(rep.issue_row.tolist(), rep.issue_rule.tolist(), rep.messages) if rule == BAD_QTY}
+    assert qty == {6: "정수 범위(int64)를 벗어남", 7: "정수 범위(int64)를 벗어남", 8: "정수가 아님"}
+    assert rep.counts()[[BAD_UPC, DUPLICATE, BLANK]].tolist() == [1, 1, 1]
+
+
+def test_public_api_fallback_matches(workbook, monkeypatch):
+    fast = lint_workbook(workbook, workers=1)
+    monkeypatch.setattr(lint, "_split_supported", lambda: False)
+    plain = lint_workbook(workbook, workers=1)
+    assert plain.rows == fast.rows
+    assert plain.to_dataframe().equals(fast.to_dataframe())
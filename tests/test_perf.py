@@ -0,0 +1,25 @@
+from openpyxl import Workbook
+
+from utils import perf
+
+
+def test_timed_reaches_from_imports(tmp_path):
+    # variance/merge/cli는 `from .io_excel import import_store`로 가져간다
+    from model.variance import import_store
+    path = str(tmp_path / "a.xlsx")
+    wb = Workbook()
+    wb.active.append(["UPC", "Qty"])
+    wb.active.append(["AAAA1", 2])
+    wb.save(path)
+
+    hist = perf.histogram("io_excel.import_store")
+    before = hist.count
+    import_store(path)
+    assert hist.count == before   # 꺼져 있으면 기록하지 않음
+    perf.enable()
+    try:
+        assert len(import_store(path)) == 1
+    finally:
+        perf.disable()
+    assert hist.count == before + 1
+    assert "io_excel.import_store" in perf.summary()
@@ -0,0 +1,93 @@
+import socket
+import time
+
+import pytest
+
+from controller.scan_server import ScanServer, _UdpProtocol, is_loopback
+from model.dataframe_model import DataFrameModel
+
+
+def _recv_lines(sock, n, app, timeout=5.0):
+    """GUI 이벤트를 돌리며 응답 n줄을 받는다 (스캔 반영은 GUI 스레드에서 일어남)"""
+    sock.settimeout(0.02)
+    buf = b""
+    end = time.monotonic() + timeout
+    while buf.count(b"\n") < n and time.monotonic() < end:
+        app.processEvents()
+        try:
+            chunk = sock.recv(4096)
+        except socket.timeout:
+            continue
+        if not chunk:
+            break
+        buf += chunk
+    return buf.decode("utf-8").splitlines()
+
+
+@pytest.fixture
+def server(qapp):
+    servers = []
+
+    def make(**kw):
+        s = ScanServer(DataFrameModel(), udp_port=0, **kw)
+        s.start()
+        servers.append(s)
+        return s
+    yield make
+    for s in servers:
+        s.stop()
+
+
+def test_default_bind_is_loopback(server):
+    s = server()
+    assert is_loopback(s.address[0])
+    from ui_main import MainWindow
+    assert is_loopback(MainWindow.SCAN_SERVER_HOST)
+
+
+def test_tcp_token_required(qapp, server):
+    s = server(token="s3cret")
+    with socket.create_connection(s.address) as c:
+        c.sendall(b"AAAA1\n3\n")
+        assert _recv_lines(c, 1, qapp) == ["ERR AUTH"]
+    with socket.create_connection(s.address) as c:
+        c.sendall(b"AUTH s3cret\nAAAA1\n3\n")
+        assert _recv_lines(c, 3, qapp) == ["OK", "OK", "OK"]
+    df = s._model.dataframe()
+    assert df["UPC"].tolist() == ["AAAA1"] and df["Qty"].tolist() == [3]
+
+
+def test_udp_token_required(qapp, server):
+    s = server(token="s3cret")
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as u:
+        u.settimeout(2)
+        u.sendto(b"AUTH wrong\nAAAA1", s.udp_address)
+        assert u.recvfrom(100)[0] == b"ERR AUTH"
+    assert len(s._model.dataframe()) == 0
+
+
+def test_allow_list():
+    s = ScanServer(DataFrameModel(), allow=["192.168.10.0/24", "10.0.0.5"])
+    assert s._allowed(("192.168.10.77", 1234))
+    assert s._allowed(("10.0.0.5", 1))
+    assert s._allowed(("::ffff:10.0.0.5", 1, 0, 0))
+    assert s._allowed(("127.0.0.1", 1))
+    assert not s._allowed(("192.168.11.1", 1))
+    assert not s._allowed(("10.0.0.6", 1))
+    with pytest.raises(ValueError):
+        ScanServer(DataFrameModel(), allow=["not-an-ip"])
+
+
+def test_udp_clients_expire(monkeypatch):
+    s = ScanServer(DataFrameModel())
+    monkeypatch.setattr(ScanServer, "MAX_UDP_CLIENTS", 3)
+    p = _UdpProtocol(s)
+    for i in range(10):
+        p._client(("10.0.0.1", i))
+    assert [addr[1] for addr in p._clients] == [7, 8, 9]
+
+    # 조용한 시간이 UDP_IDLE_S를 넘으면 다음 수신 때 버린다
+    now = time.monotonic()
+    monkeypatch.setattr("controller.scan_server.time.monotonic", lambda: now + ScanServer.UDP_IDLE_S + 1)
+    p._client(("10.0.0.2", 1))
+    assert list(p._clients) == [("10.0.0.2", 1)]
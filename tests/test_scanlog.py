@@ -0,0 +1,94 @@
+import numpy as np
+
+from model.dataframe_model import DataFrameModel
+
+
+def _rollup(model) -> dict[str, tuple[int, int]]:
+    """UPC별 (스캔 수, 수량) — xlsx의 UPC Scans 시트와 같은 값"""
+    act = model.scan_log().activity()
+    upc = model.store().upc_column()
+    return {upc[r]: (s, q) for r, s, q in zip(act.rows.tolist(), act.row_scans.tolist(), act.row_qty.tolist())}
+
+
+def _assert_matches_qty(model):
+    store = model.store()
+    qty = dict(zip(store.upc_column().tolist(), store.qty_column().tolist()))
+    roll = _rollup(model)
+    assert {u: q for u, (_, q) in roll.items()} == {u: q for u, q in qty.items() if q}
+    act = model.scan_log().activity()
+    assert int(act.minute_qty.sum()) == sum(qty.values())   # Throughput 시트 합계도 같다
+    assert len(act) == sum(s for s, _ in roll.values())
+
+
+def test_undo_redo_keeps_rollups_in_step_with_qty(qapp):
+    m = DataFrameModel()
+    m.apply_scans([("upc", "AAAA1"), ("qty", 3), ("qty", 2)], -1)
+    m.apply_scans([("upc", "BBBB2"), ("qty", 5)], -1)
+    station = m.scan_log().station_id("10.0.0.9")
+    m.apply_scans([("upc", "AAAA1"), ("qty", 4)], -1, stations=[station, station])
+    _assert_matches_qty(m)
+    assert _rollup(m) == {"AAAA1": (3, 9), "BBBB2": (1, 5)}
+
+    m.undo()   # 네트워크 스캔 AAAA1 +4
+    assert _rollup(m) == {"AAAA1": (2, 5), "BBBB2": (1, 5)}
+    _assert_matches_qty(m)
+    act = m.scan_log().activity()
+    assert int(act.minute_qty[act.station == station].sum()) == 0   # 보정은 원래 스테이션으로
+
+    m.undo()   # BBBB2 추가 + 5 → 행이 사라짐
+    assert _rollup(m) == {"AAAA1": (2, 5)}
+    _assert_matches_qty(m)
+
+    m.redo()
+    m.redo()
+    assert _rollup(m) == {"AAAA1": (3, 9), "BBBB2": (1, 5)}
+    _assert_matches_qty(m)
+    # 기록은 지우지 않는다 — 원래 스캔 4건 + 보정 4건
+    assert len(m.scan_log()) == 8
+    assert np.count_nonzero(m.scan_log().events()[2] < 0) == 2
+
+
+def test_manual_edit_undo_is_not_logged(qapp):
+    m = DataFrameModel()
+    m.apply_scans([("upc", "AAAA1"), ("qty", 3)], -1)
+    assert m.setData(m.index(0, 1), 10)
+    assert m.store().qty_column().tolist() == [10]
+    m.undo()
+    assert m.store().qty_column().tolist() == [3]
+    assert _rollup(m) == {"AAAA1": (1, 3)}
+
+
+def test_station_ids_are_capped():
+    from model.scanlog import MAX_STATIONS, OTHER, ScanLog
+    log = ScanLog()
+    ids = [log.station_id(f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}") for i in range(40_000)]
+    assert max(ids) == MAX_STATIONS - 1
+    assert ids[-1] == OTHER and log.station_id("10.0.0.5") == ids[5]   # 이미 받은 번호는 그대로
+    log.extend(0, np.arange(len(ids)) % 7, np.ones(len(ids)), np.array(ids))
+    assert len(log.stations()) == MAX_STATIONS
+    assert int(log.activity().minute_scans.sum()) == len(ids)
+
+
+def test_station_is_the_host_not_the_port():
+    from controller.scan_server import _station_name
+    assert _station_name(("10.0.0.9", 40001)) == _station_name(("10.0.0.9", 40002)) == "10.0.0.9"
+
+
+def test_out_of_range_log_values_do_not_split_store_and_log(qapp):
+    import pytest
+    m = DataFrameModel()
+    changed = []
+    m.changed.connect(lambda: changed.append(1))
+    m.apply_scans([("upc", "ABCD1"), ("qty", 3_000_000_000)], -1)
+    assert m.store().qty_column().tolist() == [3_000_000_000]
+    assert changed and m.data(m.index(0, 1)) == "3000000000"
+    assert m.scan_log().events()[2].tolist() == [np.iinfo(np.int32).max]   # 잘라서 기록
+
+    m.add_qty(0, -5_000_000_000)
+    assert m.store().qty_column().tolist() == [-2_000_000_000]
+    assert m.can_undo() and len(m.scan_log()) == 2
+
+    # 잘못된 스테이션 번호는 아무것도 바꾸기 전에 거절
+    with pytest.raises(ValueError):
+        m.apply_scans([("upc", "WXYZ9"), ("qty", 1)], -1, stations=[0, 40_000])
+    assert len(m.store()) == 1 and not m.has_upc("WXYZ9")
@@ -0,0 +1,57 @@
+import random
+
+import pytest
+from PyQt6.QtCore import QModelIndex, Qt
+from PyQt6.QtTest import QAbstractItemModelTester
+
+import model.dataframe_model as dfm
+from model.dataframe_model import DataFrameModel
+
+_KEYS = (lambda st, r: str(st.upc(r)), lambda st, r: st.qty(r), lambda st, r: st.ts(r))
+
+
+def expected(m: DataFrameModel, col: int | None, desc: bool, text: str, prefix: bool) -> list[int]:
+    """정렬/필터 규칙을 그대로 적은 기대 순서 — 같은 키는 저장 순서, 내림차순은 전체를 뒤집음"""
+    st = m.store()
+    rows = [r for r in range(len(st))
+            if not text or (st.upc(r).upper().startswith(text) if prefix else text in st.upc(r).upper())]
+    if col is not None:
+        rows.sort(key=lambda r: (_KEYS[col](st, r), r))
+        if desc:
+            rows.reverse()
+    return rows
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_view_permutation_matches_rules(qapp, monkeypatch, mutate, seed):
+    monkeypatch.setattr(dfm, "FETCH_ROWS", 7)   # 지연 노출(fetchMore)도 함께
+    rnd = random.Random(seed)
+    m = DataFrameModel()
+    QAbstractItemModelTester(m, QAbstractItemModelTester.FailureReportingMode.Fatal)
+    col, desc, text, prefix = None, False, "", False
+    for step in range(250):
+        r = rnd.random()
+        if r < 0.06:
+            c = rnd.choice([-1, 0, 1, 2])
+            order = rnd.choice([Qt.SortOrder.AscendingOrder, Qt.SortOrder.DescendingOrder])
+            m.sort(c, order)
+            col = c if c >= 0 else None
+            desc = col is not None and order == Qt.SortOrder.DescendingOrder
+        elif r < 0.1:
+            text, prefix = rnd.choice(["", "1", "A10", "b1", "5"]), rnd.random() < 0.5
+            m.set_filter(text, prefix)
+            text = text.upper()
+        else:
+            # 정렬/필터는 위에서만 바꾼다 (reveal이면 필터가 풀릴 수 있음)
+            mutate(m, rnd, 1, views=False, reveal=False)
+
+        while m.canFetchMore(QModelIndex()):
+            m.fetchMore(QModelIndex())
+        exp = expected(m, col, desc, text, prefix)
+        assert [m.store_row(v) for v in range(m.rowCount())] == exp, (seed, step)
+        assert [m.data(m.index(v, 1)) for v in range(len(exp))] == [str(m.store().qty(s)) for s in exp]
+        # 역방향(저장 행 → 보기 행)도 같은 순열
+        for v, s in enumerate(exp):
+            assert m.view_row(s) == v
+        hidden = set(range(len(m.store()))) - set(exp)
+        assert all(m.view_row(s) == -1 for s in hidden)
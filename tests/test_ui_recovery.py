@@ -0,0 +1,44 @@
+from PyQt6.QtWidgets import QMessageBox
+
+from model.dataframe_model import DataFrameModel
+from model.journal import Journal
+
+
+def _crashed_journal(path: str):
+    """저장하지 않고 죽은 세션: AAAA1 +3 이 저널에만 남아 있다"""
+    j = Journal(path)
+    j.start(None)
+    m = DataFrameModel()
+    m.set_journal(j)
+    m.apply_scans([("upc", "AAAA1"), ("qty", 3)], -1)
+    j.flush()
+
+
+def _type(w, text: str):
+    for ch in text:
+        w.buffer.push(ch, 0.0)
+    w.process_buffer()
+
+
+def test_scans_during_recovery_are_replayed(qapp, wait, tmp_path, monkeypatch):
+    from ui_main import MainWindow
+    journal = str(tmp_path / "scan.journal")
+    _crashed_journal(journal)
+    monkeypatch.setattr(QMessageBox, "question", staticmethod(lambda *a, **k: QMessageBox.StandardButton.Yes))
+
+    w = MainWindow(journal_path=journal)
+    w.start_journal()
+    assert w._io_kind == "recover"
+    _type(w, "BBBB2")   # 복구 작업이 끝나기 전에 들어온 스캔
+    _type(w, "2")
+    assert w._pending_scans == ["BBBB2", "2"]
+
+    wait(lambda: w._io_job is None and not len(w.scan_queue))
+    store = w.model.store()
+    assert store.upc_column().tolist() == ["AAAA1", "BBBB2"]
+    assert store.qty_column().tolist() == [3, 2]
+    assert w._pending_scans == []
+
+    w.journal.close()
+    w.is_dirty = False
+    w.close()
@@ -0,0 +1,54 @@
+import random
+
+import pytest
+
+from model.dataframe_model import DataFrameModel
+
+
+def assert_index(m: DataFrameModel):
+    for upc in m.store().upc_column().tolist():
+        assert m.has_upc(upc)
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_undo_then_redo_restores_store(qapp, mutate, snap, seed):
+    rnd = random.Random(seed)
+    m = DataFrameModel()
+    start = snap(m.store())
+    for _ in range(40):
+        mutate(m, rnd, rnd.randint(1, 6), undo=False)
+        before = snap(m.store())
+        k, want = 0, rnd.randint(1, 8)
+        while k < want and m.can_undo():
+            m.undo()
+            k += 1
+        for _ in range(k):
+            m.redo()
+        assert snap(m.store()) == before
+        assert_index(m)
+
+    # 끝까지 되돌리면 처음 상태, 끝까지 다시 실행하면 마지막 상태
+    end = snap(m.store())
+    while m.can_undo():
+        m.undo()
+    assert snap(m.store()) == start
+    while m.can_redo():
+        m.redo()
+    assert snap(m.store()) == end
+    assert_index(m)
+
+
+def test_redo_after_limit_overflow(qapp, mutate, snap):
+    rnd = random.Random(99)
+    m = DataFrameModel()
+    m.set_undo_limit(8)   # 오래된 스텝은 버려진다 — 남은 만큼만 왕복
+    mutate(m, rnd, 200, undo=False)
+    end = snap(m.store())
+    steps = 0
+    while m.can_undo():
+        m.undo()
+        steps += 1
+    assert 0 < steps <= 8
+    while m.can_redo():
+        m.redo()
+    assert snap(m.store()) == end